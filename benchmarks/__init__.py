@@ -0,0 +1,12 @@
+"""
+Benchmarks for piso, run with airspeed velocity (https://asv.readthedocs.io).
+
+From the root of the repository::
+
+    asv run --python=same --quick         # run each benchmark once against the working tree
+    asv continuous master HEAD            # compare the current commit against master
+    asv run --bench "SingleArray.time_union"
+
+Parameters which lead to long runs, such as n = 10**7, can be skipped with
+``--attribute`` or by selecting benchmarks with ``--bench``.
+"""
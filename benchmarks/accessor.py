@@ -0,0 +1,74 @@
+import piso
+
+from .common import CLOSED, SIZES, make_interval_array, make_points
+
+piso.register_accessors()
+
+
+class ArrayAccessor:
+    params = [SIZES[:-1], CLOSED, [True, False]]
+    param_names = ["n", "closed", "interval_index"]
+    timeout = 300
+
+    def setup(self, n, closed, interval_index):
+        self.ia = make_interval_array(n, 10, closed, interval_index=interval_index)
+        self.other = make_interval_array(n, 10, closed, seed=1)
+        self.x = make_points(min(n, 1000), n)
+
+    def time_union(self, n, closed, interval_index):
+        self.ia.piso.union()
+
+    def time_union_other(self, n, closed, interval_index):
+        self.ia.piso.union(self.other)
+
+    def time_intersection(self, n, closed, interval_index):
+        self.ia.piso.intersection(self.other)
+
+    def time_difference(self, n, closed, interval_index):
+        self.ia.piso.difference(self.other)
+
+    def time_symmetric_difference(self, n, closed, interval_index):
+        self.ia.piso.symmetric_difference(self.other)
+
+    def time_isdisjoint(self, n, closed, interval_index):
+        self.ia.piso.isdisjoint()
+
+    def time_issuperset(self, n, closed, interval_index):
+        self.ia.piso.issuperset(self.other)
+
+    def time_issubset(self, n, closed, interval_index):
+        self.ia.piso.issubset(self.other)
+
+    def time_coverage(self, n, closed, interval_index):
+        self.ia.piso.coverage()
+
+    def time_complement(self, n, closed, interval_index):
+        self.ia.piso.complement()
+
+    def time_contains(self, n, closed, interval_index):
+        self.ia.piso.contains(self.x, result="points")
+
+    def time_bridge(self, n, closed, interval_index):
+        self.ia.piso.bridge(5)
+
+    def time_repeated_calls(self, n, closed, interval_index):
+        # memoized for IntervalIndex
+        for _ in range(3):
+            self.ia.piso.coverage()
+            self.ia.piso.complement()
+            self.ia.piso.union()
+
+
+class ArrayAccessorQuadratic:
+    params = [SIZES[:3], CLOSED]
+    param_names = ["n", "closed"]
+
+    def setup(self, n, closed):
+        self.ia = make_interval_array(n, 10, closed)
+        self.x = make_points(n, n)
+
+    def time_split(self, n, closed):
+        self.ia.piso.split(self.x)
+
+    def time_adjacency_matrix(self, n, closed):
+        self.ia.piso.adjacency_matrix()
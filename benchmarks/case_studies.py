@@ -0,0 +1,39 @@
+import piso
+
+from .common import CLOSED, load_fixture
+
+
+class Fixtures:
+    """
+    Benchmarks using the case study data in docs/data, repeated to the required size.
+    """
+
+    params = [
+        [10**2, 10**4, 10**6],
+        CLOSED,
+        ["asset_maintenance.csv", "calendar.csv", "maintenance_windows.csv"],
+    ]
+    param_names = ["n", "closed", "fixture"]
+    timeout = 300
+
+    def setup(self, n, closed, fixture):
+        self.ia = load_fixture(fixture, n, closed)
+        self.other = load_fixture("maintenance_windows.csv", n, closed)
+
+    def time_union(self, n, closed, fixture):
+        piso.union(self.ia)
+
+    def time_intersection(self, n, closed, fixture):
+        piso.intersection(self.ia, self.other)
+
+    def time_difference(self, n, closed, fixture):
+        piso.difference(self.ia, self.other)
+
+    def time_coverage(self, n, closed, fixture):
+        piso.coverage(self.ia)
+
+    def time_complement(self, n, closed, fixture):
+        piso.complement(self.ia)
+
+    def peakmem_complement(self, n, closed, fixture):
+        piso.complement(self.ia)
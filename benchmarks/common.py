@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from piso.testing import generators
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+# for operations which allocate an array proportional to the product of the sizes of the inputs
+QUADRATIC_SIZES = [10**2, 10**3, 10**4]
+# mean number of intervals overlapping a point
+DENSITIES = [0.5, 10]
+CLOSED = ["left", "right"]
+DTYPES = ["numeric", "datetime", "timedelta"]
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs", "data")
+
+
+# the generators measure time in hours from this start, for datetime and timedelta dtypes
+_GENERATOR_DTYPES = {
+    "numeric": "float",
+    "datetime": "datetime",
+    "timedelta": "timedelta",
+}
+_START = pd.Timestamp("2021-01-01")
+
+
+def make_interval_array(
+    n, density=0.5, closed="right", dtype="numeric", seed=0, interval_index=False
+):
+    """
+    Intervals with Poisson arrivals, at a rate of one per unit, and heavy tailed durations chosen
+    so that the mean number of intervals overlapping a point is *density*.
+    """
+    return generators.poisson_intervals(
+        n,
+        mean_duration=density,
+        dtype=_GENERATOR_DTYPES[dtype],
+        closed=closed,
+        return_type=pd.IntervalIndex if interval_index else pd.arrays.IntervalArray,
+        start=_START,
+        seed=seed,
+    )
+
+
+def make_disjoint_interval_array(
+    n, closed="right", dtype="numeric", seed=0, interval_index=False
+):
+    """
+    Sorted, disjoint intervals with gaps between them.
+    """
+    return generators.tiling_intervals(
+        n,
+        gap_probability=0.5,
+        dtype=_GENERATOR_DTYPES[dtype],
+        closed=closed,
+        return_type=pd.IntervalIndex if interval_index else pd.arrays.IntervalArray,
+        start=_START,
+        seed=seed,
+    )
+
+
+def make_points(n, n_intervals, dtype="numeric", seed=0):
+    """
+    Points uniformly distributed over the span of intervals created by make_interval_array.
+    """
+    rng = np.random.default_rng(seed)
+    values = np.sort(rng.uniform(0, n_intervals, n))
+    if dtype == "datetime":
+        return _START + pd.to_timedelta(values, unit="h")
+    if dtype == "timedelta":
+        return pd.to_timedelta(values, unit="h")
+    return values
+
+
+def load_fixture(name, n, closed="right"):
+    """
+    Loads intervals from a csv file in docs/data, repeated and shifted in time until there are *n* intervals.
+    """
+    data = pd.read_csv(
+        os.path.join(DATA_DIR, name), parse_dates=["start", "end"], dayfirst=True
+    )
+    span = data["end"].max() - data["start"].min()
+    repeats = int(np.ceil(n / len(data)))
+    offsets = np.repeat(np.arange(repeats), len(data))[:n] * span
+    starts = np.tile(data["start"].values, repeats)[:n] + offsets
+    ends = np.tile(data["end"].values, repeats)[:n] + offsets
+    return pd.arrays.IntervalArray.from_arrays(starts, ends, closed=closed)
@@ -0,0 +1,27 @@
+import piso
+
+from .common import CLOSED, DTYPES, QUADRATIC_SIZES, make_interval_array
+
+
+class AdjacencyMatrix:
+    params = [QUADRATIC_SIZES, CLOSED, DTYPES, ["intersect", "disjoint"]]
+    param_names = ["n", "closed", "dtype", "edges"]
+
+    def setup(self, n, closed, dtype, edges):
+        self.ia = make_interval_array(n, 10, closed, dtype)
+        self.arrays = [
+            make_interval_array(n // 10, 10, closed, dtype, seed=seed)
+            for seed in range(10)
+        ]
+
+    def time_adjacency_matrix(self, n, closed, dtype, edges):
+        piso.adjacency_matrix(self.ia, edges=edges, include_index=False)
+
+    def peakmem_adjacency_matrix(self, n, closed, dtype, edges):
+        piso.adjacency_matrix(self.ia, edges=edges, include_index=False)
+
+    def time_adjacency_matrix_frame(self, n, closed, dtype, edges):
+        piso.adjacency_matrix(self.ia, edges=edges)
+
+    def time_adjacency_matrix_sets(self, n, closed, dtype, edges):
+        piso.adjacency_matrix(*self.arrays, edges=edges)
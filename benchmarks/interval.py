@@ -0,0 +1,40 @@
+import pandas as pd
+
+import piso.interval
+
+from .common import CLOSED
+
+
+class ScalarOperations:
+    params = [CLOSED, ["overlapping", "disjoint", "nested"]]
+    param_names = ["closed", "relation"]
+
+    def setup(self, closed, relation):
+        self.interval1 = pd.Interval(0, 4, closed=closed)
+        self.interval2 = {
+            "overlapping": pd.Interval(2, 6, closed=closed),
+            "disjoint": pd.Interval(5, 6, closed=closed),
+            "nested": pd.Interval(1, 2, closed=closed),
+        }[relation]
+        self.intervals = [self.interval2] * 100
+
+    def time_union(self, closed, relation):
+        piso.interval.union(self.interval1, self.interval2)
+
+    def time_intersection(self, closed, relation):
+        piso.interval.intersection(self.interval1, self.interval2)
+
+    def time_difference(self, closed, relation):
+        piso.interval.difference(self.interval1, self.interval2)
+
+    def time_symmetric_difference(self, closed, relation):
+        piso.interval.symmetric_difference(self.interval1, self.interval2)
+
+    def time_intersection_no_squeeze(self, closed, relation):
+        piso.interval.intersection(self.interval1, self.interval2, squeeze=False)
+
+    def time_issuperset(self, closed, relation):
+        piso.interval.issuperset(self.interval1, *self.intervals)
+
+    def time_issubset(self, closed, relation):
+        piso.interval.issubset(self.interval1, *self.intervals)
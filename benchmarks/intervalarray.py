@@ -0,0 +1,234 @@
+import pandas as pd
+
+import piso
+from piso.testing import generators
+
+from .common import (
+    CLOSED,
+    DENSITIES,
+    DTYPES,
+    QUADRATIC_SIZES,
+    SIZES,
+    make_disjoint_interval_array,
+    make_interval_array,
+    make_points,
+)
+
+
+class SingleArray:
+    params = [SIZES, DENSITIES, CLOSED, DTYPES]
+    param_names = ["n", "density", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, density, closed, dtype):
+        self.ia = make_interval_array(n, density, closed, dtype)
+
+    def time_union(self, n, density, closed, dtype):
+        piso.union(self.ia)
+
+    def peakmem_union(self, n, density, closed, dtype):
+        piso.union(self.ia)
+
+    def time_intersection(self, n, density, closed, dtype):
+        piso.intersection(self.ia, min_overlaps=2)
+
+    def peakmem_intersection(self, n, density, closed, dtype):
+        piso.intersection(self.ia, min_overlaps=2)
+
+    def time_symmetric_difference(self, n, density, closed, dtype):
+        piso.symmetric_difference(self.ia)
+
+    def peakmem_symmetric_difference(self, n, density, closed, dtype):
+        piso.symmetric_difference(self.ia)
+
+    def time_isdisjoint(self, n, density, closed, dtype):
+        piso.isdisjoint(self.ia)
+
+    def peakmem_isdisjoint(self, n, density, closed, dtype):
+        piso.isdisjoint(self.ia)
+
+    def time_coverage(self, n, density, closed, dtype):
+        piso.coverage(self.ia)
+
+    def peakmem_coverage(self, n, density, closed, dtype):
+        piso.coverage(self.ia)
+
+    def time_complement(self, n, density, closed, dtype):
+        piso.complement(self.ia)
+
+    def peakmem_complement(self, n, density, closed, dtype):
+        piso.complement(self.ia)
+
+
+class Bridge:
+    params = [SIZES, CLOSED, DTYPES]
+    param_names = ["n", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, closed, dtype):
+        # sparse, so that the union contains gaps to bridge
+        self.ia = make_interval_array(n, 0.5, closed, dtype)
+        self.threshold = self.ia[0].length
+
+    def time_bridge(self, n, closed, dtype):
+        piso.bridge(self.ia, self.threshold)
+
+    def peakmem_bridge(self, n, closed, dtype):
+        piso.bridge(self.ia, self.threshold)
+
+
+class MultipleArrays:
+    params = [SIZES, DENSITIES, CLOSED, DTYPES]
+    param_names = ["n", "density", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, density, closed, dtype):
+        self.arrays = [
+            make_interval_array(n, density, closed, dtype, seed=seed)
+            for seed in range(3)
+        ]
+
+    def time_union(self, n, density, closed, dtype):
+        piso.union(*self.arrays)
+
+    def peakmem_union(self, n, density, closed, dtype):
+        piso.union(*self.arrays)
+
+    def time_intersection(self, n, density, closed, dtype):
+        piso.intersection(*self.arrays)
+
+    def peakmem_intersection(self, n, density, closed, dtype):
+        piso.intersection(*self.arrays)
+
+    def time_difference(self, n, density, closed, dtype):
+        piso.difference(*self.arrays)
+
+    def peakmem_difference(self, n, density, closed, dtype):
+        piso.difference(*self.arrays)
+
+    def time_symmetric_difference(self, n, density, closed, dtype):
+        piso.symmetric_difference(*self.arrays)
+
+    def peakmem_symmetric_difference(self, n, density, closed, dtype):
+        piso.symmetric_difference(*self.arrays)
+
+    def time_isdisjoint(self, n, density, closed, dtype):
+        piso.isdisjoint(*self.arrays)
+
+    def peakmem_isdisjoint(self, n, density, closed, dtype):
+        piso.isdisjoint(*self.arrays)
+
+    def time_issuperset(self, n, density, closed, dtype):
+        piso.issuperset(*self.arrays)
+
+    def peakmem_issuperset(self, n, density, closed, dtype):
+        piso.issuperset(*self.arrays)
+
+    def time_issubset(self, n, density, closed, dtype):
+        piso.issubset(*self.arrays)
+
+    def peakmem_issubset(self, n, density, closed, dtype):
+        piso.issubset(*self.arrays)
+
+
+class CoverageDomain:
+    params = [SIZES, CLOSED, DTYPES]
+    param_names = ["n", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, closed, dtype):
+        self.ia = make_interval_array(n, 10, closed, dtype)
+        self.bins = make_disjoint_interval_array(
+            max(n // 100, 1), closed, dtype, interval_index=True
+        )
+
+    def time_coverage_domain(self, n, closed, dtype):
+        piso.coverage(self.ia, self.bins)
+
+    def time_coverage_bins(self, n, closed, dtype):
+        piso.coverage(self.ia, self.bins, bins=True)
+
+    def peakmem_coverage_bins(self, n, closed, dtype):
+        piso.coverage(self.ia, self.bins, bins=True)
+
+    def time_complement_domain(self, n, closed, dtype):
+        piso.complement(self.ia, self.bins)
+
+
+class Contains:
+    params = [QUADRATIC_SIZES, CLOSED, DTYPES, ["cartesian", "points", "intervals"]]
+    param_names = ["n", "closed", "dtype", "result"]
+
+    def setup(self, n, closed, dtype, result):
+        self.ia = make_interval_array(n, 10, closed, dtype)
+        self.x = make_points(n, n, dtype)
+
+    def time_contains(self, n, closed, dtype, result):
+        piso.contains(self.ia, self.x, result=result)
+
+    def peakmem_contains(self, n, closed, dtype, result):
+        piso.contains(self.ia, self.x, result=result)
+
+    def time_contains_no_index(self, n, closed, dtype, result):
+        piso.contains(self.ia, self.x, include_index=False, result=result)
+
+
+class Split:
+    params = [QUADRATIC_SIZES, CLOSED, DTYPES]
+    param_names = ["n", "closed", "dtype"]
+
+    def setup(self, n, closed, dtype):
+        self.ia = make_interval_array(n, 10, closed, dtype)
+        self.x = make_points(n, n, dtype)
+
+    def time_split(self, n, closed, dtype):
+        piso.split(self.ia, self.x)
+
+    def peakmem_split(self, n, closed, dtype):
+        piso.split(self.ia, self.x)
+
+
+class IntervalIndexInput:
+    params = [SIZES, CLOSED]
+    param_names = ["n", "closed"]
+    timeout = 300
+
+    def setup(self, n, closed):
+        self.ii = make_interval_array(n, 10, closed, interval_index=True)
+
+    def time_union_return_index(self, n, closed):
+        piso.union(self.ii)
+
+    def time_union_return_array(self, n, closed):
+        piso.union(self.ii, return_type=pd.arrays.IntervalArray)
+
+
+class Workloads:
+    params = [
+        SIZES[:-1],
+        ["poisson", "tiling", "nested", "bursts"],
+        [1.0, 0.0],
+    ]
+    param_names = ["n", "workload", "sortedness"]
+    timeout = 300
+
+    def setup(self, n, workload, sortedness):
+        make = {
+            "poisson": generators.poisson_intervals,
+            "tiling": generators.tiling_intervals,
+            "nested": generators.nested_intervals,
+            "bursts": generators.burst_intervals,
+        }[workload]
+        self.ia = make(n, sortedness=sortedness, seed=0)
+
+    def time_union(self, n, workload, sortedness):
+        piso.union(self.ia)
+
+    def time_intersection(self, n, workload, sortedness):
+        piso.intersection(self.ia, min_overlaps=2)
+
+    def time_coverage(self, n, workload, sortedness):
+        piso.coverage(self.ia)
+
+    def time_isdisjoint(self, n, workload, sortedness):
+        piso.isdisjoint(self.ia)
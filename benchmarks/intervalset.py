@@ -0,0 +1,67 @@
+import piso
+import piso.expr
+
+from .common import CLOSED, DENSITIES, DTYPES, SIZES, make_interval_array
+
+
+class IntervalSet:
+    params = [SIZES, DENSITIES, CLOSED, DTYPES]
+    param_names = ["n", "density", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, density, closed, dtype):
+        self.arrays = [
+            make_interval_array(n, density, closed, dtype, seed=seed)
+            for seed in range(4)
+        ]
+        self.sets = [piso.IntervalSet.from_intervals(ia) for ia in self.arrays]
+        self.normalized = [interval_set.normalize() for interval_set in self.sets]
+
+    def time_from_intervals(self, n, density, closed, dtype):
+        piso.IntervalSet.from_intervals(self.arrays[0]).normalize()
+
+    def time_union(self, n, density, closed, dtype):
+        self.normalized[0] | self.normalized[1]
+
+    def peakmem_union(self, n, density, closed, dtype):
+        self.normalized[0] | self.normalized[1]
+
+    def time_difference(self, n, density, closed, dtype):
+        self.normalized[0] - self.normalized[1]
+
+    def time_to_array(self, n, density, closed, dtype):
+        self.normalized[0].to_array()
+
+    def time_expression(self, n, density, closed, dtype):
+        a, b, c, d = piso.expr.operands(*self.arrays)
+        ((a & b) - (c | d)).evaluate()
+
+    def peakmem_expression(self, n, density, closed, dtype):
+        a, b, c, d = piso.expr.operands(*self.arrays)
+        ((a & b) - (c | d)).evaluate()
+
+    def time_eager_equivalent(self, n, density, closed, dtype):
+        piso.difference(
+            piso.intersection(self.arrays[0], self.arrays[1]),
+            piso.union(self.arrays[2], self.arrays[3]),
+        )
+
+
+class Cache:
+    params = [SIZES[:-1], [0, 2**30]]
+    param_names = ["n", "cache_size"]
+    timeout = 300
+
+    def setup(self, n, cache_size):
+        self.ia = make_interval_array(n, 10)
+        piso.set_option("cache.size", cache_size)
+        piso.coverage(self.ia)
+
+    def teardown(self, n, cache_size):
+        piso.reset_option("cache.size")
+        piso.clear_cache()
+
+    def time_repeated_conversions(self, n, cache_size):
+        piso.coverage(self.ia)
+        piso.complement(self.ia)
+        piso.bridge(self.ia, 5)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+import piso
+
+from .common import CLOSED, DTYPES, SIZES, make_disjoint_interval_array, make_points
+
+
+def _make_frame(n, closed, dtype, seed):
+    index = make_disjoint_interval_array(
+        n, closed, dtype, seed=seed, interval_index=True
+    )
+    return pd.DataFrame({f"col{seed}": np.arange(n)}, index=index)
+
+
+class Lookup:
+    params = [SIZES, CLOSED, DTYPES]
+    param_names = ["n", "closed", "dtype"]
+    timeout = 300
+
+    def setup(self, n, closed, dtype):
+        self.df = _make_frame(n, closed, dtype, seed=0)
+        self.x = make_points(n, n, dtype)
+
+    def time_lookup(self, n, closed, dtype):
+        piso.lookup(self.df, self.x)
+
+    def peakmem_lookup(self, n, closed, dtype):
+        piso.lookup(self.df, self.x)
+
+
+class Join:
+    params = [SIZES[:-1], CLOSED, DTYPES, ["left", "right", "inner", "outer"]]
+    param_names = ["n", "closed", "dtype", "how"]
+    timeout = 300
+
+    def setup(self, n, closed, dtype, how):
+        self.frames = [_make_frame(n, closed, dtype, seed) for seed in range(3)]
+
+    def time_join(self, n, closed, dtype, how):
+        piso.join(*self.frames, how=how)
+
+    def peakmem_join(self, n, closed, dtype, how):
+        piso.join(*self.frames, how=how)
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+import piso
+import piso.parallel
+
+from .common import SIZES, make_interval_array
+
+
+class MapGroups:
+    params = [SIZES[1:-1], [10, 1000], [1, 4]]
+    param_names = ["n", "n_groups", "n_threads"]
+    timeout = 300
+
+    def setup(self, n, n_groups, n_threads):
+        index = make_interval_array(n, 10, interval_index=True)
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({"group": rng.integers(0, n_groups, n)}, index=index)
+
+    def time_union(self, n, n_groups, n_threads):
+        piso.parallel.map_groups(self.df, piso.union, by="group", n_threads=n_threads)
+
+    def time_coverage(self, n, n_groups, n_threads):
+        piso.parallel.map_groups(
+            self.df, piso.coverage, by="group", n_threads=n_threads
+        )
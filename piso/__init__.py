@@ -1,9 +1,16 @@
+from piso._cache import cache_info, clear_cache
+from piso._config import get_option, option_context, reset_option, set_option
+from piso._exceptions import DenseAllocationError
+from piso._profiling import Profile, ProfileRecord, profile
+from piso.coverageindex import CoverageIndex
 from piso.graph import adjacency_matrix
+from piso.incremental import IncrementalUnion
 from piso.intervalarray import (
     bridge,
     complement,
     contains,
     coverage,
+    depth,
     difference,
     intersection,
     isdisjoint,
@@ -13,7 +20,10 @@ from piso.intervalarray import (
     symmetric_difference,
     union,
 )
+from piso.intervalset import IntervalSet
 from piso.ndframe import join, lookup
+from piso.overlap import iou, overlap_length, overlap_pairs
+from piso.rolling import RollingCoverage, rolling_coverage
 
 
 def register_accessors():
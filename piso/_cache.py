@@ -0,0 +1,128 @@
+import hashlib
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+from piso import _config
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "entries", "size", "max_size"])
+
+
+class _ContentCache:
+    """
+    A least-recently-used cache, bounded by the approximate size in bytes of its values,
+    and keyed by a hash of the content of numpy arrays.  Inputs are immutable, so entries
+    never need to be invalidated.
+    """
+
+    def __init__(self, max_size=0):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(*arrays, extra=()):
+        hasher = hashlib.blake2b(digest_size=16)
+        for arr in arrays:
+            hasher.update(str(arr.dtype).encode())
+            hasher.update(str(arr.shape).encode())
+            hasher.update(arr.tobytes())
+        return (hasher.digest(), *extra)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key, value, size):
+        with self._lock:
+            if size > self.max_size or key in self._data:
+                return
+            self._data[key] = (value, size)
+            self._size += size
+            self._evict()
+
+    def resize(self, max_size):
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_size:
+            _, (_, size) = self._data.popitem(last=False)
+            self._size -= size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, len(self._data), self._size, self.max_size
+            )
+
+
+_stairs_cache = _ContentCache()
+
+_config._register_option(
+    "cache.size",
+    0,
+    validator=_config._validate_nonnegative_int,
+    callback=_stairs_cache.resize,
+)
+
+
+def cache_info():
+    """
+    Returns statistics for the cache of conversions from interval arrays to step functions.
+
+    The cache is enabled by setting the ``cache.size`` option, with :func:`piso.set_option`,
+    to a positive number of bytes.
+
+    Returns
+    -------
+    CacheInfo
+        A named tuple with fields *hits*, *misses*, *entries*, *size* and *max_size*.
+        Sizes are in bytes.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+    >>> piso.set_option("cache.size", 2**28)
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> piso.coverage(arr)
+    0.75
+
+    >>> piso.complement(arr)
+    <IntervalArray>
+    [(5.0, 7.0]]
+    Length: 1, closed: right, dtype: interval[float64]
+
+    >>> piso.cache_info()
+    CacheInfo(hits=1, misses=1, entries=1, size=144, max_size=268435456)
+    """
+    return _stairs_cache.info()
+
+
+def clear_cache():
+    """
+    Empties the cache of conversions from interval arrays to step functions, and resets its statistics.
+
+    Returns
+    -------
+    None
+    """
+    _stairs_cache.clear()
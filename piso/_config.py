@@ -0,0 +1,147 @@
+from collections import namedtuple
+from contextlib import contextmanager
+
+_Option = namedtuple("_Option", ["default", "validator", "callback"])
+
+_registered_options = {}
+_option_values = {}
+
+
+def _register_option(key, default, validator=None, callback=None):
+    assert key not in _registered_options
+    _registered_options[key] = _Option(default, validator, callback)
+    _option_values[key] = default
+
+
+def _get_registered_option(key):
+    if key not in _registered_options:
+        raise KeyError(f"No such option: {repr(key)}")
+    return _registered_options[key]
+
+
+def _validate_nonnegative_int(value):
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"Value must be a non-negative integer.  Found {repr(value)}.")
+
+
+def _validate_bool(value):
+    if not isinstance(value, bool):
+        raise ValueError(f"Value must be a boolean.  Found {repr(value)}.")
+
+
+def _validate_nonnegative_int_or_none(value):
+    if value is not None:
+        _validate_nonnegative_int(value)
+
+
+def get_option(key):
+    """
+    Returns the value of an option.
+
+    Parameters
+    ----------
+    key : str
+        The name of the option.  See :func:`piso.set_option` for available options.
+
+    Returns
+    -------
+    object
+    """
+    _get_registered_option(key)
+    return _option_values[key]
+
+
+def set_option(key, value):
+    """
+    Sets the value of an option.
+
+    Available options are:
+
+    - ``cache.size`` : int
+        The maximum approximate size, in bytes, of the cache for conversions of interval arrays
+        to step functions.  Zero disables the cache.  Default 0.
+    - ``max_dense_bytes`` : int or None
+        The maximum estimated size, in bytes, of dense arrays allocated by :func:`piso.contains`,
+        :func:`piso.split` and :func:`piso.adjacency_matrix`, whose sizes are the product of
+        the lengths of their inputs.  If exceeded, :func:`piso.contains` (with *result* other than
+        "cartesian") and :func:`piso.split` switch to an implementation based on sorting, and
+        otherwise a :class:`piso.DenseAllocationError` is raised.  None means no limit.  Default None.
+    - ``validate`` : bool
+        If True, interval arrays are checked for intervals of zero length before set operations,
+        which are not supported.  The check can be skipped for a single call with the *validate*
+        parameter of the set operation.  Default True.
+    - ``profile`` : bool
+        If True, the internal stages of piso functions are timed, and each
+        :class:`piso.ProfileRecord` is passed to the ``profile.callback`` option, or logged to the
+        ``"piso.profile"`` logger at debug level if there is no callback.  Default False.
+    - ``profile.callback`` : callable or None
+        Called with each record when the ``profile`` option is True.  Default None.
+
+    Parameters
+    ----------
+    key : str
+        The name of the option.
+    value : object
+        The new value of the option.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+
+    >>> import piso
+    >>> piso.set_option("cache.size", 2**28)
+    >>> piso.get_option("cache.size")
+    268435456
+    """
+    option = _get_registered_option(key)
+    if option.validator is not None:
+        option.validator(value)
+    _option_values[key] = value
+    if option.callback is not None:
+        option.callback(value)
+
+
+def reset_option(key):
+    """
+    Resets an option to its default value.
+
+    Parameters
+    ----------
+    key : str
+        The name of the option.
+
+    Returns
+    -------
+    None
+    """
+    set_option(key, _get_registered_option(key).default)
+
+
+@contextmanager
+def option_context(key, value):
+    """
+    Context manager which temporarily sets the value of an option.
+
+    Parameters
+    ----------
+    key : str
+        The name of the option.
+    value : object
+        The value of the option within the context.
+
+    Examples
+    --------
+
+    >>> import piso
+    >>> with piso.option_context("cache.size", 2**28):
+    ...     piso.union(arr)
+    """
+    previous = get_option(key)
+    set_option(key, value)
+    try:
+        yield
+    finally:
+        set_option(key, previous)
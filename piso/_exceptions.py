@@ -22,3 +22,17 @@ class DegenerateIntervalError(ValueError):
         Create a `DegenerateIntervalError` indicating that interval has zero length.
         """
         super().__init__(f"Zero lengths intervals: {param} - not supported by piso.")
+
+
+class DenseAllocationError(MemoryError):
+    def __init__(self, operation, shape, nbytes, max_bytes):
+        """
+        Create a `DenseAllocationError` indicating that a dense array would exceed the `max_dense_bytes` option.
+        """
+        super().__init__(
+            f"{operation} would allocate dense arrays of shape {shape}, estimated at {nbytes} bytes, "
+            f"which exceeds the max_dense_bytes option of {max_bytes} bytes."
+        )
+        self.shape = shape
+        self.nbytes = nbytes
+        self.max_bytes = max_bytes
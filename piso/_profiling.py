@@ -0,0 +1,224 @@
+import functools
+import logging
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+
+from piso import _config
+
+ProfileRecord = namedtuple(
+    "ProfileRecord", ["stage", "depth", "seconds", "size", "allocated_bytes"]
+)
+
+_logger = logging.getLogger("piso.profile")
+
+_active_profiles = []
+_lock = threading.Lock()
+_local = threading.local()
+
+# checked on every call of an instrumented stage, so kept as a plain module global
+_enabled = False
+
+
+def _update_enabled(_=None):
+    global _enabled
+    _enabled = bool(_active_profiles) or _config.get_option("profile")
+
+
+def _validate_callback(value):
+    if value is not None and not callable(value):
+        raise ValueError(f"Value must be callable or None.  Found {repr(value)}.")
+
+
+_config._register_option(
+    "profile", False, validator=_config._validate_bool, callback=_update_enabled
+)
+_config._register_option("profile.callback", None, validator=_validate_callback)
+
+
+class Profile:
+    """
+    A collection of timings of the internal stages of piso functions.
+
+    Instances are created by :func:`piso.profile` and should not be created directly.
+    """
+
+    def __init__(self, callback=None):
+        self.records = []
+        self._callback = callback
+
+    def _add(self, record):
+        self.records.append(record)
+        if self._callback is not None:
+            self._callback(record)
+
+    def to_frame(self):
+        """
+        Returns the records as a dataframe, with one row per call of an internal stage.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Has columns *stage*, *depth*, *seconds*, *size* and *allocated_bytes*.  The depth is the
+            number of enclosing stages, and the size is the number of intervals (or step points)
+            in the input.  Allocated bytes are the peak memory allocated during the stage, and are
+            missing unless :mod:`tracemalloc` is tracing.
+        """
+        return pd.DataFrame(self.records, columns=ProfileRecord._fields)
+
+    def summary(self):
+        """
+        Returns the records aggregated by stage.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Indexed by stage, with columns *calls*, *seconds*, *size* and *allocated_bytes*.
+            Seconds and sizes are totals, and allocated bytes are the maximum over calls.
+        """
+        return (
+            self.to_frame()
+            .groupby("stage", sort=False)
+            .agg(
+                calls=("seconds", "size"),
+                seconds=("seconds", "sum"),
+                size=("size", "sum"),
+                allocated_bytes=("allocated_bytes", "max"),
+            )
+        )
+
+
+@contextmanager
+def profile(memory=False, callback=None):
+    """
+    Context manager which records the wall time, input size and allocated memory of the internal
+    stages of piso functions called within the context.
+
+    Calls from any thread are recorded while the context is active.
+
+    Parameters
+    ----------
+    memory : bool, default False
+        If True, memory allocations are traced with :mod:`tracemalloc` for the duration of the context.
+        This slows down execution considerably.
+    callback : callable, optional
+        Called with each :class:`piso.ProfileRecord` as it is recorded.
+
+    Yields
+    ------
+    :class:`piso.Profile`
+
+    See Also
+    --------
+    piso.set_option : The ``profile`` option enables recording outside of a context.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> with piso.profile() as prof:
+    ...     piso.union(arr)
+    >>> prof.to_frame()
+                                   stage  depth   seconds  size allocated_bytes
+    0                _validate_intervals      0  0.000107     3            None
+    1              _interval_x_to_stairs      1  0.001965     3            None
+    2                       _make_stairs      0  0.001977     3            None
+    3  _boolean_stairs_to_interval_array      0  0.000458     4            None
+    """
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    prof = Profile(callback)
+    with _lock:
+        _active_profiles.append(prof)
+    _update_enabled()
+    try:
+        yield prof
+    finally:
+        with _lock:
+            _active_profiles.remove(prof)
+        _update_enabled()
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _emit(record):
+    with _lock:
+        profiles = list(_active_profiles)
+    for prof in profiles:
+        prof._add(record)
+    if _config.get_option("profile"):
+        callback = _config.get_option("profile.callback")
+        if callback is not None:
+            callback(record)
+        else:
+            _logger.debug("%s", record)
+
+
+class _Frame:
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start):
+        self.start = start
+        self.peak = start
+
+
+def _get_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _profiled(func=None, *, size):
+    """
+    Decorator recording calls of an internal stage when profiling is enabled.
+
+    The stage is named after the function, and the size of its input is given by
+    calling *size* with the arguments of the function.
+    """
+    if func is None:
+        return functools.partial(_profiled, size=size)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        stack = _get_stack()
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # the peak is global, so the peak seen by the enclosing stage is saved before resetting
+            current, peak = tracemalloc.get_traced_memory()
+            if stack and stack[-1].peak is not None:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            frame = _Frame(current)
+        else:
+            frame = _Frame(None)
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            allocated = None
+            if tracing and tracemalloc.is_tracing():
+                frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                allocated = frame.peak - frame.start
+                if stack and stack[-1].peak is not None:
+                    stack[-1].peak = max(stack[-1].peak, frame.peak)
+            _emit(
+                ProfileRecord(
+                    func.__name__, len(stack), seconds, size(*args, **kwargs), allocated
+                )
+            )
+
+    return wrapper
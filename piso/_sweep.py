@@ -0,0 +1,135 @@
+import numpy as np
+
+from piso._profiling import _profiled
+
+# Kernels operating on numpy arrays of interval endpoints.  Intervals are assumed to be
+# half-open (either left-closed or right-closed), so the closed side does not affect the
+# result of set operations, and adjacent intervals are merged when normalized.
+
+
+def _num_intervals(lefts, *args, **kwargs):
+    return len(lefts)
+
+
+def _num_operand_intervals(operands, *args, **kwargs):
+    return sum(len(lefts) for lefts, _ in operands)
+
+
+def _sort_by_left(lefts, rights):
+    order = np.argsort(lefts, kind="stable")
+    return lefts[order], rights[order]
+
+
+def _is_sorted(lefts):
+    return bool(np.all(lefts[1:] >= lefts[:-1]))
+
+
+def _is_disjoint(lefts, rights):
+    # assumes lefts are sorted
+    return bool(np.all(lefts[1:] >= rights[:-1]))
+
+
+@_profiled(size=_num_intervals)
+def _normalize(lefts, rights, is_sorted=False):
+    # returns the sorted, disjoint and non-adjacent intervals equal to the union
+    if len(lefts) == 0:
+        return lefts, rights
+    if not is_sorted:
+        lefts, rights = _sort_by_left(lefts, rights)
+    max_rights = np.maximum.accumulate(rights)
+    starts = np.flatnonzero(np.concatenate(([True], lefts[1:] > max_rights[:-1])))
+    ends = np.append(starts[1:] - 1, len(lefts) - 1)
+    return lefts[starts], max_rights[ends]
+
+
+@_profiled(size=_num_intervals)
+def _depth(lefts, rights, weights=None):
+    """
+    Returns the breakpoints of the step function given by the sum of (weighted) intervals,
+    and the value of the step function between consecutive breakpoints.
+    """
+    if weights is None:
+        weights = np.ones(len(lefts), dtype=np.int64)
+    points = np.concatenate((lefts, rights))
+    deltas = np.concatenate((weights, -weights))
+    if len(points) == 0:
+        return points, deltas
+    # stable sort detects the sorted runs of normalized operands and merges them in linear time
+    order = np.argsort(points, kind="stable")
+    points = points[order]
+    deltas = deltas[order]
+    run_starts = np.flatnonzero(np.concatenate(([True], points[1:] != points[:-1])))
+    values = np.cumsum(np.add.reduceat(deltas, run_starts))[:-1]
+    return points[run_starts], values
+
+
+def _restrict_profile(breaks, values, start, end):
+    # restricts the step function given by breaks and values, which is zero outside of the
+    # breakpoints, to the interval between start and end
+    zero = np.zeros(1, dtype=values.dtype)
+    inner = breaks[(breaks > start) & (breaks < end)]
+    restricted = np.concatenate(([start], inner, [end]))
+    extended = np.concatenate((zero, values, zero))
+    return restricted, extended[np.searchsorted(breaks, restricted[:-1], side="right")]
+
+
+def _compress_profile(breaks, values):
+    # merges consecutive gaps between breakpoints where the step function has the same value
+    if len(values) == 0:
+        return breaks, values
+    keep = np.concatenate(([True], values[1:] != values[:-1]))
+    return np.append(breaks[:-1][keep], breaks[-1:]), values[keep]
+
+
+@_profiled(size=_num_intervals)
+def _mask_to_intervals(breaks, mask):
+    # converts a boolean mask over the gaps between breakpoints into intervals
+    if len(mask) == 0:
+        return breaks[:0], breaks[:0]
+    edges = np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+    return breaks[np.flatnonzero(edges == 1)], breaks[np.flatnonzero(edges == -1)]
+
+
+@_profiled(size=_num_operand_intervals)
+def _count_operands(operands, weights=None):
+    """
+    Returns breakpoints, and the (weighted) number of normalized operands covering each
+    gap between breakpoints.
+    """
+    if weights is None:
+        weights = [1] * len(operands)
+    lefts = np.concatenate([lefts for lefts, _ in operands])
+    rights = np.concatenate([rights for _, rights in operands])
+    weights = np.repeat(weights, [len(lefts) for lefts, _ in operands])
+    return _depth(lefts, rights, weights)
+
+
+def _prefix_lengths(lefts, rights):
+    # total length of the first i normalized intervals, for i from 0 to len(lefts)
+    lengths = rights - lefts
+    return np.concatenate((np.zeros(1, dtype=lengths.dtype), np.cumsum(lengths)))
+
+
+def _cumulative_length(lefts, rights, x, prefix=None):
+    # total length of normalized intervals to the left of each point in x
+    if prefix is None:
+        prefix = _prefix_lengths(lefts, rights)
+    if len(lefts) == 0:
+        return np.broadcast_to(prefix, np.shape(x))
+    i = np.maximum(np.searchsorted(lefts, x, side="right") - 1, 0)
+    lengths = rights[i] - lefts[i]
+    partial = np.minimum(np.maximum(x - lefts[i], prefix[0]), lengths)
+    return prefix[i] + partial
+
+
+@_profiled(size=_num_intervals)
+def _covered_length(lefts, rights, starts, ends, prefix=None):
+    """
+    Returns the length of the intersection of normalized intervals with each interval
+    defined by *starts* and *ends*.
+    """
+    if prefix is None:
+        prefix = _prefix_lengths(lefts, rights)
+    return _cumulative_length(lefts, rights, ends, prefix) - _cumulative_length(
+        lefts, rights, starts, prefix
+    )
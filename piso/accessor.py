@@ -1,10 +1,15 @@
 import warnings
+from collections import OrderedDict
+from threading import Lock
 
+import numpy as np
 import pandas as pd
 
 import piso.docstrings.accessor as docstrings
-from piso import graph, intervalarray
+from piso import _config, _sweep, graph, intervalarray
 from piso._decorators import Appender
+from piso.intervalset import IntervalSet
+from piso.util import _has_degenerate_intervals, _interval_x_to_arrays, _to_values
 
 
 class CachedAccessor:
@@ -64,10 +69,99 @@ def _register_accessor(name, cls):
     return decorator
 
 
+class _LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_compute(self, key, func):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        value = func()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_ACCESSOR_CACHE_SIZE = 32
+
+
+def _copy_if_mutable(result):
+    if isinstance(result, (pd.arrays.IntervalArray, pd.Series)):
+        return result.copy()
+    if isinstance(result, tuple):  # endpoint arrays
+        return tuple(arr.copy() for arr in result)
+    if isinstance(result, dict):  # results for several thresholds
+        return {key: _copy_if_mutable(value) for key, value in result.items()}
+    return result
+
+
+def _effective_validate(validate):
+    # memoized results depend on the option if validate is not supplied
+    return _config.get_option("validate") if validate is None else validate
+
+
+def _domain_endpoints(interval_array, domain):
+    # the start and end of a domain over which the normalized intervals can be used, or None
+    if domain is not None and not (
+        isinstance(domain, pd.Interval)
+        or (isinstance(domain, tuple) and len(domain) == 2)
+    ):
+        return None
+    start, end = _to_values(intervalarray._get_domain_tuple(interval_array, domain))
+    return (start, end) if start < end else None
+
+
+def _normalized_coverage(interval_set, start, end, how):
+    covered = _sweep._covered_length(
+        interval_set.lefts,
+        interval_set.rights,
+        np.array([start]),
+        np.array([end]),
+        interval_set._get_prefix_lengths(),
+    )[0]
+    if how == "fraction":
+        return np.float64(covered / (end - start))
+    if isinstance(covered, np.timedelta64):
+        return pd.Timedelta(covered)
+    return np.float64(covered)
+
+
+def _normalized_bridge(interval_set, threshold):
+    # gaps between the normalized intervals no longer than the threshold are removed
+    lefts, rights = interval_set.lefts, interval_set.rights
+    keep = (lefts[1:] - rights[:-1]) > threshold
+    return IntervalSet._from_normalized(
+        lefts[np.concatenate(([True], keep))],
+        rights[np.concatenate((keep, [True]))],
+        interval_set.closed,
+        interval_set._subtype,
+    )
+
+
 class ArrayAccessor:
     """
     The piso accessor for :class:`pandas.arrays.IntervalArray` and :class:`pandas.IntervalIndex`
 
+    For :class:`pandas.IntervalIndex`, which is immutable, the results of methods called without
+    additional interval array arguments are memoized in a bounded least-recently-used cache.  The
+    normalized intervals, a :class:`piso.IntervalSet` with its cumulative lengths, are also
+    memoized, and shared by :meth:`ArrayAccessor.union`, :meth:`ArrayAccessor.coverage`,
+    :meth:`ArrayAccessor.complement` and :meth:`ArrayAccessor.bridge`, so that no step function
+    is constructed for these.  The cache can be emptied with :meth:`ArrayAccessor.clear_cache`.
+
     Parameters
     ----------
     _interval_array : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
@@ -75,86 +169,280 @@ class ArrayAccessor:
 
     def __init__(self, _interval_array):
         self._interval_array = _interval_array
+        self._cache = (
+            _LRUCache(_ACCESSOR_CACHE_SIZE)
+            if isinstance(_interval_array, pd.IntervalIndex)
+            else None
+        )
+
+    def clear_cache(self):
+        """
+        Removes all memoized results and derived structures.
+
+        Returns
+        -------
+        None
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _memoize(self, key, func):
+        if self._cache is None:
+            return func()
+        try:
+            hash(key)
+        except TypeError:  # arguments such as arrays cannot form part of the key
+            return func()
+        return _copy_if_mutable(self._cache.get_or_compute(key, func))
+
+    def _normalized(self):
+        # the sorted, disjoint intervals, or None if the intervals are not memoized, are empty, or
+        # some are missing, have zero length, or are otherwise unsupported, in which case the
+        # functions are used
+        if self._cache is None:
+            return None
+        return self._memoize(("_normalized",), self._make_normalized)
+
+    def _make_normalized(self):
+        interval_array = self._interval_array
+        lefts, _ = _interval_x_to_arrays(interval_array)
+        if (
+            len(interval_array) == 0
+            or interval_array.closed not in ("left", "right")
+            or lefts.dtype == object
+            or interval_array.isna().any()
+            or _has_degenerate_intervals(interval_array)
+        ):
+            return None
+        return IntervalSet.from_intervals(interval_array).normalize()
+
+    def _convert(self, interval_set, return_type="infer", squeeze=False):
+        klass = intervalarray._get_return_type(self._interval_array, return_type)
+        if klass == "arrays":
+            return interval_set.lefts, interval_set.rights
+        if len(interval_set) == 0:  # as returned by the functions
+            return klass([], closed=interval_set.closed)
+        if klass is pd.IntervalIndex:
+            result = interval_set.to_index()
+        else:
+            result = interval_set.to_array()
+        if squeeze and len(result) == 1:
+            result = result[0]
+        return result
+
+    def _union(self, squeeze, return_type, validate):
+        normalized = self._normalized()
+        if normalized is None:
+            return intervalarray.union(
+                self._interval_array,
+                squeeze=squeeze,
+                return_type=return_type,
+                validate=validate,
+            )
+        return self._convert(normalized, return_type, squeeze)
+
+    def _coverage(self, domain, bins, how):
+        normalized = self._normalized()
+        endpoints = None
+        if normalized is not None and not bins:
+            endpoints = _domain_endpoints(self._interval_array, domain)
+        if endpoints is None:
+            return intervalarray.coverage(self._interval_array, domain, bins, how)
+        return _normalized_coverage(normalized, *endpoints, how)
+
+    def _complement(self, domain, validate):
+        normalized = self._normalized()
+        endpoints = None
+        if normalized is not None:
+            endpoints = _domain_endpoints(self._interval_array, domain)
+        if endpoints is None:
+            return intervalarray.complement(self._interval_array, domain, validate)
+        return self._convert(normalized.complement(endpoints))
+
+    def _bridge(self, threshold, validate):
+        normalized = self._normalized()
+        if normalized is None:
+            return intervalarray.bridge(self._interval_array, threshold, validate)
+        return self._convert(_normalized_bridge(normalized, threshold))
 
     @Appender(docstrings.union_docstring, join="\n", indents=1)
-    def union(self, *interval_arrays, squeeze=False, return_type="infer"):
+    def union(
+        self, *interval_arrays, squeeze=False, return_type="infer", validate=None
+    ):
+        if not interval_arrays:
+            return self._memoize(
+                ("union", squeeze, return_type, _effective_validate(validate)),
+                lambda: self._union(squeeze, return_type, validate),
+            )
         return intervalarray.union(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
             return_type=return_type,
+            validate=validate,
         )
 
     @Appender(docstrings.intersection_docstring, join="\n", indents=1)
     def intersection(
-        self, *interval_arrays, min_overlaps="all", squeeze=False, return_type="infer"
+        self,
+        *interval_arrays,
+        min_overlaps="all",
+        squeeze=False,
+        return_type="infer",
+        validate=None,
+        weights=None,
     ):
+        if not interval_arrays and weights is None:
+            return self._memoize(
+                (
+                    "intersection",
+                    min_overlaps,
+                    squeeze,
+                    return_type,
+                    _effective_validate(validate),
+                ),
+                lambda: intervalarray.intersection(
+                    self._interval_array,
+                    min_overlaps=min_overlaps,
+                    squeeze=squeeze,
+                    return_type=return_type,
+                    validate=validate,
+                ),
+            )
         return intervalarray.intersection(
             self._interval_array,
             *interval_arrays,
             min_overlaps=min_overlaps,
             squeeze=squeeze,
             return_type=return_type,
+            validate=validate,
+            weights=weights,
         )
 
     @Appender(docstrings.difference_docstring, join="\n", indents=1)
-    def difference(self, *interval_arrays, squeeze=False, return_type="infer"):
+    def difference(
+        self, *interval_arrays, squeeze=False, return_type="infer", validate=None
+    ):
         return intervalarray.difference(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
             return_type=return_type,
+            validate=validate,
         )
 
     @Appender(docstrings.symmetric_difference_docstring, join="\n", indents=1)
     def symmetric_difference(
-        self, *interval_arrays, min_overlaps=2, squeeze=False, return_type="infer"
+        self,
+        *interval_arrays,
+        min_overlaps=2,
+        squeeze=False,
+        return_type="infer",
+        validate=None,
     ):
+        if not interval_arrays:
+            return self._memoize(
+                (
+                    "symmetric_difference",
+                    min_overlaps,
+                    squeeze,
+                    return_type,
+                    _effective_validate(validate),
+                ),
+                lambda: intervalarray.symmetric_difference(
+                    self._interval_array,
+                    min_overlaps=min_overlaps,
+                    squeeze=squeeze,
+                    return_type=return_type,
+                    validate=validate,
+                ),
+            )
         return intervalarray.symmetric_difference(
             self._interval_array,
             *interval_arrays,
             min_overlaps=min_overlaps,
             squeeze=squeeze,
             return_type=return_type,
+            validate=validate,
         )
 
     @Appender(docstrings.isdisjoint_docstring, join="\n", indents=1)
-    def isdisjoint(self, *interval_arrays):
+    def isdisjoint(self, *interval_arrays, validate=None):
+        if not interval_arrays:
+            return self._memoize(
+                ("isdisjoint",),
+                lambda: intervalarray.isdisjoint(self._interval_array),
+            )
         return intervalarray.isdisjoint(
             self._interval_array,
             *interval_arrays,
+            validate=validate,
         )
 
     @Appender(docstrings.issuperset_docstring, join="\n", indents=1)
-    def issuperset(self, *interval_arrays, squeeze=False):
+    def issuperset(self, *interval_arrays, squeeze=False, validate=None):
         return intervalarray.issuperset(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
+            validate=validate,
         )
 
     @Appender(docstrings.issubset_docstring, join="\n", indents=1)
-    def issubset(self, *interval_arrays, squeeze=False):
+    def issubset(self, *interval_arrays, squeeze=False, validate=None):
         return intervalarray.issubset(
             self._interval_array,
             *interval_arrays,
             squeeze=squeeze,
+            validate=validate,
         )
 
     @Appender(docstrings.coverage_docstring, join="\n", indents=1)
-    def coverage(self, domain=None, bins=False, how="fraction"):
-        return intervalarray.coverage(
+    def coverage(self, domain=None, bins=False, how="fraction", weights=None):
+        if self._cache is None or weights is not None:
+            return intervalarray.coverage(
+                self._interval_array,
+                domain,
+                bins,
+                how,
+                weights,
+            )
+        return self._memoize(
+            ("coverage", domain, bins, how),
+            lambda: self._coverage(domain, bins, how),
+        )
+
+    @Appender(docstrings.depth_docstring, join="\n", indents=1)
+    def depth(
+        self,
+        *interval_arrays,
+        domain=None,
+        compress=False,
+        return_type="arrays",
+        weights=None,
+        validate=None,
+    ):
+        return intervalarray.depth(
             self._interval_array,
-            domain,
-            bins,
-            how,
+            *interval_arrays,
+            domain=domain,
+            compress=compress,
+            return_type=return_type,
+            weights=weights,
+            validate=validate,
         )
 
     @Appender(docstrings.complement_docstring, join="\n", indents=1)
-    def complement(self, domain=None):
-        return intervalarray.complement(
-            self._interval_array,
-            domain,
+    def complement(self, domain=None, validate=None):
+        if self._cache is None:
+            return intervalarray.complement(
+                self._interval_array,
+                domain,
+                validate,
+            )
+        return self._memoize(
+            ("complement", domain, _effective_validate(validate)),
+            lambda: self._complement(domain, validate),
         )
 
     @Appender(docstrings.contains_docstring, join="\n", indents=1)
@@ -184,10 +472,16 @@ class ArrayAccessor:
         )
 
     @Appender(docstrings.bridge_docstring, join="\n", indents=1)
-    def bridge(self, threshold):
-        return intervalarray.bridge(
-            self._interval_array,
-            threshold,
+    def bridge(self, threshold, validate=None):
+        if self._cache is None:
+            return intervalarray.bridge(
+                self._interval_array,
+                threshold,
+                validate,
+            )
+        return self._memoize(
+            ("bridge", threshold, _effective_validate(validate)),
+            lambda: self._bridge(threshold, validate),
         )
 
 
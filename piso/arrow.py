@@ -0,0 +1,364 @@
+"""
+Set operations and lookups on intervals stored in Apache Arrow tables.
+
+Intervals are given by a start and end column of a :class:`pyarrow.Table` (or
+:class:`pyarrow.RecordBatch`), and are assumed to be either left-closed or right-closed, as for
+:mod:`piso.core`.  The endpoint columns must not contain nulls, and must have a numeric, timestamp,
+date or duration type.  Columns consisting of a single chunk of a fixed width type are viewed as
+numpy arrays without copying, so tables read from memory-mapped Feather or Arrow IPC files are not
+loaded into memory by piso.  Results are returned as tables, with endpoints of the same type as the
+operands.
+"""
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "piso.arrow requires pyarrow.  Install it with `pip install pyarrow`."
+    ) from e
+
+from piso import core
+
+
+def _column_to_numpy(column):
+    if isinstance(column, pa.ChunkedArray):
+        # a copy is only required when the column is split over several chunks
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if column.null_count:
+        raise ValueError("Interval endpoints must not contain nulls.")
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _get_columns(table, start, end):
+    return table.column(start), table.column(end)
+
+
+def _get_type(tables, start, end):
+    types = {table.schema.field(name).type for table in tables for name in (start, end)}
+    if len(types) != 1:
+        raise ValueError(
+            f"Start and end columns must all have the same type.  Found {sorted(map(str, types))}."
+        )
+    return types.pop()
+
+
+def _to_operand(table, start, end):
+    return tuple(_column_to_numpy(col) for col in _get_columns(table, start, end))
+
+
+def _to_table(operand, arrow_type, start, end):
+    lefts, rights = operand
+    return pa.table(
+        {
+            start: pa.array(lefts, type=arrow_type),
+            end: pa.array(rights, type=arrow_type),
+        }
+    )
+
+
+def _apply(func, tables, start, end, **kwargs):
+    arrow_type = _get_type(tables, start, end)
+    operands = [_to_operand(table, start, end) for table in tables]
+    return _to_table(func(*operands, **kwargs), arrow_type, start, end)
+
+
+def _to_domain(domain, dtype, start, end):
+    if domain is None:
+        return None
+    if isinstance(domain, (pa.Table, pa.RecordBatch)):
+        return _to_operand(domain, start, end)
+    if isinstance(domain, tuple) and len(domain) == 2:
+        return tuple(
+            np.asarray(x.as_py() if isinstance(x, pa.Scalar) else x).astype(dtype)
+            for x in domain
+        )
+    raise ValueError(
+        "The domain parameter must be either a 2-tuple, a pyarrow Table or RecordBatch, or None."
+    )
+
+
+def union(table, *tables, start="start", end="end"):
+    """
+    Performs a set union operation.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    *tables : argument list of :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        May contain zero or more arguments.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Sorted, disjoint intervals, in *start* and *end* columns.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table = pa.table({"start": [0, 2, 7], "end": [4, 5, 8]})
+    >>> piso.arrow.union(table).to_pydict()
+    {'start': [0, 7], 'end': [5, 8]}
+    """
+    return _apply(core.union, (table, *tables), start, end)
+
+
+def intersection(table, *tables, min_overlaps="all", start="start", end="end"):
+    """
+    Performs a set intersection operation.
+
+    If there is a single table then the sets are considered to be its intervals, otherwise the
+    sets are considered to be the tables.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    *tables : argument list of :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        May contain zero or more arguments.
+    min_overlaps : int or "all", default "all"
+        The minimum number of sets which overlap in order to define an intersection.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Sorted, disjoint intervals, in *start* and *end* columns.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table = pa.table({"start": [0, 2, 3], "end": [4, 5, 6]})
+    >>> piso.arrow.intersection(table, min_overlaps=2).to_pydict()
+    {'start': [2], 'end': [5]}
+    """
+    return _apply(
+        core.intersection, (table, *tables), start, end, min_overlaps=min_overlaps
+    )
+
+
+def difference(table, *tables, start="start", end="end"):
+    """
+    Performs a set difference operation, between *table* and the union of *tables*.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    *tables : argument list of :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Must contain at least one argument.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Sorted, disjoint intervals, in *start* and *end* columns.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table1 = pa.table({"start": [0, 7], "end": [5, 12]})
+    >>> table2 = pa.table({"start": [3, 8], "end": [4, 10]})
+    >>> piso.arrow.difference(table1, table2).to_pydict()
+    {'start': [0, 4, 7, 10], 'end': [3, 5, 8, 12]}
+    """
+    assert tables
+    return _apply(core.difference, (table, *tables), start, end)
+
+
+def symmetric_difference(table, *tables, min_overlaps=2, start="start", end="end"):
+    """
+    Performs a set symmetric difference operation.
+
+    If there is a single table then the sets are considered to be its intervals, otherwise the
+    sets are considered to be the tables.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    *tables : argument list of :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        May contain zero or more arguments.
+    min_overlaps : int or "all", default 2
+        The result is where at least one, and fewer than *min_overlaps*, sets overlap.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Sorted, disjoint intervals, in *start* and *end* columns.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table1 = pa.table({"start": [0, 7], "end": [5, 12]})
+    >>> table2 = pa.table({"start": [3, 8], "end": [4, 10]})
+    >>> piso.arrow.symmetric_difference(table1, table2).to_pydict()
+    {'start': [0, 4, 7, 10], 'end': [3, 5, 8, 12]}
+    """
+    return _apply(
+        core.symmetric_difference,
+        (table, *tables),
+        start,
+        end,
+        min_overlaps=min_overlaps,
+    )
+
+
+def complement(table, domain=None, start="start", end="end"):
+    """
+    Performs a set complement operation, relative to a domain.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    domain : :py:class:`tuple`, :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`, optional
+        Either a pair of scalars, defining a single interval, or a table of intervals in *start*
+        and *end* columns, defining a possibly disconnected domain.  If not specified the domain is
+        the smallest interval containing the intervals of *table*.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Sorted, disjoint intervals, in *start* and *end* columns.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table = pa.table({"start": [0, 2, 7], "end": [4, 5, 8]})
+    >>> piso.arrow.complement(table, domain=(-1, 10)).to_pydict()
+    {'start': [-1, 5, 8], 'end': [0, 7, 10]}
+    """
+    arrow_type = _get_type([table], start, end)
+    operand = _to_operand(table, start, end)
+    domain = _to_domain(domain, operand[0].dtype, start, end)
+    return _to_table(core.complement(operand, domain), arrow_type, start, end)
+
+
+def coverage(table, domain=None, how="fraction", start="start", end="end"):
+    """
+    Calculates the size of a domain covered by the intervals.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    domain : :py:class:`tuple`, :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`, optional
+        Either a pair of scalars, defining a single interval, or a table of intervals in *start*
+        and *end* columns, defining a possibly disconnected domain.  If not specified the domain is
+        the smallest interval containing the intervals of *table*.
+    how : {"fraction", "sum"}, default "fraction"
+        Whether to return the fraction of the domain which is covered, or the length covered.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+
+    Returns
+    -------
+    scalar
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table = pa.table({"start": [0, 2, 7], "end": [4, 5, 8]})
+    >>> float(piso.arrow.coverage(table))
+    0.75
+    """
+    operand = _to_operand(table, start, end)
+    domain = _to_domain(domain, operand[0].dtype, start, end)
+    return core.coverage(operand, domain, how=how)
+
+
+def lookup(table, x, start="start", end="end", closed="right"):
+    """
+    Finds the rows of a table whose intervals contain given points.
+
+    The intervals of *table* must be disjoint.
+
+    Parameters
+    ----------
+    table : :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        Contains the intervals as *start* and *end* columns.
+    x : :class:`pyarrow.Array`, :class:`pyarrow.ChunkedArray` or array-like
+        The points to look up.
+    start : str, default "start"
+        The name of the column containing the left endpoints.
+    end : str, default "end"
+        The name of the column containing the right endpoints.
+    closed : {"left", "right", "both", "neither"}, default "right"
+        The sides on which the intervals are closed.
+
+    Returns
+    -------
+    :class:`pyarrow.Table` or :class:`pyarrow.RecordBatch`
+        The row of *table* containing each point, or a row of nulls if there is none.
+
+    Examples
+    --------
+
+    >>> import pyarrow as pa
+    >>> import piso.arrow
+
+    >>> table = pa.table({"start": [0, 4, 7], "end": [3, 6, 8], "value": ["a", "b", "c"]})
+    >>> piso.arrow.lookup(table, [1, 3.5, 8]).to_pydict()
+    {'start': [0, None, 7], 'end': [3, None, 8], 'value': ['a', None, 'c']}
+    """
+    lefts, rights = _to_operand(table, start, end)
+    if isinstance(x, (pa.Array, pa.ChunkedArray)):
+        x = _column_to_numpy(x)
+    x = np.asarray(x)
+    if lefts.dtype.kind in "mM":
+        x = x.astype(lefts.dtype)
+    order = np.argsort(lefts, kind="stable")
+    lefts, rights = lefts[order], rights[order]
+    disjoint = np.greater if closed == "both" else np.greater_equal
+    if not np.all(disjoint(lefts[1:], rights[:-1])):
+        raise ValueError("Intervals of the table must be disjoint.")
+    if len(lefts) == 0:
+        return table.take(pa.nulls(len(x), type=pa.int64()))
+    # the candidate for each point is the last interval starting before it
+    side = "right" if closed in ("left", "both") else "left"
+    i = np.maximum(np.searchsorted(lefts, x, side=side) - 1, 0)
+    left_compare = np.greater_equal if closed in ("left", "both") else np.greater
+    right_compare = np.less_equal if closed in ("right", "both") else np.less
+    found = left_compare(x, lefts[i]) & right_compare(x, rights[i])
+    return table.take(pa.array(order[i], mask=~found))
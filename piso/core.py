@@ -0,0 +1,426 @@
+"""
+Set operations on intervals given as numpy arrays of endpoints.
+
+An *operand* is a pair ``(lefts, rights)`` of equal length :class:`numpy.ndarray`, where the i-th
+interval is from ``lefts[i]`` to ``rights[i]``.  Endpoints may be numeric, :class:`numpy.datetime64`
+or :class:`numpy.timedelta64`.  Except for :func:`piso.core.contains`, intervals are assumed to be
+either left-closed or right-closed, and results are closed on the same side as the operands.
+Intervals of zero length are not supported.
+
+No pandas objects are created, and no validation is performed.
+"""
+
+import numpy as np
+
+from piso import _sweep
+from piso.util import _check_dense_bytes, _dense_bytes_exceeded
+
+
+def _as_operand(operand):
+    lefts, rights = operand
+    return np.asarray(lefts), np.asarray(rights)
+
+
+def _normalized(operand):
+    return _sweep._normalize(*_as_operand(operand))
+
+
+def _get_min_overlaps(min_overlaps, operands):
+    if min_overlaps != "all":
+        return min_overlaps
+    return len(operands) if len(operands) > 1 else len(operands[0][0])
+
+
+def _count(operands, weights=None):
+    # a single operand counts its overlapping intervals, otherwise each operand counts once
+    if len(operands) == 1 and weights is None:
+        return _sweep._depth(*_as_operand(operands[0]))
+    return _sweep._count_operands([_normalized(op) for op in operands], weights)
+
+
+def _is_scalar_pair(domain):
+    return np.ndim(domain[0]) == 0
+
+
+def _domain_operand(operand, domain):
+    # the domain as an operand, defaulting to the smallest interval containing the operand
+    if domain is None:
+        lefts, rights = _as_operand(operand)
+        if len(lefts) == 0:
+            return lefts, rights
+        domain = (lefts.min(), rights.max())
+    if _is_scalar_pair(domain):
+        return np.array([domain[0]]), np.array([domain[1]])
+    return _as_operand(domain)
+
+
+def union(*operands):
+    """
+    Performs a set union operation.
+
+    Parameters
+    ----------
+    *operands : argument list of tuples of :class:`numpy.ndarray`
+        Each operand is a pair of arrays of left and right endpoints.  Must contain at least one argument.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of sorted, disjoint intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.union(
+    ...     (np.array([0, 2, 7]), np.array([4, 5, 8])),
+    ...     (np.array([8, 10]), np.array([9, 12])),
+    ... )
+    (array([ 0,  7, 10]), array([ 5,  9, 12]))
+    """
+    assert operands
+    lefts = np.concatenate([_as_operand(op)[0] for op in operands])
+    rights = np.concatenate([_as_operand(op)[1] for op in operands])
+    return _sweep._normalize(lefts, rights)
+
+
+def intersection(*operands, min_overlaps="all"):
+    """
+    Performs a set intersection operation.
+
+    If there is a single operand then the sets are considered to be its intervals, otherwise the
+    sets are considered to be the operands.
+
+    Parameters
+    ----------
+    *operands : argument list of tuples of :class:`numpy.ndarray`
+        Each operand is a pair of arrays of left and right endpoints.  Must contain at least one argument.
+    min_overlaps : int or "all", default "all"
+        The minimum number of sets which overlap in order to define an intersection.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of sorted, disjoint intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.intersection((np.array([0, 2, 3]), np.array([4, 5, 6])), min_overlaps=2)
+    (array([2]), array([5]))
+    """
+    assert operands
+    breaks, counts = _count(operands)
+    return _sweep._mask_to_intervals(
+        breaks, counts >= _get_min_overlaps(min_overlaps, operands)
+    )
+
+
+def difference(operand, *operands):
+    """
+    Performs a set difference operation, between *operand* and the union of *operands*.
+
+    Parameters
+    ----------
+    operand : tuple of :class:`numpy.ndarray`
+        A pair of arrays of left and right endpoints.
+    *operands : argument list of tuples of :class:`numpy.ndarray`
+        Must contain at least one argument.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of sorted, disjoint intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.difference(
+    ...     (np.array([0, 7]), np.array([5, 12])),
+    ...     (np.array([3, 8]), np.array([4, 10])),
+    ... )
+    (array([ 0,  4,  7, 10]), array([ 3,  5,  8, 12]))
+    """
+    assert operands
+    # points covered by any of the other operands have a count of at least 2
+    breaks, counts = _count((operand, *operands), weights=[1] + [2] * len(operands))
+    return _sweep._mask_to_intervals(breaks, counts == 1)
+
+
+def symmetric_difference(*operands, min_overlaps=2):
+    """
+    Performs a set symmetric difference operation.
+
+    If there is a single operand then the sets are considered to be its intervals, otherwise the
+    sets are considered to be the operands.
+
+    Parameters
+    ----------
+    *operands : argument list of tuples of :class:`numpy.ndarray`
+        Each operand is a pair of arrays of left and right endpoints.  Must contain at least one argument.
+    min_overlaps : int or "all", default 2
+        The result is where at least one, and fewer than *min_overlaps*, sets overlap.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of sorted, disjoint intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.symmetric_difference(
+    ...     (np.array([0, 7]), np.array([5, 12])),
+    ...     (np.array([3, 8]), np.array([4, 10])),
+    ... )
+    (array([ 0,  4,  7, 10]), array([ 3,  5,  8, 12]))
+    """
+    assert operands
+    breaks, counts = _count(operands)
+    min_overlaps = _get_min_overlaps(min_overlaps, operands)
+    if min_overlaps == 2:
+        mask = counts == 1
+    else:
+        mask = (counts >= 1) & (counts <= min_overlaps - 1)
+    return _sweep._mask_to_intervals(breaks, mask)
+
+
+def complement(operand, domain=None):
+    """
+    Performs a set complement operation, relative to a domain.
+
+    Parameters
+    ----------
+    operand : tuple of :class:`numpy.ndarray`
+        A pair of arrays of left and right endpoints.
+    domain : tuple, optional
+        Either a pair of scalars, defining a single interval, or a pair of arrays of left and right
+        endpoints, defining a possibly disconnected domain.  If not specified the domain is the
+        smallest interval containing *operand*.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of sorted, disjoint intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.complement((np.array([0, 2, 7]), np.array([4, 5, 8])))
+    (array([5]), array([7]))
+
+    >>> piso.core.complement((np.array([0, 2, 7]), np.array([4, 5, 8])), domain=(-1, 10))
+    (array([-1,  5,  8]), array([ 0,  7, 10]))
+    """
+    return difference(_domain_operand(operand, domain), operand)
+
+
+def coverage(operand, domain=None, bins=False, how="fraction"):
+    """
+    Calculates the size of a domain (or possibly multiple domains) covered by the intervals.
+
+    Parameters
+    ----------
+    operand : tuple of :class:`numpy.ndarray`
+        A pair of arrays of left and right endpoints.
+    domain : tuple, optional
+        Either a pair of scalars, defining a single interval, or a pair of arrays of left and right
+        endpoints, defining a possibly disconnected domain.  If not specified the domain is the
+        smallest interval containing *operand*.
+    bins : bool, default False
+        If True, *domain* must be a pair of arrays defining disjoint intervals, and the coverage of
+        each interval is calculated.
+    how : {"fraction", "sum"}, default "fraction"
+        Whether to return the fraction of the domain which is covered, or the length covered.
+
+    Returns
+    -------
+    scalar, or :class:`numpy.ndarray` if *bins* is True
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.coverage((np.array([0, 2, 7]), np.array([4, 5, 8])))
+    0.75
+
+    >>> piso.core.coverage((np.array([0, 2, 7]), np.array([4, 5, 8])), domain=(4, 10), how="sum")
+    2
+
+    >>> piso.core.coverage(
+    ...     (np.array([0, 2, 7]), np.array([4, 5, 8])),
+    ...     domain=(np.array([0, 5]), np.array([5, 10])),
+    ...     bins=True,
+    ... )
+    array([1. , 0.2])
+    """
+    assert how in ("fraction", "sum")
+    lefts, rights = _normalized(operand)
+    if bins:
+        starts, ends = _as_operand(domain)
+        covered = _sweep._covered_length(lefts, rights, starts, ends)
+        return covered if how == "sum" else covered / (ends - starts)
+    starts, ends = _sweep._normalize(*_domain_operand(operand, domain))
+    covered = _sweep._covered_length(lefts, rights, starts, ends).sum()
+    if how == "sum":
+        return covered
+    with np.errstate(invalid="ignore"):
+        return covered / (ends - starts).sum()
+
+
+def _count_containing_intervals(starts, ends, closed, x):
+    # the number of intervals containing each point, by counting endpoints either side of it
+    nonempty = (starts < ends) | ((starts == ends) & (closed == "both"))
+    starts, ends = np.sort(starts[nonempty]), np.sort(ends[nonempty])
+    left_side = "right" if closed in ("left", "both") else "left"
+    right_side = "left" if closed in ("right", "both") else "right"
+    return np.searchsorted(starts, x, side=left_side) - np.searchsorted(
+        ends, x, side=right_side
+    )
+
+
+def _count_contained_points(starts, ends, closed, x):
+    # the number of points contained in each interval
+    x = np.sort(x)
+    left_side = "left" if closed in ("left", "both") else "right"
+    right_side = "right" if closed in ("right", "both") else "left"
+    counts = np.searchsorted(x, ends, side=right_side) - np.searchsorted(
+        x, starts, side=left_side
+    )
+    return np.maximum(counts, 0)
+
+
+def contains(operand, x, closed="right", result="cartesian", how="any"):
+    """
+    Evaluates the intersection of a set of intervals with a set of points.
+
+    Unlike the other functions in this module, intervals may be closed on both sides or neither.
+
+    Parameters
+    ----------
+    operand : tuple of :class:`numpy.ndarray`
+        A pair of arrays of left and right endpoints, of length *m*.
+    x : :class:`numpy.ndarray`
+        The points, of length *n*.
+    closed : {"left", "right", "both", "neither"}, default "right"
+        The sides on which the intervals are closed.
+    result : {"cartesian", "points", "intervals"}, default "cartesian"
+        If "cartesian" the result is a boolean mask of shape *(m, n)*, otherwise it is one dimensional,
+        of length *n* if "points" and length *m* if "intervals".
+    how : {"any", "all"}, default "any"
+        Only relevant if *result* is not "cartesian".  Whether points are required to be contained
+        in any or all intervals, or intervals are required to contain any or all points.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Boolean valued.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.contains((np.array([0, 2]), np.array([4, 5])), np.array([0, 1, 3, 4]))
+    array([[False,  True,  True,  True],
+           [False, False,  True,  True]])
+
+    >>> piso.core.contains(
+    ...     (np.array([0, 2]), np.array([4, 5])), np.array([0, 1, 3, 4]), result="points"
+    ... )
+    array([False,  True,  True,  True])
+    """
+    assert result in ("cartesian", "intervals", "points")
+    assert how in ("any", "all")
+    starts, ends = _as_operand(operand)
+    x = np.asarray(x)
+    # three boolean arrays are created by the outer comparisons
+    shape = (len(starts), len(x))
+    nbytes = 3 * len(starts) * len(x)
+    if result != "cartesian" and _dense_bytes_exceeded(nbytes):
+        if result == "points":
+            counts = _count_containing_intervals(starts, ends, closed, x)
+            total = len(starts)
+        else:
+            counts = _count_contained_points(starts, ends, closed, x)
+            total = len(x)
+        return counts > 0 if how == "any" else counts == total
+    _check_dense_bytes("contains", shape, nbytes)
+    right_compare = np.less_equal if closed in ("right", "both") else np.less
+    left_compare = np.greater_equal if closed in ("left", "both") else np.greater
+    calc = (right_compare.outer(x, ends) & left_compare.outer(x, starts)).transpose()
+    if result != "cartesian":
+        logical_method = np.logical_or if how == "any" else np.logical_and
+        axis = 0 if result == "points" else 1
+        calc = logical_method.reduce(calc, axis=axis)
+    return calc
+
+
+def split(operand, x):
+    """
+    Splits intervals into pieces wherever they contain a break point in their interior.
+
+    Parameters
+    ----------
+    operand : tuple of :class:`numpy.ndarray`
+        A pair of arrays of left and right endpoints.
+    x : :class:`numpy.ndarray`
+        The break points.  May contain duplicates and be unsorted.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The left and right endpoints of the pieces.  The pieces of each interval are consecutive,
+        and in the order of the intervals.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import piso.core
+
+    >>> piso.core.split((np.array([0, 2]), np.array([4, 6])), np.array([3, 5]))
+    (array([0, 3, 2, 3, 5]), array([3, 4, 3, 5, 6]))
+    """
+    starts, ends = _as_operand(operand)
+    x = np.unique(x)
+    if len(x) == 0:
+        x = x.astype(starts.dtype)
+    lo = np.searchsorted(x, starts, side="right")
+    counts = np.maximum(np.searchsorted(x, ends, side="left") - lo, 0)
+    inner_starts = np.cumsum(counts) - counts
+    inner_points = x[np.arange(counts.sum()) + np.repeat(lo - inner_starts, counts)]
+
+    # interval i is split into counts[i] + 1 pieces, starting at row first[i]
+    first = inner_starts + np.arange(len(starts))
+    size = len(starts) + len(inner_points)
+    is_first = np.zeros(size, dtype=bool)
+    is_first[first] = True
+    is_last = np.zeros(size, dtype=bool)
+    is_last[first + counts] = True
+
+    dtype = np.result_type(starts.dtype, x.dtype)
+    lefts = np.empty(size, dtype=dtype)
+    lefts[is_first] = starts
+    lefts[~is_first] = inner_points
+    rights = np.empty(size, dtype=dtype)
+    rights[is_last] = ends
+    rights[~is_last] = inner_points
+    return lefts, rights
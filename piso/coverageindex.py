@@ -0,0 +1,97 @@
+import numpy as np
+
+from piso import _sweep
+from piso.intervalset import _as_interval_set
+from piso.util import _to_values
+
+
+class CoverageIndex:
+    """
+    A prepared index answering range coverage queries in logarithmic time.
+
+    The intervals are normalized to sorted, disjoint intervals, and the cumulative lengths of
+    these are calculated, once.  The length covered between two points is then the difference
+    of the cumulative lengths at the points, each found by a binary search.
+
+    Parameters
+    ----------
+    intervals : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        Must be left-closed or right-closed.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> index = piso.CoverageIndex(arr)
+    >>> index.covered_length(3, 10)
+    3
+
+    >>> index.fraction([0, 4], [10, 6])
+    array([0.6, 0.5])
+    """
+
+    def __init__(self, intervals):
+        self._interval_set = _as_interval_set(intervals).normalize()
+        # a set opened from a store has its cumulative lengths already
+        self._prefix = self._interval_set._get_prefix_lengths()
+
+    @property
+    def interval_set(self):
+        """The normalized intervals, as a :class:`piso.IntervalSet`."""
+        return self._interval_set
+
+    def _query(self, starts, ends):
+        is_scalar = np.ndim(starts) == 0 and np.ndim(ends) == 0
+        starts, ends = np.broadcast_arrays(_to_values(starts), _to_values(ends))
+        if np.any(starts > ends):
+            raise ValueError("Range starts must not be greater than range ends.")
+        covered = _sweep._covered_length(
+            self._interval_set.lefts,
+            self._interval_set.rights,
+            starts,
+            ends,
+            self._prefix,
+        )
+        return is_scalar, starts, ends, covered
+
+    def covered_length(self, starts, ends):
+        """
+        Calculates the length of each range covered by the intervals.
+
+        Parameters
+        ----------
+        starts : scalar or array-like of scalars
+            The left endpoints of the ranges.
+        ends : scalar or array-like of scalars
+            The right endpoints of the ranges.  Broadcast against *starts*.
+
+        Returns
+        -------
+        scalar, or :class:`numpy.ndarray` if *starts* or *ends* is array-like
+        """
+        is_scalar, _, _, covered = self._query(starts, ends)
+        return covered[0] if is_scalar else covered
+
+    def fraction(self, starts, ends):
+        """
+        Calculates the fraction of each range covered by the intervals.
+
+        Parameters
+        ----------
+        starts : scalar or array-like of scalars
+            The left endpoints of the ranges.
+        ends : scalar or array-like of scalars
+            The right endpoints of the ranges.  Broadcast against *starts*.
+
+        Returns
+        -------
+        float, or :class:`numpy.ndarray` if *starts* or *ends* is array-like
+            The fraction is nan for ranges of zero length.
+        """
+        is_scalar, starts, ends, covered = self._query(starts, ends)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = covered / (ends - starts)
+        return fraction[0] if is_scalar else fraction
@@ -70,6 +70,13 @@ Interval(2.0, 3.0, closed='left')
 <IntervalArray>
 []
 Length: 0, closed: right, dtype: interval[int64]
+
+>>> piso.interval.intersection(
+...    pd.Interval(0, 3),
+...    pd.Interval(2, 4),
+...    return_type="tuples",
+... )
+((2, 3),)
 """
 
 difference_examples = """
@@ -182,6 +189,11 @@ array([ True,  False])
 ...    squeeze=False
 ... )
 array([ True])
+>>> piso.interval.issuperset(
+...    pd.arrays.IntervalArray.from_tuples([(0, 4), (1, 3), (2, 5)]),
+...    pd.arrays.IntervalArray.from_tuples([(1, 2), (1, 3), (1, 4)]),
+... )
+array([ True,  True, False])
 """
 
 
@@ -217,6 +229,11 @@ array([ True,  False])
 ...    squeeze=False
 ... )
 array([ True])
+>>> piso.interval.issubset(
+...    pd.arrays.IntervalArray.from_tuples([(1, 2), (1, 3), (1, 4)]),
+...    pd.Interval(0, 3),
+... )
+array([ True,  True, False])
 """
 
 template_doc = """
@@ -230,10 +247,14 @@ interval2 : pandas.Interval
     the second operand
 squeeze : boolean, default True
     If True, will try to coerce the return value to a :class:`pandas.Interval`
+return_type : {{"infer", "tuples"}}, default "infer"
+    If "tuples" the result is a tuple of zero, one or two *(left, right)* tuples, sorted and
+    closed on the same side as the operands, and no pandas objects are created.  *squeeze* is
+    ignored.
 
 Returns
 -------
-:class:`pandas.Interval` or :class:`pandas.arrays.IntervalArray`
+:class:`pandas.Interval`, :class:`pandas.arrays.IntervalArray` or tuple
 
 {examples}
 """
@@ -254,12 +275,16 @@ symmetric_difference_docstring = template_doc.format(
 is_sub_super_doc = """
 Indicates whether one :class:`pandas.Interval` is a {operation} of one, or more, others.
 
+If *interval* is an interval array, and *intervals* is an interval array of the same length, then
+the comparison is pairwise.
+
 Parameters
 ----------
-interval : :class:`pandas.Interval`
-    An interval, against which all other intervals belonging to *intervals* are compared.
-*intervals : argument list of :class:`pandas.Interval`
-    Must contain at least one argument.
+interval : :class:`pandas.Interval`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    An interval, or intervals, against which all other intervals belonging to *intervals* are compared.
+*intervals : argument list of :class:`pandas.Interval`, or a single :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    Must contain at least one argument.  The endpoints of interval arrays are compared without
+    creating :class:`pandas.Interval` objects.
 squeeze : boolean, default True
     If True, will try to coerce the return value to a single boolean
 
@@ -279,3 +304,125 @@ issubset_docstring = is_sub_super_doc.format(
     operation="subset",
     examples=issubset_examples,
 )
+
+
+pairwise_template_doc = """
+Performs the {operation} of each pair of intervals from two interval arrays of equal length.
+
+The result for each pair consists of {pieces} intervals, and the results are concatenated.
+
+Parameters
+----------
+interval_array1 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    The first operands.
+interval_array2 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    The second operands.  Must have the same length, and closed attribute, as *interval_array1*.
+
+Returns
+-------
+tuple
+    The intervals of the results, of the same type as *interval_array1*, and a
+    :class:`numpy.ndarray` of the number of intervals in the result of each pair.  The
+    intervals resulting from a pair are consecutive, sorted, and in the order of the pairs.
+
+{examples}
+"""
+
+pairwise_union_examples = """
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.interval
+
+>>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 3), (0, 1), (2, 4)])
+>>> arr2 = pd.arrays.IntervalArray.from_tuples([(2, 4), (3, 4), (0, 5)])
+
+>>> result, counts = piso.interval.pairwise_union(arr1, arr2)
+>>> result
+<IntervalArray>
+[(0, 4], (0, 1], (3, 4], (0, 5]]
+Length: 4, dtype: interval[int64, right]
+
+>>> counts
+array([1, 2, 1])
+"""
+
+pairwise_intersection_examples = """
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.interval
+
+>>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 3), (0, 1), (2, 4)])
+>>> arr2 = pd.arrays.IntervalArray.from_tuples([(2, 4), (3, 4), (0, 5)])
+
+>>> result, counts = piso.interval.pairwise_intersection(arr1, arr2)
+>>> result
+<IntervalArray>
+[(2, 3], (2, 4]]
+Length: 2, dtype: interval[int64, right]
+
+>>> counts
+array([1, 0, 1])
+"""
+
+pairwise_difference_examples = """
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.interval
+
+>>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 3), (0, 1), (2, 4)])
+>>> arr2 = pd.arrays.IntervalArray.from_tuples([(2, 4), (3, 4), (0, 5)])
+
+>>> result, counts = piso.interval.pairwise_difference(arr1, arr2)
+>>> result
+<IntervalArray>
+[(0, 2], (0, 1]]
+Length: 2, dtype: interval[int64, right]
+
+>>> counts
+array([1, 1, 0])
+"""
+
+pairwise_symmetric_difference_examples = """
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso.interval
+
+>>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 3), (0, 1), (2, 4)])
+>>> arr2 = pd.arrays.IntervalArray.from_tuples([(2, 4), (3, 4), (0, 5)])
+
+>>> result, counts = piso.interval.pairwise_symmetric_difference(arr1, arr2)
+>>> result
+<IntervalArray>
+[(0, 2], (3, 4], (0, 1], (3, 4], (0, 2], (4, 5]]
+Length: 6, dtype: interval[int64, right]
+
+>>> counts
+array([2, 2, 2])
+"""
+
+pairwise_union_docstring = pairwise_template_doc.format(
+    operation="union", pieces="one or two", examples=pairwise_union_examples
+)
+pairwise_intersection_docstring = pairwise_template_doc.format(
+    operation="intersection",
+    pieces="zero or one",
+    examples=pairwise_intersection_examples,
+)
+pairwise_difference_docstring = pairwise_template_doc.format(
+    operation="set difference",
+    pieces="zero, one or two",
+    examples=pairwise_difference_examples,
+)
+pairwise_symmetric_difference_docstring = pairwise_template_doc.format(
+    operation="symmetric difference",
+    pieces="zero, one or two",
+    examples=pairwise_symmetric_difference_examples,
+)
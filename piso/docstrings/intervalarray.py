@@ -102,6 +102,9 @@ Length: 0, closed: right, dtype: interval[int64]
 [(2.0, 5.0]]
 Length: 1, closed: right, dtype: interval[float64]
 
+>>> piso.intersection(arr, min_overlaps=[1, 2, 3], return_type="arrays")
+{1: (array([0]), array([6])), 2: (array([2]), array([5])), 3: (array([3]), array([4]))}
+
 Examples with *interval_arrays* not empty:
 
 >>> arr1 = pd.arrays.IntervalArray.from_tuples(
@@ -371,6 +374,16 @@ min_overlaps : int or "all", default "all"
     If supplied, must be done so as a keyword argument.
 """
 
+param_min_overlaps_intersection = """
+min_overlaps : int, "all", or list of these, default "all"
+    Specifies the minimum number of intervals which overlap in order to define an *intersection*.
+    If *min_overlaps* is an int then it must be no smaller than 2.  If *min_overlaps* is all then
+    an intersection is only defined where every interval overlaps.  If *min_overlaps* is a list
+    then the intersection for each element is calculated from a single depth profile, and returned
+    in a dictionary keyed by the elements.
+    If supplied, must be done so as a keyword argument.
+"""
+
 param_squeeze = """
 squeeze : boolean, default {default}
     If True, will try to coerce the return value to a single pandas.Interval.
@@ -378,8 +391,25 @@ squeeze : boolean, default {default}
 """
 
 param_return_type = """
-return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`}, default "infer"
-    If "infer" the return type will be the same as *interval_array*.
+return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, "arrays"}, default "infer"
+    If "infer" the return type will be the same as *interval_array*.  If "arrays" then a tuple of
+    :class:`numpy.ndarray`, containing the left and right endpoints, is returned and *squeeze* is ignored.
+    Timezone-aware endpoints are returned as UTC.
+    If supplied, must be done so as a keyword argument.
+"""
+
+param_validate = """
+validate : bool, optional
+    Whether to check that no interval has zero length.  Defaults to the ``validate`` option (see
+    :func:`piso.set_option`).  Only skip the check for intervals known to be valid.
+    If supplied, must be done so as a keyword argument.
+"""
+
+param_weights = """
+weights : array-like, optional
+    One non-negative value per interval of *interval_array*.  If supplied, the weights of overlapping intervals are summed,
+    and *min_overlaps* applies to this sum, where "all" is the sum of every weight.  Only supported
+    if *interval_arrays* is empty.
     If supplied, must be done so as a keyword argument.
 """
 
@@ -474,6 +504,7 @@ union_params = join_params(
         param_optional_args,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_validate,
     ]
 )
 union_docstring = operation_template_doc.format(
@@ -488,16 +519,18 @@ intersection_params = join_params(
     [
         param_interval_array.format(operation="intersection"),
         param_optional_args,
-        param_min_overlaps,
+        param_min_overlaps_intersection,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_validate,
+        param_weights,
     ]
 )
 intersection_docstring = operation_template_doc.format(
     operation="intersection",
     extra_desc="",
     params=intersection_params,
-    return_type=array_return_type,
+    return_type=array_return_type + ", or dict of these if *min_overlaps* is a list",
     examples=intersection_examples,
 )
 
@@ -507,6 +540,7 @@ difference_params = join_params(
         param_optional_args_min_one,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_validate,
     ]
 )
 difference_docstring = doc_difference_template.format(
@@ -525,6 +559,7 @@ symmetric_difference_params = join_params(
         param_min_overlaps,
         param_squeeze.format(default="False"),
         param_return_type,
+        param_validate,
     ]
 )
 symmetric_difference_extra_desc = """
@@ -555,6 +590,7 @@ isdisjoint_params = join_params(
     [
         param_interval_array.format(operation="isdisjoint"),
         param_optional_args,
+        param_validate,
     ]
 )
 isdisjoint_docstring = isdisjoint_doc.format(
@@ -570,6 +606,7 @@ issuperset_params = join_params(
         param_interval_sub_super_set,
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_validate,
     ]
 )
 issuperset_docstring = doc_is_sub_super_set_template.format(
@@ -585,6 +622,7 @@ issubset_params = join_params(
         param_interval_sub_super_set,
         param_optional_args_min_one,
         param_squeeze.format(default="True"),
+        param_validate,
     ]
 )
 issubset_docstring = doc_is_sub_super_set_template.format(
@@ -621,6 +659,11 @@ how : {"fraction", "sum"}, default "fraction"
 
     .. versionadded:: 0.8.0
 
+weights : array-like, optional
+    One non-negative value per interval of *interval_array*.  If supplied, the weights of overlapping intervals are summed,
+    and the result is the mean of this sum over the domain if *how* = "fraction", or its integral
+    over the domain if *how* = "sum".
+
 Returns
 -------
 float or :class:`pandas.Series`
@@ -680,6 +723,9 @@ domain : :py:class:`tuple`, :class:`pandas.Interval`, :class:`pandas.IntervalInd
     If *domain* is a tuple then it should specify lower and upper bounds, and be equivalent to a
     :class:`pandas.Interval`.  If *domain* is a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
     then the intervals it contains define a possibly disconnected domain.
+validate : bool, optional
+    Whether to check that no interval has zero length.  Defaults to the ``validate`` option (see
+    :func:`piso.set_option`).  Only skip the check for intervals known to be valid.
 
 Returns
 -------
@@ -776,6 +822,11 @@ the i-th interval contains the j-th point.
 If *result = "points"* then the result is a 1-dimensional boolean mask of length *n*.
 If *result = "intervals"* then the result is a 1-dimensional boolean mask of length *m*.
 
+The cartesian mask is calculated even if *result* is not "cartesian", unless its estimated size
+exceeds the ``max_dense_bytes`` option (see :func:`piso.set_option`), in which case the result is
+calculated by sorting instead.  If *result = "cartesian"* and the size is exceeded then a
+:class:`piso.DenseAllocationError` is raised.
+
 Parameters
 ----------
 interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
@@ -851,6 +902,9 @@ split_docstring = """
 Given a set of intervals, and break points, splits the intervals into pieces wherever
 the overlap a break point.
 
+If the estimated size of the dense arrays used to calculate the result exceeds the ``max_dense_bytes``
+option (see :func:`piso.set_option`) then the result is calculated by sorting instead.
+
 Parameters
 ----------
 interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
@@ -909,6 +963,9 @@ interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.Interval
 threshold : scalar
     The value should belong to the domain that arises from a subtraction over the domain of the intervals.
     For instance, if intervals are timestamp data, then *threshold* should be timedelta.
+validate : bool, optional
+    Whether to check that no interval has zero length.  Defaults to the ``validate`` option (see
+    :func:`piso.set_option`).  Only skip the check for intervals known to be valid.
 
 Returns
 -------
@@ -941,3 +998,74 @@ Length: 2, closed: right, dtype: interval[float64]
 [(0.0, 12.0]]
 Length: 1, closed: right, dtype: interval[float64]
 """
+
+
+depth_docstring = """
+Calculates the depth profile of a collection of intervals, that is, the number of intervals containing each point.
+
+The profile is a step function, returned as the points where its value may change, and its value
+between consecutive points.  Outside of the intervals the value is zero.  If more than one interval
+array is supplied then the value is the number of interval arrays containing each point, as used by
+:func:`piso.intersection` and :func:`piso.symmetric_difference`.  Several thresholds can therefore be
+applied to a single profile, rather than repeating these operations.
+
+Parameters
+----------
+interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+    Contains the (possibly overlapping) intervals.  May be left-closed or right-closed.
+*interval_arrays : argument list of :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+    May contain zero or more arguments.
+domain : tuple or :class:`pandas.Interval`, optional
+    If supplied, the profile is restricted to this domain, with breakpoints at its start and end.
+    If supplied, must be done so as a keyword argument.
+compress : bool, default False
+    If True, consecutive breakpoints between which the profile has the same value are merged.
+    If supplied, must be done so as a keyword argument.
+return_type : {"arrays", :class:`pandas.Series`}, default "arrays"
+    If :class:`pandas.Series` then the values are returned, indexed by a :class:`pandas.IntervalIndex`
+    of the gaps between consecutive breakpoints, with the same closed attribute as *interval_array*.
+    If supplied, must be done so as a keyword argument.
+weights : array-like, optional
+    One non-negative value per interval of *interval_array*.  If supplied, the value of the profile is the sum
+    of the weights of the intervals containing each point.  Only supported if *interval_arrays*
+    is empty.
+    If supplied, must be done so as a keyword argument.
+validate : bool, optional
+    Whether to check that no interval has zero length.  Defaults to the ``validate`` option (see
+    :func:`piso.set_option`).
+
+Returns
+-------
+tuple of :class:`numpy.ndarray`, or :class:`pandas.Series`
+    The sorted breakpoints, and the values between consecutive breakpoints, which has one fewer element.
+    Timezone-aware breakpoints are returned as UTC.
+
+Examples
+--------
+
+>>> import pandas as pd
+>>> import piso
+
+>>> arr = pd.arrays.IntervalArray.from_tuples(
+...     [(0, 4), (2, 5), (3, 6), (7, 8)],
+... )
+
+>>> piso.depth(arr)
+(array([0, 2, 3, 4, 5, 6, 7, 8]), array([1, 2, 3, 2, 1, 0, 1]))
+
+>>> piso.depth(arr, weights=[1.5, 2, 1, 0.5])
+(array([0, 2, 3, 4, 5, 6, 7, 8]), array([1.5, 3.5, 4.5, 3. , 1. , 0. , 0.5]))
+
+>>> piso.depth(arr, domain=(-2, 10), compress=True)
+(array([-2,  0,  2,  3,  4,  5,  6,  7,  8, 10]), array([0, 1, 2, 3, 2, 1, 0, 1, 0]))
+
+>>> piso.depth(arr, return_type=pd.Series)
+(0, 2]    1
+(2, 3]    2
+(3, 4]    3
+(4, 5]    2
+(5, 6]    1
+(6, 7]    0
+(7, 8]    1
+dtype: int64
+"""
@@ -0,0 +1,224 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from piso import _sweep
+from piso._exceptions import ClosedMismatchError
+from piso.intervalset import IntervalSet
+from piso.util import _arrays_to_interval_x, _validate_intervals
+
+# the coverage of each operand is a bit in an int64
+_MAX_OPERANDS = 62
+
+
+def _as_expr(obj):
+    if isinstance(obj, Expr):
+        return obj
+    return Operand(obj)
+
+
+class Expr(ABC):
+    """
+    Base class for lazy set operation expressions.
+
+    Set operations combined with the operators ``&`` (intersection), ``|`` (union), ``-`` (difference)
+    and ``^`` (symmetric difference) build an expression tree instead of being evaluated immediately.
+    When evaluated, the endpoints of every operand are merged in a single sweep which records the
+    operands covering each point, and the expression is calculated as a boolean formula over these
+    coverages.  No intermediate results are created.
+    """
+
+    def __and__(self, other):
+        return _BinaryExpr("&", np.logical_and, self, _as_expr(other))
+
+    def __or__(self, other):
+        return _BinaryExpr("|", np.logical_or, self, _as_expr(other))
+
+    def __sub__(self, other):
+        return _BinaryExpr("-", lambda x, y: x & ~y, self, _as_expr(other))
+
+    def __xor__(self, other):
+        return _BinaryExpr("^", np.logical_xor, self, _as_expr(other))
+
+    @abstractmethod
+    def _operands(self):
+        pass
+
+    @abstractmethod
+    def _compute(self, coverages):
+        pass
+
+    def evaluate(self, return_type="infer"):
+        """
+        Evaluates the expression.
+
+        Parameters
+        ----------
+        return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet`, "arrays"}, default "infer"
+            If "infer" the return type will be the same as the first operand in the expression.
+            See :func:`piso.expr.evaluate`.
+
+        Returns
+        -------
+        :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet` or tuple
+        """
+        return evaluate(self, return_type=return_type)
+
+
+class Operand(Expr):
+    """
+    A leaf of an expression, wrapping an interval array.
+
+    Parameters
+    ----------
+    interval_array : :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
+        Must be left-closed or right-closed.
+    """
+
+    def __init__(self, interval_array):
+        if isinstance(interval_array, Operand):
+            interval_array = interval_array.interval_array
+        if not isinstance(
+            interval_array, (pd.IntervalIndex, pd.arrays.IntervalArray, IntervalSet)
+        ):
+            raise ValueError(
+                f"Operands must be IntervalIndex, IntervalArray or IntervalSet.  Found {type(interval_array)}."
+            )
+        self.interval_array = interval_array
+
+    def __repr__(self):
+        return f"Operand({type(self.interval_array).__name__}, length={len(self.interval_array)})"
+
+    def _operands(self):
+        return [self]
+
+    def _compute(self, coverages):
+        return coverages[id(self.interval_array)]
+
+
+class _BinaryExpr(Expr):
+    def __init__(self, symbol, func, left, right):
+        self._symbol = symbol
+        self._func = func
+        self._left = left
+        self._right = right
+
+    def __repr__(self):
+        return f"({repr(self._left)} {self._symbol} {repr(self._right)})"
+
+    def _operands(self):
+        return self._left._operands() + self._right._operands()
+
+    def _compute(self, coverages):
+        return self._func(
+            self._left._compute(coverages), self._right._compute(coverages)
+        )
+
+
+def operands(*interval_arrays):
+    """
+    Wraps interval arrays as operands of a lazy expression.
+
+    Parameters
+    ----------
+    *interval_arrays : argument list of :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray` or :class:`piso.IntervalSet`
+
+    Returns
+    -------
+    :class:`piso.expr.Operand` or tuple of :class:`piso.expr.Operand`
+        A tuple is returned if more than one argument is supplied.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso.expr
+
+    >>> a = pd.arrays.IntervalArray.from_tuples([(0, 4), (5, 9)])
+    >>> b = pd.arrays.IntervalArray.from_tuples([(2, 6)])
+    >>> c = pd.arrays.IntervalArray.from_tuples([(1, 3)])
+    >>> d = pd.arrays.IntervalArray.from_tuples([(8, 10)])
+
+    >>> A, B, C, D = piso.expr.operands(a, b, c, d)
+    >>> expr = (A | B) - (C | D)
+    >>> expr.evaluate()
+    <IntervalArray>
+    [(0, 1], (3, 8]]
+    Length: 2, closed: right, dtype: interval[int64]
+    """
+    result = tuple(Operand(interval_array) for interval_array in interval_arrays)
+    return result[0] if len(result) == 1 else result
+
+
+def _get_unique_interval_arrays(expr):
+    unique = {}
+    for operand in expr._operands():
+        unique.setdefault(id(operand.interval_array), operand.interval_array)
+    return unique
+
+
+def _check_matched_closed(interval_arrays):
+    closed_values = {arr.closed for arr in interval_arrays if len(arr) > 0}
+    if len(closed_values) > 1:
+        raise ClosedMismatchError
+
+
+def evaluate(expr, return_type="infer"):
+    """
+    Evaluates a lazy expression of set operations in a single sweep.
+
+    Parameters
+    ----------
+    expr : :class:`piso.expr.Expr`
+        An expression built from :class:`piso.expr.Operand` with the operators ``&`` (intersection),
+        ``|`` (union), ``-`` (difference) and ``^`` (symmetric difference).
+    return_type : {"infer", :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet`, "arrays"}, default "infer"
+        If "infer" the return type will be the same as the first operand in the expression.
+        If "arrays" then a tuple of :class:`numpy.ndarray`, containing the left and right endpoints,
+        is returned.  Timezone-aware endpoints are returned as UTC.
+
+    Returns
+    -------
+    :class:`pandas.IntervalIndex`, :class:`pandas.arrays.IntervalArray`, :class:`piso.IntervalSet` or tuple
+    """
+    expr = _as_expr(expr)
+    interval_arrays = _get_unique_interval_arrays(expr)
+    if len(interval_arrays) > _MAX_OPERANDS:
+        raise ValueError(
+            f"Expressions may contain at most {_MAX_OPERANDS} distinct operands."
+        )
+    first = expr._operands()[0].interval_array
+    assert return_type in (
+        "infer",
+        pd.IntervalIndex,
+        pd.arrays.IntervalArray,
+        IntervalSet,
+        "arrays",
+    )
+    klass = first.__class__ if return_type == "infer" else return_type
+
+    _check_matched_closed(interval_arrays.values())
+    for arr in interval_arrays.values():
+        if not isinstance(arr, IntervalSet):
+            _validate_intervals(arr)
+    normalized = [
+        IntervalSet.from_intervals(arr).normalize() for arr in interval_arrays.values()
+    ]
+    closed = next(
+        (arr.closed for arr in normalized if len(arr) > 0), normalized[0].closed
+    )
+    subtype = IntervalSet.from_intervals(first)._subtype
+
+    # operand k contributes 2**k where it covers, so the sum identifies the covering operands
+    breaks, bits = _sweep._count_operands(
+        [(arr.lefts, arr.rights) for arr in normalized],
+        weights=[1 << k for k in range(len(normalized))],
+    )
+    coverages = {
+        key: (bits >> k) & 1 == 1 for k, key in enumerate(interval_arrays.keys())
+    }
+    lefts, rights = _sweep._mask_to_intervals(breaks, expr._compute(coverages))
+    if klass is IntervalSet:
+        return IntervalSet._from_normalized(lefts, rights, closed, subtype)
+    return _arrays_to_interval_x(lefts, rights, closed, klass, subtype, trusted=True)
@@ -4,9 +4,15 @@ import numpy as np
 import pandas as pd
 
 from piso.intervalarray import _validate_array_of_intervals_arrays
+from piso.util import _check_dense_bytes
 
 
 def _adj_mat_intersection(lefts, rights, closed, fill_diagonal=True):
+    # three boolean arrays are created by the outer comparisons, and two more if closed="both"
+    n = len(lefts)
+    _check_dense_bytes(
+        "adjacency_matrix", (n, n), (5 if closed == "both" else 3) * n * n
+    )
     result = np.greater.outer(rights, lefts) & np.less.outer(lefts, rights)
     if closed == "both":
         result = result | np.equal.outer(rights, lefts) | np.equal.outer(lefts, rights)
@@ -89,6 +95,10 @@ def adjacency_matrix(
 
     Note that the diagonal is defined with False values by default.
 
+    The result is calculated with dense arrays whose size is the square of the total number of intervals.
+    If their estimated size exceeds the ``max_dense_bytes`` option (see :func:`piso.set_option`) then a
+    :class:`piso.DenseAllocationError` is raised.
+
     Parameters
     ----------
     interval_array : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
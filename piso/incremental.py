@@ -0,0 +1,313 @@
+from threading import Lock
+
+import numpy as np
+
+from piso import _sweep
+from piso._exceptions import ClosedMismatchError
+from piso.intervalset import IntervalSet, _as_interval_set, _get_domain_arrays
+
+
+def _affected(lefts, rights, new_lefts, new_rights, adjacent=True):
+    # positions of the normalized intervals which overlap, or if adjacent is True are adjacent
+    # to, any of the normalized new intervals
+    starts = np.searchsorted(rights, new_lefts, side="left" if adjacent else "right")
+    stops = np.searchsorted(lefts, new_rights, side="right" if adjacent else "left")
+    counts = np.maximum(stops - starts, 0)
+    offsets = np.cumsum(counts) - counts
+    positions = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+    # consecutive new intervals may both touch the same existing interval
+    return np.unique(positions)
+
+
+def _common_dtype(lefts, rights, other):
+    dtype = np.result_type(lefts, other)
+    if dtype != lefts.dtype:
+        lefts, rights = lefts.astype(dtype), rights.astype(dtype)
+    return lefts, rights
+
+
+def _splice(lefts, rights, positions, new_lefts, new_rights):
+    # replaces the intervals at positions with new intervals, which must be disjoint from, and not
+    # adjacent to, the remaining intervals
+    lefts = np.delete(lefts, positions)
+    rights = np.delete(rights, positions)
+    insert_at = np.searchsorted(lefts, new_lefts)
+    return (
+        np.insert(lefts, insert_at, new_lefts),
+        np.insert(rights, insert_at, new_rights),
+    )
+
+
+def _length(lefts, rights):
+    return (rights - lefts).sum()
+
+
+class IncrementalUnion:
+    """
+    The union of a changing collection of intervals, maintained as sorted, disjoint intervals.
+
+    Adding or removing intervals does not recompute the union.  The intervals which overlap the
+    new intervals are found with binary searches, combined with them, and the result is spliced
+    into the existing endpoint arrays.  The total length of the union is updated by the change
+    in length.
+
+    Each version of the union is a :class:`piso.IntervalSet` whose endpoint arrays are never
+    modified.  Updates replace the current version, so a snapshot taken by a reader, such as
+    :meth:`piso.IncrementalUnion.snapshot` or :meth:`piso.IncrementalUnion.to_index`, is
+    consistent while another thread updates the union.  Updates from several threads are
+    applied one at a time.
+
+    Parameters
+    ----------
+    intervals : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`, optional
+        The initial intervals.  Must be left-closed or right-closed.
+    closed : {"left", "right"}, default "right"
+        Whether the intervals are closed on the left-side or right-side.  Ignored if *intervals*
+        is supplied, and not empty.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> union = piso.IncrementalUnion(
+    ...     pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    ... )
+    >>> union.add(pd.arrays.IntervalArray.from_tuples([(5, 6), (10, 11)]))
+    >>> union.to_index()
+    IntervalIndex([(0, 6], (7, 8], (10, 11]], dtype='interval[int64, right]')
+
+    >>> union.total_length
+    8
+
+    >>> union.coverage((0, 10))
+    0.7
+
+    >>> snapshot = union.snapshot()
+    >>> union.remove(pd.arrays.IntervalArray.from_tuples([(1, 2), (7, 8)]))
+    >>> union.clip((0, 5))
+    >>> union.to_index()
+    IntervalIndex([(0, 1], (2, 5]], dtype='interval[int64, right]')
+
+    >>> snapshot.to_index()
+    IntervalIndex([(0, 6], (7, 8], (10, 11]], dtype='interval[int64, right]')
+    """
+
+    def __init__(self, intervals=None, closed="right"):
+        if intervals is None:
+            interval_set = IntervalSet(np.array([]), np.array([]), closed=closed)
+        else:
+            interval_set = _as_interval_set(intervals).normalize()
+        interval_set.total_length  # calculated before the set is shared
+        # the current version, and the number of updates, are replaced together
+        self._state = (interval_set, 0)
+        self._lock = Lock()
+
+    def _replace(self, lefts, rights, total_length, subtype=None):
+        current, version = self._state
+        interval_set = IntervalSet._from_normalized(
+            lefts,
+            rights,
+            current.closed,
+            current._subtype if subtype is None else subtype,
+        )
+        interval_set._total_length = total_length
+        self._state = (interval_set, version + 1)
+
+    def _operand(self, intervals):
+        current = self._state[0]
+        other = _as_interval_set(intervals).normalize()
+        if len(other) > 0 and len(current) > 0 and other.closed != current.closed:
+            raise ClosedMismatchError
+        return current, other
+
+    def add(self, intervals):
+        """
+        Adds intervals to the union.
+
+        Parameters
+        ----------
+        intervals : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+            Must have the same closed attribute as the union, unless either is empty.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            current, new = self._operand(intervals)
+            if len(new) == 0:
+                return
+            if len(current) == 0:
+                self._state = (new, self._state[1] + 1)
+                return
+            lefts, rights = _common_dtype(current.lefts, current.rights, new.lefts)
+            positions = _affected(lefts, rights, new.lefts, new.rights)
+            merged_lefts, merged_rights = _sweep._normalize(
+                np.concatenate((lefts[positions], new.lefts)),
+                np.concatenate((rights[positions], new.rights)),
+            )
+            change = _length(merged_lefts, merged_rights) - _length(
+                lefts[positions], rights[positions]
+            )
+            lefts, rights = _splice(
+                lefts, rights, positions, merged_lefts, merged_rights
+            )
+            subtype = new._subtype if current._subtype is None else None
+            self._replace(lefts, rights, current.total_length + change, subtype)
+
+    def remove(self, intervals):
+        """
+        Removes intervals from the union, that is, replaces the union with a set difference.
+
+        Parameters
+        ----------
+        intervals : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+            Must have the same closed attribute as the union, unless either is empty.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            current, removed = self._operand(intervals)
+            if len(current) == 0 or len(removed) == 0:
+                return
+            lefts, rights = _common_dtype(current.lefts, current.rights, removed.lefts)
+            positions = _affected(
+                lefts, rights, removed.lefts, removed.rights, adjacent=False
+            )
+            if len(positions) == 0:
+                return
+            affected = (lefts[positions], rights[positions])
+            breaks, counts = _sweep._count_operands(
+                [affected, (removed.lefts, removed.rights)], weights=[1, 2]
+            )
+            # the remaining parts of the affected intervals are not adjacent to other intervals
+            kept_lefts, kept_rights = _sweep._mask_to_intervals(breaks, counts == 1)
+            change = _length(kept_lefts, kept_rights) - _length(*affected)
+            lefts, rights = _splice(lefts, rights, positions, kept_lefts, kept_rights)
+            self._replace(lefts, rights, current.total_length + change)
+
+    def clip(self, domain):
+        """
+        Restricts the union to a domain, that is, replaces the union with its intersection with the domain.
+
+        Parameters
+        ----------
+        domain : :py:class:`tuple` or :class:`pandas.Interval`
+            Specifies the domain.  The start must be less than the end.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            current = self._state[0]
+            if domain is None:
+                raise ValueError(
+                    "The domain parameter must be either a 2-tuple or pandas.Interval."
+                )
+            starts, ends = _get_domain_arrays(current, domain)
+            start, end = starts[0], ends[0]
+            if not start < end:
+                raise ValueError("The domain must have a start less than its end.")
+            if len(current) == 0:
+                return
+            lefts, rights = _common_dtype(current.lefts, current.rights, starts)
+            i = np.searchsorted(rights, start, side="right")
+            j = max(np.searchsorted(lefts, end, side="left"), i)
+            # the remaining intervals are copied, as the first and last may be shortened
+            lefts, rights = lefts[i:j].copy(), rights[i:j].copy()
+            if len(lefts) > 0:
+                lefts[0] = max(lefts[0], start)
+                rights[-1] = min(rights[-1], end)
+            self._replace(lefts, rights, _length(lefts, rights))
+
+    @property
+    def closed(self):
+        """Whether the intervals are closed on the left-side or right-side."""
+        return self._state[0].closed
+
+    @property
+    def interval_set(self):
+        """The current version of the union, as a normalized :class:`piso.IntervalSet`."""
+        return self._state[0]
+
+    @property
+    def version(self):
+        """The number of updates which have changed the union."""
+        return self._state[1]
+
+    @property
+    def total_length(self):
+        """The total length of the union."""
+        return self._state[0].total_length
+
+    def __len__(self):
+        return len(self._state[0])
+
+    def snapshot(self):
+        """
+        Returns the current version of the union, which is unaffected by later updates.
+
+        The endpoints are not copied.
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+            A normalized set.
+        """
+        return self._state[0]
+
+    def to_array(self):
+        """
+        Converts the union to a :class:`pandas.arrays.IntervalArray`.
+
+        Returns
+        -------
+        :class:`pandas.arrays.IntervalArray`
+        """
+        return self._state[0].to_array()
+
+    def to_index(self):
+        """
+        Converts the union to a :class:`pandas.IntervalIndex`.
+
+        The endpoints are not copied.
+
+        Returns
+        -------
+        :class:`pandas.IntervalIndex`
+        """
+        return self._state[0].to_index()
+
+    def coverage(self, domain=None):
+        """
+        Calculates the fraction of a domain covered by the union.
+
+        Parameters
+        ----------
+        domain : :py:class:`tuple` or :class:`pandas.Interval`, optional
+            Specifies the domain.  If None then the domain is the extremities of the union.
+
+        Returns
+        -------
+        float
+        """
+        interval_set = self._state[0]
+        if domain is None:
+            if len(interval_set) == 0:
+                return np.nan
+            return interval_set.total_length / (interval_set.max - interval_set.min)
+        starts, ends = _get_domain_arrays(interval_set, domain)
+        # the cumulative lengths are calculated once per version of the union
+        covered = _sweep._covered_length(
+            interval_set.lefts,
+            interval_set.rights,
+            starts,
+            ends,
+            interval_set._get_prefix_lengths(),
+        )
+        return covered[0] / (ends[0] - starts[0])
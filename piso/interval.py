@@ -8,108 +8,131 @@ from piso._exceptions import (
     ClosedValueError,
     DegenerateIntervalError,
 )
+from piso.util import (
+    _arrays_to_interval_x,
+    _interval_x_to_arrays,
+    _trusted_interval_x,
+    _validate_intervals,
+)
 
 
 def _validate_args(interval1, interval2):
+    closed = interval1.closed
     for obj in (interval1, interval2):
-        if obj.length == 0:
+        if obj.left == obj.right:
             raise DegenerateIntervalError(obj)
         if obj.closed not in {"left", "right"}:
             raise ClosedValueError(obj)
-    if interval1.closed != interval2.closed:
+    if interval2.closed != closed:
         raise ClosedMismatchError
+    return interval1.left, interval1.right, interval2.left, interval2.right
+
+
+def _box(pieces, closed, squeeze, return_type):
+    # pieces is a tuple of (left, right) tuples, converted to pandas objects if required
+    assert return_type in ("infer", "tuples")
+    if return_type == "tuples":
+        return pieces
+    if len(pieces) == 1 and squeeze:
+        return pd.Interval(*pieces[0], closed=closed)
+    # a single index gives the endpoints a common dtype, and the pieces need no validation
+    endpoints = pd.Index(
+        [x for piece in pieces for x in piece], dtype=_empty_dtype(pieces)
+    )
+    return _trusted_interval_x(
+        endpoints._values[::2],
+        endpoints._values[1::2],
+        closed,
+        pd.arrays.IntervalArray,
+    )
+
 
+def _empty_dtype(pieces):
+    # consistent with pandas, an empty interval array has an int64 subtype
+    return None if pieces else np.int64
 
-@Appender(docstrings.union_docstring, join="\n", indents=1)
-def union(interval1, interval2, squeeze=True):
-    _validate_args(interval1, interval2)
-    l1, r1 = interval1.left, interval1.right
-    l2, r2 = interval2.left, interval2.right
 
+def _union(l1, r1, l2, r2):
     if r1 < l2:
-        result = pd.arrays.IntervalArray([interval1, interval2])
-    elif r2 < l1:
-        result = pd.arrays.IntervalArray([interval2, interval1])
-    else:
-        result = pd.Interval(min(l1, l2), max(r1, r2), closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    return result
-
-
-@Appender(docstrings.intersection_docstring, join="\n", indents=1)
-def intersection(interval1, interval2, squeeze=True):
-    _validate_args(interval1, interval2)
-    l1, r1 = interval1.left, interval1.right
-    l2, r2 = interval2.left, interval2.right
+        return ((l1, r1), (l2, r2))
+    if r2 < l1:
+        return ((l2, r2), (l1, r1))
+    return ((min(l1, l2), max(r1, r2)),)
 
-    if r1 <= l2 or r2 <= l1:
-        result = pd.arrays.IntervalArray([], closed=interval1.closed)
-    else:
-        result = pd.Interval(max(l1, l2), min(r1, r2), closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    return result
 
+def _intersection(l1, r1, l2, r2):
+    if r1 <= l2 or r2 <= l1:
+        return ()
+    return ((max(l1, l2), min(r1, r2)),)
 
-@Appender(docstrings.difference_docstring, join="\n", indents=1)
-def difference(interval1, interval2, squeeze=True):
-    _validate_args(interval1, interval2)
-    l1, r1 = interval1.left, interval1.right
-    l2, r2 = interval2.left, interval2.right
 
+def _difference(l1, r1, l2, r2):
     if r1 <= l2 or r2 <= l1:
-        result = interval1
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    elif l2 <= l1 < r1 <= r2:
-        result = pd.arrays.IntervalArray([], closed=interval1.closed)
-    elif l1 < l2 < r2 < r1:
-        result = pd.arrays.IntervalArray.from_tuples(
-            [(l1, l2), (r2, r1)],
-            closed=interval1.closed,
-        )
-    elif l1 < l2:
-        result = pd.Interval(l1, l2, closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    else:  # r2 < l1
-        result = pd.Interval(r2, r1, closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    return result
-
-
-@Appender(docstrings.symmetric_difference_docstring, join="\n", indents=1)
-def symmetric_difference(interval1, interval2, squeeze=True):
-    _validate_args(interval1, interval2)
-    l1, r1 = interval1.left, interval1.right
-    l2, r2 = interval2.left, interval2.right
+        return ((l1, r1),)
+    if l2 <= l1 < r1 <= r2:
+        return ()
+    if l1 < l2 < r2 < r1:
+        return ((l1, l2), (r2, r1))
+    if l1 < l2:
+        return ((l1, l2),)
+    return ((r2, r1),)
 
+
+def _symmetric_difference(l1, r1, l2, r2):
     if r1 < l2:  # separated
-        result = pd.arrays.IntervalArray([interval1, interval2])
-    elif r2 < l1:  # separated
-        result = pd.arrays.IntervalArray([interval2, interval1])
-    elif r1 == l2 or r2 == l1:  # adjacent
-        result = pd.Interval(min(l1, l2), max(r1, r2), closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    elif l1 == l2 and r1 == r2:
-        result = pd.arrays.IntervalArray([], closed=interval1.closed)
-    elif l1 == l2:
-        result = pd.Interval(min(r1, r2), max(r1, r2), closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    elif r1 == r2:
-        result = pd.Interval(min(l1, l2), max(l1, l2), closed=interval1.closed)
-        if not squeeze:
-            result = pd.arrays.IntervalArray([result])
-    else:
-        result = pd.arrays.IntervalArray.from_tuples(
-            [(min(l1, l2), max(l1, l2)), (min(r1, r2), max(r1, r2))],
-            closed=interval1.closed,
-        )
-    return result
+        return ((l1, r1), (l2, r2))
+    if r2 < l1:  # separated
+        return ((l2, r2), (l1, r1))
+    if r1 == l2 or r2 == l1:  # adjacent
+        return ((min(l1, l2), max(r1, r2)),)
+    if l1 == l2 and r1 == r2:
+        return ()
+    if l1 == l2:
+        return ((min(r1, r2), max(r1, r2)),)
+    if r1 == r2:
+        return ((min(l1, l2), max(l1, l2)),)
+    return ((min(l1, l2), max(l1, l2)), (min(r1, r2), max(r1, r2)))
+
+
+def _make_operation(operation, docstring):
+    @Appender(docstring, join="\n", indents=1)
+    def func(interval1, interval2, squeeze=True, return_type="infer"):
+        pieces = operation(*_validate_args(interval1, interval2))
+        return _box(pieces, interval1.closed, squeeze, return_type)
+
+    return func
+
+
+union = _make_operation(_union, docstrings.union_docstring)
+intersection = _make_operation(_intersection, docstrings.intersection_docstring)
+difference = _make_operation(_difference, docstrings.difference_docstring)
+symmetric_difference = _make_operation(
+    _symmetric_difference, docstrings.symmetric_difference_docstring
+)
+
+
+def _is_interval_array(obj):
+    return isinstance(obj, (pd.IntervalIndex, pd.arrays.IntervalArray))
+
+
+def _naive_utc(x):
+    # timezone aware endpoints of interval arrays are naive UTC datetime64 values
+    if isinstance(x, pd.Timestamp) and x.tz is not None:
+        return x.tz_convert(None).to_datetime64()
+    return x
+
+
+def _get_endpoints(intervals):
+    # intervals is a pandas.Interval, or a sequence of them, or an interval array
+    if isinstance(intervals, pd.Interval):
+        return _naive_utc(intervals.left), _naive_utc(intervals.right)
+    if len(intervals) == 1 and _is_interval_array(intervals[0]):
+        intervals = intervals[0]
+    if _is_interval_array(intervals):
+        return _interval_x_to_arrays(intervals)
+    lefts = np.array([_naive_utc(i.left) for i in intervals])
+    rights = np.array([_naive_utc(i.right) for i in intervals])
+    return lefts, rights
 
 
 def _make_is_sub_or_superset(which, docstring):
@@ -120,12 +143,17 @@ def _make_is_sub_or_superset(which, docstring):
     @Appender(docstring, join="\n", indents=1)
     def func(interval, *intervals, squeeze=True):
         assert intervals
-        lefts = np.array([i.left for i in intervals])
-        rights = np.array([i.right for i in intervals])
+        left, right = _get_endpoints(interval)
+        lefts, rights = _get_endpoints(intervals)
+        pairwise = _is_interval_array(interval) and _is_interval_array(intervals[0])
+        if pairwise and len(left) != len(lefts):
+            raise ValueError(
+                f"Interval arrays must have equal length.  Found {len(left)} and {len(lefts)}."
+            )
 
         result = np.logical_and(
-            left_bound_comparator(interval.left, lefts),
-            right_bound_comparator(interval.right, rights),
+            left_bound_comparator(left, lefts),
+            right_bound_comparator(right, rights),
         )
 
         if len(result) == 1 and squeeze:
@@ -138,3 +166,98 @@ def _make_is_sub_or_superset(which, docstring):
 
 issuperset = _make_is_sub_or_superset("super", docstrings.issuperset_docstring)
 issubset = _make_is_sub_or_superset("sub", docstrings.issubset_docstring)
+
+
+def _validate_pairwise_args(interval_array1, interval_array2):
+    if len(interval_array1) != len(interval_array2):
+        raise ValueError(
+            f"Interval arrays must have equal length.  Found {len(interval_array1)} and {len(interval_array2)}."
+        )
+    for arr in (interval_array1, interval_array2):
+        _validate_intervals(arr)
+    if interval_array1.closed != interval_array2.closed:
+        raise ClosedMismatchError
+
+
+def _sorted_pair(l1, r1, l2, r2):
+    # the intervals of each pair, ordered by left endpoint
+    swap = l2 < l1
+    return (
+        np.where(swap, l2, l1),
+        np.where(swap, r2, r1),
+        np.where(swap, l1, l2),
+        np.where(swap, r1, r2),
+    )
+
+
+def _pairwise_union(l1, r1, l2, r2):
+    first_l, first_r, second_l, second_r = _sorted_pair(l1, r1, l2, r2)
+    merged = first_r >= second_l
+    first_r = np.where(merged, np.maximum(first_r, second_r), first_r)
+    return (first_l, first_r, np.ones_like(merged)), (second_l, second_r, ~merged)
+
+
+def _pairwise_intersection(l1, r1, l2, r2):
+    lefts, rights = np.maximum(l1, l2), np.minimum(r1, r2)
+    return ((lefts, rights, lefts < rights),)
+
+
+def _pairwise_difference(l1, r1, l2, r2):
+    before_rights = np.minimum(r1, l2)
+    after_lefts = np.maximum(l1, r2)
+    return (l1, before_rights, l1 < before_rights), (after_lefts, r1, after_lefts < r1)
+
+
+def _pairwise_symmetric_difference(l1, r1, l2, r2):
+    # disjoint pairs are treated as in a union, otherwise the pieces are either side of the overlap
+    (a_l, a_r, a_valid), (b_l, b_r, b_valid) = _pairwise_union(l1, r1, l2, r2)
+    overlapping = (l1 < r2) & (l2 < r1)
+    return (
+        (
+            np.where(overlapping, np.minimum(l1, l2), a_l),
+            np.where(overlapping, np.maximum(l1, l2), a_r),
+            np.where(overlapping, l1 != l2, a_valid),
+        ),
+        (
+            np.where(overlapping, np.minimum(r1, r2), b_l),
+            np.where(overlapping, np.maximum(r1, r2), b_r),
+            np.where(overlapping, r1 != r2, b_valid),
+        ),
+    )
+
+
+def _make_pairwise(operation, docstring):
+    @Appender(docstring, join="\n", indents=1)
+    def func(interval_array1, interval_array2):
+        _validate_pairwise_args(interval_array1, interval_array2)
+        pieces = operation(
+            *_interval_x_to_arrays(interval_array1),
+            *_interval_x_to_arrays(interval_array2),
+        )
+        # the pieces of each pair are consecutive, in the order of the pairs
+        lefts = np.stack([piece[0] for piece in pieces], axis=1)
+        rights = np.stack([piece[1] for piece in pieces], axis=1)
+        valid = np.stack([piece[2] for piece in pieces], axis=1)
+        result = _arrays_to_interval_x(
+            lefts[valid],
+            rights[valid],
+            interval_array1.closed,
+            interval_array1.__class__,
+            interval_array1.dtype.subtype,
+            trusted=True,
+        )
+        return result, valid.sum(axis=1)
+
+    return func
+
+
+pairwise_union = _make_pairwise(_pairwise_union, docstrings.pairwise_union_docstring)
+pairwise_intersection = _make_pairwise(
+    _pairwise_intersection, docstrings.pairwise_intersection_docstring
+)
+pairwise_difference = _make_pairwise(
+    _pairwise_difference, docstrings.pairwise_difference_docstring
+)
+pairwise_symmetric_difference = _make_pairwise(
+    _pairwise_symmetric_difference, docstrings.pairwise_symmetric_difference_docstring
+)
@@ -3,11 +3,18 @@ import pandas as pd
 import staircase as sc
 
 import piso.docstrings.intervalarray as docstrings
+from piso import _sweep, core
 from piso._decorators import Appender
+from piso._profiling import _profiled
 from piso.util import (
+    _arrays_to_interval_x,
     _boolean_stairs_to_interval_array,
+    _dense_bytes_exceeded,
+    _interval_x_to_arrays,
     _interval_x_to_stairs,
+    _to_values,
     _validate_intervals,
+    _validate_weights,
 )
 
 
@@ -17,21 +24,32 @@ def _check_matched_closed(interval_arrays):
         assert closed_values.count(closed_values[0]) == len(closed_values)
 
 
-def _validate_array_of_intervals_arrays(*interval_arrays, validate_intervals=True):
+def _validate_array_of_intervals_arrays(
+    *interval_arrays, validate_intervals=True, validate=None
+):
     assert len(interval_arrays) > 0
     _check_matched_closed(interval_arrays)
     if validate_intervals:
         for arr in interval_arrays:
-            _validate_intervals(arr)
+            _validate_intervals(arr, validate)
 
 
 def _get_return_type(interval_array, return_type):
-    assert return_type in ("infer", pd.IntervalIndex, pd.arrays.IntervalArray)
+    assert return_type in ("infer", pd.IntervalIndex, pd.arrays.IntervalArray, "arrays")
     return interval_array.__class__ if return_type == "infer" else return_type
 
 
-def _make_stairs(*interval_arrays):
-    if len(interval_arrays) == 1:
+def _num_operand_intervals(*interval_arrays, **kwargs):
+    return sum(len(arr) for arr in interval_arrays)
+
+
+@_profiled(size=_num_operand_intervals)
+def _make_stairs(*interval_arrays, weights=None):
+    if weights is not None:
+        if len(interval_arrays) != 1:
+            raise ValueError("weights are only supported for a single interval array.")
+        stairs = _interval_x_to_stairs(*interval_arrays, weights=weights)
+    elif len(interval_arrays) == 1:
         stairs = _interval_x_to_stairs(*interval_arrays)
     else:
         stairs = sc.sum(
@@ -41,12 +59,18 @@ def _make_stairs(*interval_arrays):
 
 
 @Appender(docstrings.union_docstring, join="\n", indents=1)
-def union(interval_array, *interval_arrays, squeeze=False, return_type="infer"):
-    _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
+def union(
+    interval_array, *interval_arrays, squeeze=False, return_type="infer", validate=None
+):
+    _validate_array_of_intervals_arrays(
+        interval_array, *interval_arrays, validate=validate
+    )
     klass = _get_return_type(interval_array, return_type)
     stairs = _make_stairs(interval_array, *interval_arrays)
-    result = _boolean_stairs_to_interval_array(stairs.make_boolean(), klass)
-    if squeeze and len(result) == 1:
+    result = _boolean_stairs_to_interval_array(
+        stairs.make_boolean(), klass, interval_array
+    )
+    if squeeze and klass != "arrays" and len(result) == 1:
         result = result[0]
     return result
 
@@ -58,39 +82,94 @@ def intersection(
     min_overlaps="all",
     squeeze=False,
     return_type="infer",
+    validate=None,
+    weights=None,
 ):
-    _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
+    _validate_array_of_intervals_arrays(
+        interval_array, *interval_arrays, validate=validate
+    )
     klass = _get_return_type(interval_array, return_type)
-    if min_overlaps == "all":
-        min_overlaps = (
-            len(interval_arrays) + 1 if interval_arrays else len(interval_array)
+    if weights is not None:
+        weights = _validate_weights(interval_array, weights)
+
+    def _get_threshold(min_overlaps):
+        if min_overlaps != "all":
+            return min_overlaps
+        if weights is not None:
+            return weights.sum()
+        return len(interval_arrays) + 1 if interval_arrays else len(interval_array)
+
+    def _squeeze(result):
+        if squeeze and klass != "arrays" and len(result) == 1:
+            result = result[0]
+        return result
+
+    if isinstance(min_overlaps, (list, tuple)):
+        return _intersection_thresholds(
+            interval_array,
+            *interval_arrays,
+            thresholds={k: _get_threshold(k) for k in min_overlaps},
+            klass=klass,
+            weights=weights,
+            squeeze=_squeeze,
         )
-    stairs = _make_stairs(interval_array, *interval_arrays)
-    result = _boolean_stairs_to_interval_array(stairs >= min_overlaps, klass)
-    if squeeze and len(result) == 1:
-        result = result[0]
-    return result
+    stairs = _make_stairs(interval_array, *interval_arrays, weights=weights)
+    result = _boolean_stairs_to_interval_array(
+        stairs >= _get_threshold(min_overlaps), klass, interval_array
+    )
+    return _squeeze(result)
+
+
+def _intersection_thresholds(
+    interval_array, *interval_arrays, thresholds, klass, weights, squeeze
+):
+    # every threshold is applied to the same depth profile, so only one sweep is required
+    breaks, values = _depth_profile(interval_array, *interval_arrays, weights=weights)
+    results = {}
+    for key, threshold in thresholds.items():
+        lefts, rights = _sweep._mask_to_intervals(breaks, values >= threshold)
+        result = _arrays_to_interval_x(
+            lefts,
+            rights,
+            interval_array.closed,
+            klass,
+            interval_array.dtype.subtype,
+            trusted=True,
+        )
+        results[key] = squeeze(result)
+    return results
 
 
 @Appender(docstrings.difference_docstring, join="\n", indents=1)
-def difference(interval_array, *interval_arrays, squeeze=False, return_type="infer"):
+def difference(
+    interval_array, *interval_arrays, squeeze=False, return_type="infer", validate=None
+):
     assert interval_arrays
-    _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
+    _validate_array_of_intervals_arrays(
+        interval_array, *interval_arrays, validate=validate
+    )
     klass = _get_return_type(interval_array, return_type)
     stairs_operand1 = _interval_x_to_stairs(interval_array)
     stairs_operand2 = _make_stairs(*interval_arrays)
     stairs = stairs_operand1 & (~stairs_operand2)
-    result = _boolean_stairs_to_interval_array(stairs, klass)
-    if squeeze and len(result) == 1:
+    result = _boolean_stairs_to_interval_array(stairs, klass, interval_array)
+    if squeeze and klass != "arrays" and len(result) == 1:
         result = result[0]
     return result
 
 
 @Appender(docstrings.symmetric_difference_docstring, join="\n", indents=1)
 def symmetric_difference(
-    interval_array, *interval_arrays, min_overlaps=2, squeeze=False, return_type="infer"
+    interval_array,
+    *interval_arrays,
+    min_overlaps=2,
+    squeeze=False,
+    return_type="infer",
+    validate=None,
 ):
-    _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
+    _validate_array_of_intervals_arrays(
+        interval_array, *interval_arrays, validate=validate
+    )
     klass = _get_return_type(interval_array, return_type)
     if min_overlaps == "all":
         min_overlaps = (
@@ -102,16 +181,19 @@ def symmetric_difference(
         stairs = stairs == 1
     else:
         stairs = (stairs >= 1) & (stairs <= min_overlaps - 1)
-    result = _boolean_stairs_to_interval_array(stairs, klass)
-    if squeeze and len(result) == 1:
+    result = _boolean_stairs_to_interval_array(stairs, klass, interval_array)
+    if squeeze and klass != "arrays" and len(result) == 1:
         result = result[0]
     return result
 
 
 @Appender(docstrings.isdisjoint_docstring, join="\n", indents=1)
-def isdisjoint(interval_array, *interval_arrays):
+def isdisjoint(interval_array, *interval_arrays, validate=None):
     _validate_array_of_intervals_arrays(
-        interval_array, *interval_arrays, validate_intervals=bool(interval_arrays)
+        interval_array,
+        *interval_arrays,
+        validate_intervals=bool(interval_arrays),
+        validate=validate,
     )
     if interval_arrays:
         stairs = _make_stairs(interval_array, *interval_arrays)
@@ -133,8 +215,10 @@ def _create_is_super_or_sub(which, docstring):
     comparator_func = {"superset": sc.Stairs.ge, "subset": sc.Stairs.le}[which]
 
     @Appender(docstring, join="\n", indents=1)
-    def func(interval_array, *interval_arrays, squeeze=True):
-        _validate_array_of_intervals_arrays(interval_array, *interval_arrays)
+    def func(interval_array, *interval_arrays, squeeze=True, validate=None):
+        _validate_array_of_intervals_arrays(
+            interval_array, *interval_arrays, validate=validate
+        )
         assert interval_arrays
         stepfunction = _interval_x_to_stairs(interval_array).make_boolean()
 
@@ -179,7 +263,7 @@ def _get_domain_tuple(interval_array, domain):
 
 
 @Appender(docstrings.coverage_docstring, join="\n", indents=1)
-def coverage(interval_array, domain=None, bins=False, how="fraction"):
+def coverage(interval_array, domain=None, bins=False, how="fraction", weights=None):
     assert how in ("fraction", "sum")
 
     def _validate_domain():
@@ -192,7 +276,11 @@ def coverage(interval_array, domain=None, bins=False, how="fraction"):
                 "If bins argument is true then domain parameter must represent disjoint intervals."
             )
 
-    stepfunction = _interval_x_to_stairs(interval_array).make_boolean()
+    if weights is None:
+        stepfunction = _interval_x_to_stairs(interval_array).make_boolean()
+    else:
+        weights = _validate_weights(interval_array, weights)
+        stepfunction = _interval_x_to_stairs(interval_array, weights=weights)
     if bins:
         _validate_domain()
         adjusted_domain = stepfunction.slice(pd.IntervalIndex(domain))
@@ -206,8 +294,8 @@ def coverage(interval_array, domain=None, bins=False, how="fraction"):
 
 
 @Appender(docstrings.complement_docstring, join="\n", indents=1)
-def complement(interval_array, domain=None):
-    _validate_intervals(interval_array)
+def complement(interval_array, domain=None, validate=None):
+    _validate_intervals(interval_array, validate)
     stepfunction = _interval_x_to_stairs(interval_array).invert()
     if isinstance(domain, (pd.IntervalIndex, pd.arrays.IntervalArray)):
         domain = _interval_x_to_stairs(domain)
@@ -215,27 +303,21 @@ def complement(interval_array, domain=None):
     else:
         domain = _get_domain_tuple(interval_array, domain)
         result = stepfunction.clip(*domain).fillna(0)
-    return _boolean_stairs_to_interval_array(result, interval_array.__class__)
+    return _boolean_stairs_to_interval_array(
+        result, interval_array.__class__, interval_array
+    )
 
 
 @Appender(docstrings.contains_docstring, join="\n", indents=1)
 def contains(interval_array, x, include_index=True, result="cartesian", how="any"):
-    assert result in ("cartesian", "intervals", "points")
-    assert how in ("any", "all")
-    starts = interval_array.left.values
-    ends = interval_array.right.values
     x = pd.Series(x).values
-    right_compare = (
-        np.less_equal if interval_array.closed in ("right", "both") else np.less
-    )
-    left_compare = (
-        np.greater_equal if interval_array.closed in ("left", "both") else np.greater
+    calc = core.contains(
+        _interval_x_to_arrays(interval_array),
+        x,
+        closed=interval_array.closed,
+        result=result,
+        how=how,
     )
-    calc = (right_compare.outer(x, ends) & left_compare.outer(x, starts)).transpose()
-    if result != "cartesian":
-        logical_method = np.logical_or if how == "any" else np.logical_and
-        axis = 0 if result == "points" else 1
-        calc = logical_method.reduce(calc, axis=axis)
     if include_index:
         if result == "cartesian":
             calc = pd.DataFrame(calc, index=interval_array, columns=x)
@@ -245,9 +327,27 @@ def contains(interval_array, x, include_index=True, result="cartesian", how="any
     return calc
 
 
+def _split_sweep(interval_array, x):
+    lefts, rights = core.split(_interval_x_to_arrays(interval_array), x)
+    # numeric results are floats, consistent with the dense implementation which introduces nans
+    if lefts.dtype.kind in "iuf":
+        lefts, rights = lefts.astype(float), rights.astype(float)
+    return _arrays_to_interval_x(
+        lefts,
+        rights,
+        interval_array.closed,
+        interval_array.__class__,
+        interval_array.dtype.subtype,
+        trusted=True,
+    )
+
+
 @Appender(docstrings.split_docstring, join="\n", indents=1)
 def split(interval_array, x):
     x = pd.Series(sorted(set(x))).values  # converting to numpy array will not work
+    # boolean arrays for contains, and float arrays for the breakpoints
+    if _dense_bytes_exceeded(19 * len(interval_array) * len(x)):
+        return _split_sweep(interval_array, x)
     contained = contains(interval_array.set_closed("neither"), x, include_index=False)
 
     none = np.nan
@@ -272,10 +372,63 @@ def split(interval_array, x):
 
 
 @Appender(docstrings.bridge_docstring, join="\n", indents=1)
-def bridge(interval_array, threshold):
+def bridge(interval_array, threshold, validate=None):
     # interval_array validation will occur in union and complement methods
-    complement_ = complement(union(interval_array))
+    complement_ = complement(
+        union(interval_array, validate=validate), validate=validate
+    )
     return complement(
         complement_[complement_.length > threshold],
         (interval_array.left.min(), interval_array.right.max()),
+        validate=validate,
+    )
+
+
+def _depth_profile(interval_array, *interval_arrays, weights=None):
+    if interval_arrays:
+        if weights is not None:
+            raise ValueError("weights are only supported for a single interval array.")
+        # each operand counts once, consistent with _make_stairs
+        operands = [
+            _sweep._normalize(*_interval_x_to_arrays(arr))
+            for arr in (interval_array, *interval_arrays)
+        ]
+        return _sweep._count_operands(operands)
+    if weights is not None:
+        weights = _validate_weights(interval_array, weights)
+    return _sweep._depth(*_interval_x_to_arrays(interval_array), weights)
+
+
+@Appender(docstrings.depth_docstring, join="\n", indents=1)
+def depth(
+    interval_array,
+    *interval_arrays,
+    domain=None,
+    compress=False,
+    return_type="arrays",
+    weights=None,
+    validate=None,
+):
+    assert return_type in ("arrays", pd.Series)
+    _validate_array_of_intervals_arrays(
+        interval_array, *interval_arrays, validate=validate
+    )
+    breaks, values = _depth_profile(interval_array, *interval_arrays, weights=weights)
+    if domain is not None:
+        start, end = _to_values(_get_domain_tuple(interval_array, domain))
+        if not start < end:
+            raise ValueError("The domain must have a start less than its end.")
+        breaks, values = _sweep._restrict_profile(breaks, values, start, end)
+    if compress:
+        breaks, values = _sweep._compress_profile(breaks, values)
+    if return_type == "arrays":
+        return breaks, values
+    index = _arrays_to_interval_x(
+        breaks[:-1],
+        breaks[1:],
+        interval_array.closed,
+        pd.IntervalIndex,
+        interval_array.dtype.subtype,
+        trusted=True,
     )
+    return pd.Series(values, index=index)
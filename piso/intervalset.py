@@ -0,0 +1,563 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from piso import _sweep
+from piso._exceptions import (
+    ClosedMismatchError,
+    ClosedValueError,
+    DegenerateIntervalError,
+)
+from piso.util import _arrays_to_interval_x, _interval_x_to_arrays, _to_values
+
+
+def _as_interval_set(obj):
+    if isinstance(obj, IntervalSet):
+        return obj
+    if isinstance(obj, (pd.IntervalIndex, pd.arrays.IntervalArray)):
+        return IntervalSet.from_intervals(obj)
+    raise ValueError(
+        f"Expected an IntervalSet, IntervalIndex or IntervalArray.  Found {type(obj)}."
+    )
+
+
+def _get_domain_arrays(interval_set, domain):
+    if domain is None:
+        if len(interval_set) == 0:
+            return interval_set.lefts[:0], interval_set.rights[:0]
+        domain = (interval_set.min, interval_set.max)
+    elif isinstance(domain, pd.Interval):
+        domain = (domain.left, domain.right)
+    elif not isinstance(domain, tuple) or len(domain) != 2:
+        raise ValueError(
+            "The domain parameter must be either a 2-tuple, pandas.Interval, or None."
+        )
+    return _to_values([domain[0]]), _to_values([domain[1]])
+
+
+def _describe_intervals(lefts, rights, mask):
+    # the first few of the intervals selected by mask, for error messages
+    return list(zip(lefts[mask][:5].tolist(), rights[mask][:5].tolist()))
+
+
+# files of a saved IntervalSet, besides metadata.json
+_STORE_ARRAYS = ("lefts", "rights", "prefix_lengths")
+_STORE_VERSION = 1
+
+
+class IntervalSet:
+    """
+    A set of intervals backed by two numpy arrays of endpoints.
+
+    Facts about the intervals, such as whether they are sorted or disjoint, are calculated at most
+    once and cached.  The results of set operations are sorted and disjoint, which is recorded
+    so that subsequent operations need not re-derive it.  Set operations are calculated with a
+    single sweep over the merged endpoints of the operands.
+
+    Parameters
+    ----------
+    lefts : array-like
+        The left endpoints of the intervals.
+    rights : array-like
+        The right endpoints of the intervals.
+    closed : {"left", "right"}, default "right"
+        Whether the intervals are closed on the left-side or right-side.
+    subtype : dtype, optional
+        The dtype of the endpoints when converted to pandas objects.  Only required to
+        recover timezones, as timezone aware endpoints are stored as UTC.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> interval_set = piso.IntervalSet.from_intervals(arr)
+    >>> interval_set.is_disjoint
+    False
+
+    >>> interval_set.total_length
+    6
+
+    >>> other = piso.IntervalSet.from_intervals(
+    ...     pd.arrays.IntervalArray.from_tuples([(3, 7)])
+    ... )
+    >>> (interval_set | other).to_array()
+    <IntervalArray>
+    [(0, 8]]
+    Length: 1, closed: right, dtype: interval[int64, right]
+
+    >>> (interval_set - other).to_index()
+    IntervalIndex([(0, 3], (7, 8]], dtype='interval[int64, right]')
+    """
+
+    def __init__(self, lefts, rights, closed="right", subtype=None):
+        self._init(lefts, rights, closed, subtype)
+        # missing endpoints compare as False, and are also rejected
+        invalid = ~(self._lefts < self._rights)
+        if invalid.any():
+            degenerate = self._lefts == self._rights
+            if (invalid & ~degenerate).any():
+                raise ValueError(
+                    "The left endpoint of each interval must be less than the right endpoint.  "
+                    f"Found {_describe_intervals(self._lefts, self._rights, invalid & ~degenerate)}."
+                )
+            raise DegenerateIntervalError(
+                _describe_intervals(self._lefts, self._rights, degenerate)
+            )
+
+    def _init(self, lefts, rights, closed, subtype):
+        self._lefts = np.asarray(lefts)
+        self._rights = np.asarray(rights)
+        self._closed = closed
+        self._subtype = subtype
+        if self._lefts.ndim != 1 or self._lefts.shape != self._rights.shape:
+            raise ValueError(
+                "lefts and rights must be one-dimensional and of equal length."
+            )
+        if closed not in ("left", "right"):
+            raise ClosedValueError(self)
+        self._is_sorted = None
+        self._is_disjoint = None
+        self._normalized = None
+        self._total_length = None
+        self._prefix_lengths = None
+
+    @classmethod
+    def from_intervals(cls, interval_array):
+        """
+        Creates an IntervalSet from an :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`.
+
+        The endpoints are not copied where possible.
+
+        Parameters
+        ----------
+        interval_array : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+            Must be left-closed or right-closed.
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        if isinstance(interval_array, IntervalSet):
+            return interval_array
+        lefts, rights = _interval_x_to_arrays(interval_array)
+        return cls(
+            lefts,
+            rights,
+            closed=interval_array.closed,
+            subtype=interval_array.dtype.subtype,
+        )
+
+    @classmethod
+    def _from_normalized(cls, lefts, rights, closed, subtype):
+        # the results of sweeps are valid, so the endpoints are not checked
+        interval_set = cls.__new__(cls)
+        interval_set._init(lefts, rights, closed, subtype)
+        interval_set._is_sorted = True
+        interval_set._is_disjoint = True
+        interval_set._normalized = interval_set
+        return interval_set
+
+    @classmethod
+    def open(cls, path, mmap=True):
+        """
+        Opens an IntervalSet saved with :meth:`piso.IntervalSet.save`.
+
+        The endpoints are already sorted and disjoint, and are not validated.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The directory the set was saved to.
+        mmap : bool, default True
+            If True the arrays are memory-mapped read-only, rather than read into memory, so they
+            are loaded on demand and shared between processes through the operating system's page
+            cache.
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+            A normalized set.
+        """
+        with open(os.path.join(path, "metadata.json")) as f:
+            metadata = json.load(f)
+        if metadata["version"] != _STORE_VERSION:
+            raise ValueError(
+                f"Unsupported IntervalSet store version {metadata['version']}."
+            )
+        mmap_mode = "r" if mmap else None
+        lefts, rights, prefix = (
+            np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in _STORE_ARRAYS
+        )
+        subtype = metadata["subtype"]
+        interval_set = cls._from_normalized(
+            lefts,
+            rights,
+            metadata["closed"],
+            None if subtype is None else pd.api.types.pandas_dtype(subtype),
+        )
+        interval_set._prefix_lengths = prefix
+        interval_set._total_length = prefix[-1]
+        return interval_set
+
+    def save(self, path):
+        """
+        Saves the normalized set to a directory, to be opened with :meth:`piso.IntervalSet.open`.
+
+        The sorted, disjoint endpoints and the cumulative lengths of the intervals are written as
+        ``.npy`` files, which can be memory-mapped, alongside a ``metadata.json`` file.  Existing
+        files in the directory are overwritten.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The directory to save to.  It is created if it does not exist.
+
+        Returns
+        -------
+        None
+        """
+        normalized = self.normalize()
+        os.makedirs(path, exist_ok=True)
+        arrays = (normalized.lefts, normalized.rights, normalized._get_prefix_lengths())
+        for name, arr in zip(_STORE_ARRAYS, arrays):
+            np.save(os.path.join(path, f"{name}.npy"), arr, allow_pickle=False)
+        metadata = {
+            "version": _STORE_VERSION,
+            "closed": self._closed,
+            "subtype": None if self._subtype is None else str(self._subtype),
+        }
+        with open(os.path.join(path, "metadata.json"), "w") as f:
+            json.dump(metadata, f)
+
+    def _get_prefix_lengths(self):
+        # only meaningful for normalized sets
+        if self._prefix_lengths is None:
+            self._prefix_lengths = _sweep._prefix_lengths(self._lefts, self._rights)
+        return self._prefix_lengths
+
+    @property
+    def lefts(self):
+        """The left endpoints, as a :class:`numpy.ndarray`."""
+        return self._lefts
+
+    @property
+    def rights(self):
+        """The right endpoints, as a :class:`numpy.ndarray`."""
+        return self._rights
+
+    @property
+    def closed(self):
+        """Whether the intervals are closed on the left-side or right-side."""
+        return self._closed
+
+    @property
+    def is_sorted(self):
+        """Whether the intervals are sorted by their left endpoints."""
+        if self._is_sorted is None:
+            self._is_sorted = _sweep._is_sorted(self._lefts)
+        return self._is_sorted
+
+    @property
+    def is_disjoint(self):
+        """Whether the intervals are pairwise disjoint."""
+        if self._is_disjoint is None:
+            lefts, rights = self._lefts, self._rights
+            if not self.is_sorted:
+                lefts, rights = _sweep._sort_by_left(lefts, rights)
+            self._is_disjoint = _sweep._is_disjoint(lefts, rights)
+        return self._is_disjoint
+
+    @property
+    def total_length(self):
+        """The total length of the set, that is, of the union of the intervals."""
+        if self._total_length is None:
+            normalized = self.normalize()
+            self._total_length = (normalized.rights - normalized.lefts).sum()
+        return self._total_length
+
+    @property
+    def min(self):
+        """The smallest left endpoint, or None if the set is empty."""
+        if len(self) == 0:
+            return None
+        return self._lefts[0] if self.is_sorted else self._lefts.min()
+
+    @property
+    def max(self):
+        """The largest right endpoint, or None if the set is empty."""
+        if len(self) == 0:
+            return None
+        return self.normalize().rights[-1]
+
+    def __len__(self):
+        return len(self._lefts)
+
+    def __repr__(self):
+        def _format(lefts, rights):
+            return [
+                str(interval)
+                for interval in _arrays_to_interval_x(
+                    lefts, rights, self._closed, pd.arrays.IntervalArray, self._subtype
+                )
+            ]
+
+        if len(self) > 10:
+            intervals = (
+                _format(self._lefts[:5], self._rights[:5])
+                + ["..."]
+                + _format(self._lefts[-5:], self._rights[-5:])
+            )
+        else:
+            intervals = _format(self._lefts, self._rights)
+        return "\n".join(
+            [
+                "<IntervalSet>",
+                f"[{', '.join(intervals)}]",
+                f"Length: {len(self)}, closed: {self._closed}",
+            ]
+        )
+
+    def to_array(self):
+        """
+        Converts to a :class:`pandas.arrays.IntervalArray`.
+
+        Returns
+        -------
+        :class:`pandas.arrays.IntervalArray`
+        """
+        return _arrays_to_interval_x(
+            self._lefts,
+            self._rights,
+            self._closed,
+            pd.arrays.IntervalArray,
+            self._subtype,
+            trusted=self._normalized is self,
+        )
+
+    def to_index(self):
+        """
+        Converts to a :class:`pandas.IntervalIndex`.
+
+        Returns
+        -------
+        :class:`pandas.IntervalIndex`
+        """
+        return _arrays_to_interval_x(
+            self._lefts,
+            self._rights,
+            self._closed,
+            pd.IntervalIndex,
+            self._subtype,
+            trusted=self._normalized is self,
+        )
+
+    def normalize(self):
+        """
+        Returns the equivalent set of sorted, disjoint and non-adjacent intervals.
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        if self._normalized is None:
+            lefts, rights = _sweep._normalize(
+                self._lefts, self._rights, is_sorted=bool(self._is_sorted)
+            )
+            self._normalized = IntervalSet._from_normalized(
+                lefts, rights, self._closed, self._subtype
+            )
+        return self._normalized
+
+    def _normalized_operands(self, others):
+        others = [_as_interval_set(other) for other in others]
+        for other in others:
+            if other.closed != self.closed and len(other) > 0 and len(self) > 0:
+                raise ClosedMismatchError
+        return [
+            (operand.lefts, operand.rights)
+            for operand in (self.normalize(), *[other.normalize() for other in others])
+        ]
+
+    def _from_mask(self, breaks, mask):
+        lefts, rights = _sweep._mask_to_intervals(breaks, mask)
+        return IntervalSet._from_normalized(lefts, rights, self._closed, self._subtype)
+
+    def union(self, *others):
+        """
+        Returns the union of this set with other sets.
+
+        Parameters
+        ----------
+        *others : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        if not others:
+            return self.normalize()
+        breaks, counts = _sweep._count_operands(self._normalized_operands(others))
+        return self._from_mask(breaks, counts >= 1)
+
+    def intersection(self, *others):
+        """
+        Returns the intersection of this set with other sets.
+
+        Parameters
+        ----------
+        *others : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        operands = self._normalized_operands(others)
+        breaks, counts = _sweep._count_operands(operands)
+        return self._from_mask(breaks, counts == len(operands))
+
+    def difference(self, *others):
+        """
+        Returns the set difference of this set and the union of other sets.
+
+        Parameters
+        ----------
+        *others : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        if not others:
+            return self.normalize()
+        operand, *rest = self._normalized_operands(others)
+        others_union = _sweep._normalize(
+            np.concatenate([lefts for lefts, _ in rest]),
+            np.concatenate([rights for _, rights in rest]),
+        )
+        breaks, counts = _sweep._count_operands([operand, others_union], weights=[1, 2])
+        return self._from_mask(breaks, counts == 1)
+
+    def symmetric_difference(self, *others):
+        """
+        Returns the points contained in exactly one of this set and other sets.
+
+        Parameters
+        ----------
+        *others : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        breaks, counts = _sweep._count_operands(self._normalized_operands(others))
+        return self._from_mask(breaks, counts == 1)
+
+    def complement(self, domain=None):
+        """
+        Returns the complement of this set over a domain.
+
+        Parameters
+        ----------
+        domain : :py:class:`tuple` or :class:`pandas.Interval`, optional
+            Specifies the domain.  If None then the domain is the extremities of the set.
+
+        Returns
+        -------
+        :class:`piso.IntervalSet`
+        """
+        domain = _get_domain_arrays(self, domain)
+        breaks, counts = _sweep._count_operands(
+            [self._normalized_operands([])[0], domain], weights=[2, 1]
+        )
+        return self._from_mask(breaks, counts == 1)
+
+    def isdisjoint(self, other):
+        """
+        Indicates whether this set has no points in common with another set.
+
+        Parameters
+        ----------
+        other : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        bool
+        """
+        return len(self.intersection(other)) == 0
+
+    def issuperset(self, other):
+        """
+        Indicates whether this set contains every point of another set.
+
+        Parameters
+        ----------
+        other : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        bool
+        """
+        return len(_as_interval_set(other).difference(self)) == 0
+
+    def issubset(self, other):
+        """
+        Indicates whether every point of this set is contained in another set.
+
+        Parameters
+        ----------
+        other : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        bool
+        """
+        return len(self.difference(other)) == 0
+
+    def equals(self, other):
+        """
+        Indicates whether this set contains exactly the same points as another set.
+
+        Parameters
+        ----------
+        other : :class:`piso.IntervalSet`, :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+        Returns
+        -------
+        bool
+        """
+        this, that = self._normalized_operands([other])
+        return np.array_equal(this[0], that[0]) and np.array_equal(this[1], that[1])
+
+    def contains(self, x):
+        """
+        Indicates whether each of an array of points is contained in the set.
+
+        Parameters
+        ----------
+        x : scalar or array-like of scalars
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Boolean valued.
+        """
+        normalized = self.normalize()
+        x = _to_values(x)
+        if len(normalized) == 0:
+            return np.zeros(len(x), dtype=bool)
+        side = "right" if self._closed == "left" else "left"
+        indices = np.searchsorted(normalized.lefts, x, side=side) - 1
+        rights = normalized.rights[np.maximum(indices, 0)]
+        inside = x < rights if self._closed == "left" else x <= rights
+        return (indices >= 0) & inside
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
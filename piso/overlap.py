@@ -0,0 +1,144 @@
+import numpy as np
+
+from piso.interval import _validate_pairwise_args
+from piso.intervalarray import _validate_array_of_intervals_arrays
+from piso.util import _interval_x_to_arrays
+
+
+def _overlap_lengths(l1, r1, l2, r2):
+    lengths = np.minimum(r1, r2) - np.maximum(l1, l2)
+    return np.maximum(lengths, np.zeros(1, dtype=lengths.dtype))
+
+
+def overlap_length(interval_array1, interval_array2):
+    """
+    Calculates the length of the intersection of each pair of intervals from two interval arrays.
+
+    Parameters
+    ----------
+    interval_array1 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        The first operands.
+    interval_array2 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        The second operands.  Must have the same length, and closed attribute, as *interval_array1*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Zero for pairs which do not overlap.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> arr2 = pd.arrays.IntervalArray.from_tuples([(1, 3), (3, 9), (0, 6)])
+    >>> piso.overlap_length(arr1, arr2)
+    array([2, 2, 0])
+    """
+    _validate_pairwise_args(interval_array1, interval_array2)
+    return _overlap_lengths(
+        *_interval_x_to_arrays(interval_array1),
+        *_interval_x_to_arrays(interval_array2),
+    )
+
+
+def iou(interval_array1, interval_array2):
+    """
+    Calculates the intersection over union of each pair of intervals from two interval arrays.
+
+    Parameters
+    ----------
+    interval_array1 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        The first operands.
+    interval_array2 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        The second operands.  Must have the same length, and closed attribute, as *interval_array1*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Float valued, between 0 and 1.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> arr2 = pd.arrays.IntervalArray.from_tuples([(1, 3), (3, 9), (0, 6)])
+    >>> piso.iou(arr1, arr2)
+    array([0.5       , 0.28571429, 0.        ])
+    """
+    _validate_pairwise_args(interval_array1, interval_array2)
+    l1, r1 = _interval_x_to_arrays(interval_array1)
+    l2, r2 = _interval_x_to_arrays(interval_array2)
+    overlaps = _overlap_lengths(l1, r1, l2, r2)
+    return overlaps / ((r1 - l1) + (r2 - l2) - overlaps)
+
+
+def _ranges(starts, stops):
+    # the positions i, and the concatenation of range(starts[i], stops[i]), for each i
+    counts = np.maximum(stops - starts, 0)
+    positions = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.cumsum(counts) - counts
+    return positions, np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+
+
+def _starting_within(l1, r1, l2, order2):
+    # pairs (i, j) where the j-th interval of the second operand starts in [l1[i], r1[i])
+    sorted_l2 = l2[order2]
+    i, k = _ranges(
+        np.searchsorted(sorted_l2, l1, side="left"),
+        np.searchsorted(sorted_l2, r1, side="left"),
+    )
+    return i, order2[k]
+
+
+def overlap_pairs(interval_array1, interval_array2):
+    """
+    Finds every pair of overlapping intervals from two interval arrays, and the length of their overlap.
+
+    The pairs are found by sorting and binary searches, rather than by comparing every pair of
+    intervals, so the time and memory required are proportional to the number of overlapping pairs
+    rather than the product of the lengths of the arrays.  The result is a sparse, coordinate
+    format, version of an overlap matrix.
+
+    Parameters
+    ----------
+    interval_array1 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        Must be left-closed or right-closed.
+    interval_array2 : :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        Must have the same closed attribute as *interval_array1*.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        The positions of the intervals in *interval_array1*, the positions of the intervals in
+        *interval_array2*, and the lengths of their overlaps.  Sorted by position in
+        *interval_array1*, then by position in *interval_array2*.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr1 = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> arr2 = pd.arrays.IntervalArray.from_tuples([(1, 3), (3, 9)])
+    >>> piso.overlap_pairs(arr1, arr2)
+    (array([0, 0, 1, 1, 2]), array([0, 1, 0, 1, 1]), array([2, 1, 1, 2, 1]))
+    """
+    _validate_array_of_intervals_arrays(interval_array1, interval_array2)
+    l1, r1 = _interval_x_to_arrays(interval_array1)
+    l2, r2 = _interval_x_to_arrays(interval_array2)
+    # intervals overlap if and only if one starts within the other, where ties go to the first
+    i1, j1 = _starting_within(l1, r1, l2, np.argsort(l2, kind="stable"))
+    j2, i2 = _starting_within(l2, r2, l1, np.argsort(l1, kind="stable"))
+    strictly_after = l1[i2] > l2[j2]
+    i = np.concatenate((i1, i2[strictly_after]))
+    j = np.concatenate((j1, j2[strictly_after]))
+    order = np.lexsort((j, i))
+    i, j = i[order], j[order]
+    return i, j, _overlap_lengths(l1[i], r1[i], l2[j], r2[j])
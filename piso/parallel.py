@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+
+def _get_intervals(frame, column):
+    if column is None:
+        if not isinstance(frame.index, pd.IntervalIndex):
+            raise ValueError(
+                "DataFrame must be indexed by an IntervalIndex if column is not specified."
+            )
+        return frame.index
+    intervals = frame[column].array
+    if not isinstance(intervals, pd.arrays.IntervalArray):
+        raise ValueError(f"Column {repr(column)} must have an interval dtype.")
+    return intervals
+
+
+def _make_batches(indices, batch_size):
+    # consecutive groups are collected until their combined size reaches batch_size
+    batches, batch, batch_len = [], [], 0
+    for key, positions in indices.items():
+        batch.append((key, positions))
+        batch_len += len(positions)
+        if batch_len >= batch_size:
+            batches.append(batch)
+            batch, batch_len = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _make_key_index(keys, by):
+    if isinstance(by, list) and len(by) > 1:
+        return pd.MultiIndex.from_tuples(keys, names=by)
+    if isinstance(by, list):
+        keys = [key[0] if isinstance(key, tuple) else key for key in keys]
+        by = by[0]
+    return pd.Index(keys, name=by)
+
+
+def _is_interval_array(obj):
+    return isinstance(obj, (pd.IntervalIndex, pd.arrays.IntervalArray))
+
+
+def _combine_interval_arrays(keys, results, by):
+    closed = results[0].closed
+    lefts = pd.Index(results[0].left).append([pd.Index(r.left) for r in results[1:]])
+    rights = pd.Index(results[0].right).append([pd.Index(r.right) for r in results[1:]])
+    index = pd.IntervalIndex.from_arrays(lefts, rights, closed=closed)
+    key_index = _make_key_index(keys, by).repeat([len(r) for r in results])
+    return key_index.to_frame(index=False).set_axis(index)
+
+
+def _combine(keys, results, by):
+    if all(_is_interval_array(result) for result in results):
+        return _combine_interval_arrays(keys, results, by)
+    key_index = _make_key_index(keys, by)
+    if all(isinstance(result, (pd.Series, pd.DataFrame)) for result in results):
+        return pd.concat(results, keys=key_index, names=key_index.names)
+    return pd.Series(results, index=key_index)
+
+
+def map_groups(
+    frame, func, by, n_threads=None, column=None, batch_size=10_000, **kwargs
+):
+    """
+    Applies a function to the intervals of each group in a dataframe, using a pool of threads.
+
+    The rows of *frame* are grouped according to *by*, and for each group *func* is called with
+    the group's intervals as the first argument.  Groups are batched together, in order, until a
+    batch contains at least *batch_size* intervals, to amortise the overhead of dispatching small
+    groups to threads.  Threads, rather than processes, are used to avoid the cost of pickling.
+    The speedup obtained depends on how much of *func* is spent in code which releases the GIL, such
+    as sorting and cumulative sums in :mod:`numpy`.
+
+    Parameters
+    ----------
+    frame : :class:`pandas.DataFrame`
+        Contains the intervals, either as an :class:`pandas.IntervalIndex` or as a column with interval dtype.
+    func : callable
+        A function which accepts a :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+        as the first argument, for example :func:`piso.union` or :func:`piso.coverage`.
+    by : label or list of labels
+        Column(s) of *frame* which define the groups.
+    n_threads : int, optional
+        The number of threads to use.  Defaults to the number of CPUs.  If 1, then no threads are created.
+    column : label, optional
+        The column of *frame* containing the intervals.  If None, then the index of *frame* is used.
+    batch_size : int, default 10000
+        The minimum number of intervals in a batch of groups processed by one task.
+    **kwargs
+        Keyword arguments passed to *func*.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame` or :class:`pandas.Series`
+        If *func* returns interval arrays then the results are concatenated into a dataframe, indexed by
+        an :class:`pandas.IntervalIndex`, with a column for each of the *by* labels.  If *func* returns
+        pandas objects then they are concatenated, with the group keys as the outer level of the index.
+        Otherwise a :class:`pandas.Series` of results, indexed by the group keys, is returned.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+    >>> import piso.parallel
+
+    >>> df = pd.DataFrame(
+    ...     {"asset": ["A", "A", "B", "B"]},
+    ...     index=pd.IntervalIndex.from_tuples([(0, 4), (3, 6), (1, 2), (5, 7)]),
+    ... )
+
+    >>> piso.parallel.map_groups(df, piso.union, by="asset")
+           asset
+    (0, 6]     A
+    (1, 2]     B
+    (5, 7]     B
+
+    >>> piso.parallel.map_groups(df, piso.coverage, by="asset", domain=(0, 10))
+    asset
+    A    0.6
+    B    0.3
+    dtype: float64
+    """
+    intervals = _get_intervals(frame, column)
+    indices = frame.groupby(by, sort=True).indices
+    batches = _make_batches(indices, batch_size)
+
+    def _run_batch(batch):
+        return [func(intervals[positions], **kwargs) for _, positions in batch]
+
+    if n_threads is None:
+        n_threads = os.cpu_count() or 1
+    if n_threads == 1 or len(batches) <= 1:
+        batch_results = [_run_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            batch_results = list(executor.map(_run_batch, batches))
+
+    keys = [key for batch in batches for key, _ in batch]
+    results = [result for batch_result in batch_results for result in batch_result]
+    if not results:
+        return pd.Series([], index=_make_key_index(keys, by), dtype=float)
+    return _combine(keys, results, by)
@@ -0,0 +1,283 @@
+import numpy as np
+import pandas as pd
+
+from piso import _sweep
+from piso._exceptions import ClosedMismatchError
+from piso.intervalarray import _get_domain_tuple
+from piso.util import _arrays_to_interval_x, _interval_x_to_arrays, _to_values
+
+
+def _to_scalar(x):
+    # numpy scalar, with datetimes and timedeltas converted to numpy types
+    return _to_values([x])[0]
+
+
+def _window_params(window, step, how):
+    assert how in ("fraction", "sum")
+    window, step = _to_scalar(window), _to_scalar(step)
+    zero = window - window
+    if not window > zero or not step > zero:
+        raise ValueError("The window and step must be positive.")
+    return window, step, zero
+
+
+def _to_series(window_starts, window_ends, values, closed, subtype):
+    index = _arrays_to_interval_x(
+        window_starts, window_ends, closed, pd.IntervalIndex, subtype, trusted=True
+    )
+    return pd.Series(values, index=index)
+
+
+def rolling_coverage(interval_array, window, step, domain=None, how="fraction"):
+    """
+    Calculates the coverage of an interval array over windows sliding across a domain.
+
+    The first window starts at the start of the domain, and each window starts *step* after
+    the previous, until a window would end after the end of the domain.  The intervals are
+    normalized, and the cumulative lengths of these calculated, once.  The coverage of each
+    window is then the difference of the cumulative lengths at the ends of the window.
+
+    Parameters
+    ----------
+    interval_array : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+        Contains the (possibly overlapping) intervals.  Must be left-closed or right-closed.
+    window : scalar
+        The length of each window.  Must be positive, and a :class:`pandas.Timedelta` for
+        datetime intervals.
+    step : scalar
+        The distance between the starts of consecutive windows.  Must be positive.
+    domain : :py:class:`tuple` or :class:`pandas.Interval`, optional
+        Specifies the domain over which the windows slide.  If None then the domain is the
+        extremities of *interval_array*.
+    how : {"fraction", "sum"}, default "fraction"
+        If "fraction" then the result is the fraction of each window covered by the intervals,
+        otherwise the length covered.
+
+    Returns
+    -------
+    :class:`pandas.Series`
+        Indexed by a :class:`pandas.IntervalIndex` of the windows.
+
+    See Also
+    --------
+    piso.RollingCoverage : The same calculation for intervals arriving in order.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> arr = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    >>> piso.rolling_coverage(arr, window=4, step=2, domain=(0, 10))
+    (0, 4]     1.00
+    (2, 6]     0.75
+    (4, 8]     0.50
+    (6, 10]    0.25
+    dtype: float64
+    """
+    window, step, _ = _window_params(window, step, how)
+    start, end = _to_values(_get_domain_tuple(interval_array, domain))
+    num_windows = max(int((end - start - window) // step) + 1, 0)
+    window_starts = start + step * np.arange(num_windows)
+    window_ends = window_starts + window
+    lefts, rights = _sweep._normalize(*_interval_x_to_arrays(interval_array))
+    covered = _sweep._covered_length(lefts, rights, window_starts, window_ends)
+    return _to_series(
+        window_starts,
+        window_ends,
+        covered / window if how == "fraction" else covered,
+        interval_array.closed,
+        interval_array.dtype.subtype,
+    )
+
+
+class RollingCoverage:
+    """
+    Calculates the coverage of intervals over sliding windows, as the intervals arrive in order.
+
+    Intervals must be supplied in order of their left endpoints.  Once an interval with left
+    endpoint *t* has been supplied, the coverage of every window ending at or before *t* is final,
+    and is returned.  Overlapping intervals are merged as they arrive, and the cumulative length
+    of the merged intervals is recorded, so the coverage of each window is a difference of two
+    cumulative lengths.  Windows only move forward, so the work per window, and per interval, is
+    constant when amortised, and merged intervals are discarded once they end before the windows.
+
+    Parameters
+    ----------
+    window : scalar
+        The length of each window.  Must be positive, and a :class:`pandas.Timedelta` for
+        datetime intervals.
+    step : scalar
+        The distance between the starts of consecutive windows.  Must be positive.
+    start : scalar
+        The start of the first window.
+    how : {"fraction", "sum"}, default "fraction"
+        If "fraction" then the results are the fraction of each window covered by the intervals,
+        otherwise the length covered.
+
+    See Also
+    --------
+    piso.rolling_coverage : The same calculation for an interval array.
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import piso
+
+    >>> rolling = piso.RollingCoverage(window=4, step=2, start=0)
+    >>> rolling.update(pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5)]))
+    Series([], dtype: float64)
+
+    >>> rolling.update(pd.arrays.IntervalArray.from_tuples([(7, 8)]))
+    (0, 4]    1.00
+    (2, 6]    0.75
+    dtype: float64
+
+    >>> rolling.flush(10)
+    (4, 8]     0.50
+    (6, 10]    0.25
+    dtype: float64
+    """
+
+    def __init__(self, window, step, start, how="fraction"):
+        self._window, self._step, self._zero = _window_params(window, step, how)
+        self._how = how
+        self._next_start = _to_scalar(start)
+        self._closed = None
+        self._subtype = None
+        self._watermark = None
+        # the merged intervals, and the total length of the merged intervals up to the right
+        # endpoint of each, where the length of discarded intervals is base
+        self._lefts = []
+        self._rights = []
+        self._cumulative = []
+        self._base = self._zero
+        # positions of the first merged interval ending after the start, and end, of the window
+        self._first = 0
+        self._last = 0
+
+    def _merge(self, lefts, rights):
+        if self._rights and len(lefts):
+            # intervals starting within the last merged interval are absorbed by it
+            k = np.searchsorted(lefts, self._rights[-1], side="right")
+            if k > 0:
+                right = max(self._rights[-1], rights[k - 1])
+                self._cumulative[-1] += right - self._rights[-1]
+                self._rights[-1] = right
+                lefts, rights = lefts[k:], rights[k:]
+        base = self._cumulative[-1] if self._cumulative else self._base
+        self._lefts.extend(lefts)
+        self._rights.extend(rights)
+        self._cumulative.extend(base + np.cumsum(rights - lefts))
+
+    def _length_before(self, x, i):
+        # the merged length before x, where i is the first merged interval ending after x
+        before = self._cumulative[i - 1] if i > 0 else self._base
+        if i < len(self._lefts):
+            length = self._rights[i] - self._lefts[i]
+            before += min(max(x - self._lefts[i], self._zero), length)
+        return before
+
+    def _advance(self, i, x):
+        while i < len(self._rights) and self._rights[i] <= x:
+            i += 1
+        return i
+
+    def _discard(self):
+        # merged intervals ending before the next window are no longer required
+        if self._first > len(self._lefts) // 2:
+            self._base = self._cumulative[self._first - 1]
+            del self._lefts[: self._first]
+            del self._rights[: self._first]
+            del self._cumulative[: self._first]
+            self._last -= self._first
+            self._first = 0
+
+    def _emit(self, until):
+        window_starts, values = [], []
+        while self._next_start + self._window <= until:
+            start = self._next_start
+            end = start + self._window
+            self._first = self._advance(self._first, start)
+            self._last = self._advance(max(self._last, self._first), end)
+            covered = self._length_before(end, self._last) - self._length_before(
+                start, self._first
+            )
+            window_starts.append(start)
+            values.append(
+                covered / self._window if self._how == "fraction" else covered
+            )
+            self._next_start = start + self._step
+        self._first = self._advance(self._first, self._next_start)
+        self._discard()
+        window_starts = np.array(
+            window_starts, dtype=np.asarray(self._next_start).dtype
+        )
+        return _to_series(
+            window_starts,
+            window_starts + self._window,
+            np.array(values, dtype=float if self._how == "fraction" else None),
+            self._closed or "right",
+            self._subtype,
+        )
+
+    def update(self, intervals):
+        """
+        Supplies intervals, and returns the coverage of windows which can now be calculated.
+
+        Parameters
+        ----------
+        intervals : :class:`pandas.IntervalIndex` or :class:`pandas.arrays.IntervalArray`
+            Must be left-closed or right-closed, and sorted by left endpoint.  The left endpoints
+            must be no smaller than those of previously supplied intervals.
+
+        Returns
+        -------
+        :class:`pandas.Series`
+            The coverage of each window ending at or before the largest left endpoint supplied,
+            which has not previously been returned.  Indexed by a :class:`pandas.IntervalIndex`
+            of the windows.
+        """
+        if len(intervals) == 0:
+            return self._emit(self._next_start)  # no windows
+        if self._closed is None:
+            self._closed = intervals.closed
+            self._subtype = intervals.dtype.subtype
+        elif intervals.closed != self._closed:
+            raise ClosedMismatchError
+        lefts, rights = _interval_x_to_arrays(intervals)
+        if not _sweep._is_sorted(lefts) or (
+            self._watermark is not None and lefts[0] < self._watermark
+        ):
+            raise ValueError(
+                "Intervals must be supplied in order of their left endpoints."
+            )
+        self._merge(*_sweep._normalize(lefts, rights, is_sorted=True))
+        self._watermark = lefts[-1]
+        return self._emit(self._watermark)
+
+    def flush(self, until=None):
+        """
+        Returns the coverage of windows ending at or before a point, after which no intervals start.
+
+        Parameters
+        ----------
+        until : scalar, optional
+            No interval supplied later may start before this point.  If None then the largest
+            right endpoint of the intervals supplied.
+
+        Returns
+        -------
+        :class:`pandas.Series`
+            The coverage of each window ending at or before *until*, which has not previously
+            been returned.  Indexed by a :class:`pandas.IntervalIndex` of the windows.
+        """
+        if until is None:
+            until = self._rights[-1] if self._rights else self._next_start
+        else:
+            until = _to_scalar(until)
+        if self._watermark is None or until > self._watermark:
+            self._watermark = until
+        return self._emit(until)
@@ -0,0 +1,365 @@
+import numpy as np
+import pandas as pd
+
+_DTYPES = ("float", "int", "datetime", "timedelta")
+
+
+def _validate_args(dtype, closed, return_type, sortedness):
+    if dtype not in _DTYPES:
+        raise ValueError(f"dtype must be one of {_DTYPES}.  Found {repr(dtype)}.")
+    if closed not in ("left", "right", "both", "neither"):
+        raise ValueError(f"Invalid value for closed: {repr(closed)}.")
+    if return_type not in (pd.arrays.IntervalArray, pd.IntervalIndex):
+        raise ValueError(
+            "return_type must be pandas.arrays.IntervalArray or pandas.IntervalIndex."
+        )
+    if not 0 <= sortedness <= 1:
+        raise ValueError("sortedness must be between 0 and 1.")
+
+
+def _unsort(rng, lefts, rights, sortedness):
+    # permutes a random subset of the intervals, of size proportional to 1 - sortedness
+    n = len(lefts)
+    n_shuffled = int(round(n * (1 - sortedness)))
+    if n_shuffled < 2:
+        return lefts, rights
+    positions = np.sort(rng.choice(n, n_shuffled, replace=False))
+    order = np.arange(n)
+    order[positions] = rng.permutation(positions)
+    return lefts[order], rights[order]
+
+
+def _convert(values, dtype, unit, start):
+    if dtype in ("datetime", "timedelta"):
+        # nanosecond resolution, which newer versions of pandas do not infer
+        values = pd.to_timedelta(values, unit=unit).astype("timedelta64[ns]")
+    if dtype == "datetime":
+        return pd.Timestamp(start) + values
+    return values
+
+
+def _finalize(rng, lefts, rights, dtype, closed, sortedness, return_type, unit, start):
+    if dtype == "int":
+        lefts = np.floor(lefts).astype(np.int64)
+        rights = np.maximum(np.ceil(rights).astype(np.int64), lefts + 1)
+    elif dtype in ("datetime", "timedelta"):
+        # avoid degenerate intervals after rounding to 1e-6 of the unit
+        lefts = np.round(lefts, 6)
+        rights = np.maximum(np.round(rights, 6), lefts + 1e-6)
+    lefts, rights = _unsort(rng, lefts, rights, sortedness)
+    return return_type.from_arrays(
+        _convert(lefts, dtype, unit, start),
+        _convert(rights, dtype, unit, start),
+        closed=closed,
+    )
+
+
+def poisson_intervals(
+    n,
+    rate=1.0,
+    mean_duration=1.0,
+    shape=1.5,
+    dtype="float",
+    closed="right",
+    sortedness=1.0,
+    return_type=pd.arrays.IntervalArray,
+    unit="h",
+    start="2021-01-01",
+    seed=None,
+):
+    """
+    Creates intervals whose left endpoints are arrivals of a Poisson process, with heavy-tailed durations.
+
+    Durations follow a Pareto (Lomax) distribution, scaled to the mean duration, so that a few
+    intervals are much longer than the rest.  The mean number of intervals overlapping a point is
+    approximately *rate* \\* *mean_duration*.
+
+    Parameters
+    ----------
+    n : int
+        The number of intervals.
+    rate : float, default 1.0
+        The mean number of arrivals per unit of time.
+    mean_duration : float, default 1.0
+        The mean length of the intervals.
+    shape : float, default 1.5
+        The shape parameter of the Pareto distribution.  Must be greater than 1.  Smaller values
+        give heavier tails.
+    dtype : {"float", "int", "datetime", "timedelta"}, default "float"
+        The type of the endpoints.
+    closed : {"left", "right", "both", "neither"}, default "right"
+    sortedness : float, default 1.0
+        The fraction of intervals which remain in sorted order.  If 0, all intervals are shuffled.
+    return_type : {:class:`pandas.arrays.IntervalArray`, :class:`pandas.IntervalIndex`}, default :class:`pandas.arrays.IntervalArray`
+    unit : str, default "h"
+        The unit of time for one unit of length, if *dtype* is "datetime" or "timedelta".
+    start : str or :class:`pandas.Timestamp`, default "2021-01-01"
+        The time corresponding to zero, if *dtype* is "datetime".
+    seed : int or :class:`numpy.random.Generator`, optional
+
+    Returns
+    -------
+    :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+
+    Examples
+    --------
+
+    >>> from piso.testing import generators
+    >>> generators.poisson_intervals(4, dtype="int", seed=42)
+    <IntervalArray>
+    [(2, 3], (4, 6], (7, 8], (7, 11]]
+    Length: 4, closed: right, dtype: interval[int64]
+    """
+    if shape <= 1:
+        raise ValueError("shape must be greater than 1 for the mean duration to exist.")
+    _validate_args(dtype, closed, return_type, sortedness)
+    rng = np.random.default_rng(seed)
+    lefts = np.cumsum(rng.exponential(1 / rate, n))
+    durations = rng.pareto(shape, n) * mean_duration * (shape - 1)
+    rights = lefts + durations
+    return _finalize(
+        rng, lefts, rights, dtype, closed, sortedness, return_type, unit, start
+    )
+
+
+def tiling_intervals(
+    n,
+    length=1.0,
+    gap_probability=0.0,
+    jitter=0.0,
+    dtype="float",
+    closed="right",
+    sortedness=1.0,
+    return_type=pd.arrays.IntervalArray,
+    unit="h",
+    start="2021-01-01",
+    seed=None,
+):
+    """
+    Creates calendar-like intervals which tile the line, such as consecutive bookable slots.
+
+    Parameters
+    ----------
+    n : int
+        The number of intervals.
+    length : float, default 1.0
+        The length of each slot.
+    gap_probability : float, default 0.0
+        The probability that a slot is left empty, creating a gap between intervals.
+    jitter : float, default 0.0
+        The maximum random amount, as a fraction of *length*, by which each interval is shortened.
+        Intervals remain disjoint.
+    dtype : {"float", "int", "datetime", "timedelta"}, default "float"
+        The type of the endpoints.
+    closed : {"left", "right", "both", "neither"}, default "right"
+    sortedness : float, default 1.0
+        The fraction of intervals which remain in sorted order.  If 0, all intervals are shuffled.
+    return_type : {:class:`pandas.arrays.IntervalArray`, :class:`pandas.IntervalIndex`}, default :class:`pandas.arrays.IntervalArray`
+    unit : str, default "h"
+        The unit of time for one unit of length, if *dtype* is "datetime" or "timedelta".
+    start : str or :class:`pandas.Timestamp`, default "2021-01-01"
+        The time corresponding to zero, if *dtype* is "datetime".
+    seed : int or :class:`numpy.random.Generator`, optional
+
+    Returns
+    -------
+    :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        Contains disjoint intervals.
+    """
+    if not 0 <= jitter < 1:
+        raise ValueError("jitter must be at least 0 and less than 1.")
+    if not 0 <= gap_probability < 1:
+        raise ValueError("gap_probability must be at least 0 and less than 1.")
+    _validate_args(dtype, closed, return_type, sortedness)
+    rng = np.random.default_rng(seed)
+    slots = np.cumsum(rng.geometric(1 - gap_probability, n))
+    lefts = (slots - 1) * length
+    rights = lefts + length * (1 - jitter * rng.random(n))
+    return _finalize(
+        rng, lefts, rights, dtype, closed, sortedness, return_type, unit, start
+    )
+
+
+def nested_intervals(
+    n,
+    levels=3,
+    branching=4,
+    dtype="float",
+    closed="right",
+    sortedness=1.0,
+    return_type=pd.arrays.IntervalArray,
+    unit="h",
+    start="2021-01-01",
+    seed=None,
+):
+    """
+    Creates a hierarchy of intervals, such as years, months and days, where each interval is split into children.
+
+    The lowest level of the hierarchy consists of *n* adjacent intervals of unit length.  Each
+    interval in a higher level is the union of *branching* intervals of the level below, so every
+    point is covered by *levels* intervals.
+
+    Parameters
+    ----------
+    n : int
+        The number of intervals in the lowest level.
+    levels : int, default 3
+        The number of levels in the hierarchy.
+    branching : int, default 4
+        The number of children of each interval.
+    dtype : {"float", "int", "datetime", "timedelta"}, default "float"
+        The type of the endpoints.
+    closed : {"left", "right", "both", "neither"}, default "right"
+    sortedness : float, default 1.0
+        The fraction of intervals which remain in sorted order.  If 0, all intervals are shuffled.
+    return_type : {:class:`pandas.arrays.IntervalArray`, :class:`pandas.IntervalIndex`}, default :class:`pandas.arrays.IntervalArray`
+    unit : str, default "h"
+        The unit of time for one unit of length, if *dtype* is "datetime" or "timedelta".
+    start : str or :class:`pandas.Timestamp`, default "2021-01-01"
+        The time corresponding to zero, if *dtype* is "datetime".
+    seed : int or :class:`numpy.random.Generator`, optional
+
+    Returns
+    -------
+    :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+        Sorted by left endpoint, then by length in descending order, unless *sortedness* is less than 1.
+    """
+    _validate_args(dtype, closed, return_type, sortedness)
+    rng = np.random.default_rng(seed)
+    n_top = int(np.ceil(n / branching ** (levels - 1)))
+    span = n_top * branching ** (levels - 1)
+    level_lengths = branching ** np.arange(levels - 1, -1, -1)
+    lefts = np.concatenate(
+        [np.arange(0, span, length, dtype=float) for length in level_lengths]
+    )
+    rights = lefts + np.repeat(level_lengths, span // level_lengths)
+    keep = lefts < n
+    lefts, rights = lefts[keep], np.minimum(rights[keep], n)
+    order = np.lexsort((lefts - rights, lefts))
+    return _finalize(
+        rng,
+        lefts[order],
+        rights[order],
+        dtype,
+        closed,
+        sortedness,
+        return_type,
+        unit,
+        start,
+    )
+
+
+def burst_intervals(
+    n,
+    n_bursts=10,
+    burst_width=1.0,
+    mean_duration=1.0,
+    span=None,
+    dtype="float",
+    closed="right",
+    sortedness=1.0,
+    return_type=pd.arrays.IntervalArray,
+    unit="h",
+    start="2021-01-01",
+    seed=None,
+):
+    """
+    Creates intervals concentrated in bursts, where many intervals overlap.
+
+    Burst centres are distributed uniformly, and left endpoints are normally distributed
+    around the centres.  Durations are exponentially distributed.
+
+    Parameters
+    ----------
+    n : int
+        The number of intervals.
+    n_bursts : int, default 10
+        The number of bursts.
+    burst_width : float, default 1.0
+        The standard deviation of left endpoints around the centre of a burst.
+    mean_duration : float, default 1.0
+        The mean length of the intervals.
+    span : float, optional
+        The length of the domain containing the burst centres.  Defaults to 100 times *n_bursts*
+        multiplied by *burst_width*, so that bursts rarely overlap.
+    dtype : {"float", "int", "datetime", "timedelta"}, default "float"
+        The type of the endpoints.
+    closed : {"left", "right", "both", "neither"}, default "right"
+    sortedness : float, default 1.0
+        The fraction of intervals which remain in sorted order.  If 0, all intervals are shuffled.
+    return_type : {:class:`pandas.arrays.IntervalArray`, :class:`pandas.IntervalIndex`}, default :class:`pandas.arrays.IntervalArray`
+    unit : str, default "h"
+        The unit of time for one unit of length, if *dtype* is "datetime" or "timedelta".
+    start : str or :class:`pandas.Timestamp`, default "2021-01-01"
+        The time corresponding to zero, if *dtype* is "datetime".
+    seed : int or :class:`numpy.random.Generator`, optional
+
+    Returns
+    -------
+    :class:`pandas.arrays.IntervalArray` or :class:`pandas.IntervalIndex`
+    """
+    _validate_args(dtype, closed, return_type, sortedness)
+    rng = np.random.default_rng(seed)
+    if span is None:
+        span = 100 * n_bursts * burst_width
+    centres = rng.uniform(0, span, n_bursts)
+    lefts = np.sort(
+        centres[rng.integers(0, n_bursts, n)] + rng.normal(0, burst_width, n)
+    )
+    lefts = lefts - min(lefts.min(), 0) if n else lefts
+    rights = lefts + rng.exponential(mean_duration, n)
+    return _finalize(
+        rng, lefts, rights, dtype, closed, sortedness, return_type, unit, start
+    )
+
+
+def interval_frame(
+    n,
+    columns=("A",),
+    gap_probability=0.5,
+    dtype="float",
+    closed="right",
+    unit="h",
+    start="2021-01-01",
+    seed=None,
+):
+    """
+    Creates a :class:`pandas.DataFrame`, indexed by disjoint intervals, with random values.
+
+    Such frames are suitable arguments for :func:`piso.lookup` and :func:`piso.join`.
+
+    Parameters
+    ----------
+    n : int
+        The number of rows.
+    columns : sequence of labels, default ("A",)
+        The column names.  Each column contains floats drawn from a standard normal distribution.
+    gap_probability : float, default 0.5
+        The probability of a gap between consecutive intervals.
+    dtype : {"float", "int", "datetime", "timedelta"}, default "float"
+        The type of the endpoints.
+    closed : {"left", "right"}, default "right"
+    unit : str, default "h"
+        The unit of time for one unit of length, if *dtype* is "datetime" or "timedelta".
+    start : str or :class:`pandas.Timestamp`, default "2021-01-01"
+        The time corresponding to zero, if *dtype* is "datetime".
+    seed : int or :class:`numpy.random.Generator`, optional
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+    """
+    rng = np.random.default_rng(seed)
+    index = tiling_intervals(
+        n,
+        gap_probability=gap_probability,
+        dtype=dtype,
+        closed=closed,
+        return_type=pd.IntervalIndex,
+        unit=unit,
+        start=start,
+        seed=rng,
+    )
+    return pd.DataFrame(
+        {column: rng.standard_normal(n) for column in columns}, index=index
+    )
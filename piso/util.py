@@ -1,30 +1,179 @@
+import weakref
+
+import numpy as np
+import pandas as pd
 import staircase as sc
 
-from piso._exceptions import ClosedValueError, DegenerateIntervalError
+from piso import _config
+from piso._cache import _stairs_cache
+from piso._exceptions import (
+    ClosedValueError,
+    DegenerateIntervalError,
+    DenseAllocationError,
+)
+from piso._profiling import _profiled
+
+_config._register_option("validate", True, validator=_config._validate_bool)
+_config._register_option(
+    "max_dense_bytes", None, validator=_config._validate_nonnegative_int_or_none
+)
+
+
+def _num_intervals(interval_array, *args, **kwargs):
+    # an interval, interval array, or array of endpoints
+    return 1 if isinstance(interval_array, pd.Interval) else len(interval_array)
+
+
+def _num_step_points(stairs, *args, **kwargs):
+    return len(stairs.step_points)
+
+
+def _dense_bytes_exceeded(nbytes):
+    max_bytes = _config.get_option("max_dense_bytes")
+    return max_bytes is not None and nbytes > max_bytes
 
 
-def _validate_intervals(interval_array):
-    if not all(interval_array.length):  # test for degenerate intervals
+def _check_dense_bytes(operation, shape, nbytes):
+    # nbytes is the estimated peak size of the dense arrays, which have the given shape
+    if _dense_bytes_exceeded(nbytes):
+        raise DenseAllocationError(
+            operation, shape, nbytes, _config.get_option("max_dense_bytes")
+        )
+
+
+# ids of interval indexes known to have no degenerate intervals, removed when the index is collected
+_validated_indexes = set()
+
+
+def _has_degenerate_intervals(interval_array):
+    lefts, rights = _interval_x_to_arrays(interval_array)
+    # missing intervals compare unequal, as they do not have zero length
+    return bool(np.any(lefts == rights))
+
+
+@_profiled(size=_num_intervals)
+def _validate_intervals(interval_array, validate=None):
+    if validate is None:
+        validate = _config.get_option("validate")
+    # interval indexes are immutable so the result can be remembered
+    is_index = isinstance(interval_array, pd.IntervalIndex)
+    check = validate and not (is_index and id(interval_array) in _validated_indexes)
+    if check and _has_degenerate_intervals(interval_array):
         raise DegenerateIntervalError(interval_array)
     if interval_array.closed not in ("left", "right"):
         raise ClosedValueError(interval_array.closed)
+    if check and is_index:
+        _validated_indexes.add(id(interval_array))
+        weakref.finalize(interval_array, _validated_indexes.discard, id(interval_array))
+
 
+def _validate_weights(interval_array, weights):
+    weights = np.asarray(weights)
+    if weights.shape != (len(interval_array),):
+        raise ValueError(
+            f"weights must be one-dimensional, with one value per interval.  Found shape {weights.shape} for {len(interval_array)} intervals."
+        )
+    if weights.dtype.kind not in "buif":
+        raise ValueError(f"weights must be numeric.  Found dtype {weights.dtype}.")
+    # the weights are negated at right endpoints, which unsigned and boolean dtypes do not support
+    if weights.dtype.kind == "b" or (
+        weights.dtype.kind == "u" and weights.dtype.itemsize < 8
+    ):
+        weights = weights.astype(np.int64)
+    elif weights.dtype.kind == "u":
+        weights = weights.astype(np.float64)
+    if np.any(weights < 0):
+        raise ValueError("weights must be non-negative.")
+    return weights
 
-def _interval_x_to_stairs(interval_array):
+
+@_profiled(size=_num_intervals)
+def _interval_x_to_stairs(interval_array, weights=None):
     # can be used with interval, interval array, interval index
     assert interval_array.closed in {"left", "right"}
+    if weights is not None:
+        return _make_stairs_uncached(interval_array, weights)
+    if _config.get_option("cache.size") == 0 or isinstance(interval_array, pd.Interval):
+        return _make_stairs_uncached(interval_array)
+    lefts, rights = _interval_x_to_arrays(interval_array)
+    if lefts.dtype == object or rights.dtype == object:
+        return _make_stairs_uncached(interval_array)
+    key = _stairs_cache.make_key(
+        lefts, rights, extra=(interval_array.closed, str(interval_array.dtype))
+    )
+    stairs = _stairs_cache.get(key)
+    if stairs is None:
+        stairs = _make_stairs_uncached(interval_array)
+        # approximate size of the step changes, and their deltas and values
+        _stairs_cache.put(key, stairs, 3 * (lefts.nbytes + rights.nbytes))
+    return stairs
+
+
+def _make_stairs_uncached(interval_array, weights=None):
     return sc.Stairs(
         start=interval_array.left,
         end=interval_array.right,
+        value=1 if weights is None else weights,
         closed=interval_array.closed,
     )
 
 
-def _boolean_stairs_to_interval_array(stairs, cls):
+def _stairs_to_index_pair(stairs):
+    # endpoints of the intervals where a boolean step function is one, as views of its step points
+    points = stairs.step_changes.index
+    return points[::2], points[1::2]
+
+
+@_profiled(size=_num_step_points)
+def _boolean_stairs_to_interval_array(stairs, cls, interval_array):
     if stairs.identical(0):
+        if cls == "arrays":
+            # a zero step function has no step points to give the dtype
+            lefts, rights = _interval_x_to_arrays(interval_array)
+            return lefts[:0], rights[:0]
         return cls([], closed=stairs.closed)
-    return cls.from_arrays(
-        stairs.step_changes.index[::2],
-        stairs.step_changes.index[1::2],
-        closed=stairs.closed,
-    )
+    lefts, rights = _stairs_to_index_pair(stairs)
+    if cls == "arrays":
+        return lefts.values, rights.values
+    return _trusted_interval_x(lefts._values, rights._values, stairs.closed, cls)
+
+
+def _interval_x_to_arrays(interval_array):
+    # numpy arrays of the endpoints, without copying where possible
+    return interval_array.left.values, interval_array.right.values
+
+
+def _trusted_interval_x(lefts, rights, closed, cls):
+    # lefts and rights are arrays of the same dtype, with lefts < rights, such as the results of a
+    # sweep, so the validation performed by IntervalArray.from_arrays is skipped
+    try:
+        if len(lefts) != len(rights):  # from_arrays raises an error
+            raise ValueError
+        dtype = pd.IntervalDtype(lefts.dtype, closed=closed)
+        result = pd.arrays.IntervalArray._simple_new(lefts, rights, dtype)
+    except (TypeError, ValueError):  # unsupported subtypes, or versions of pandas
+        result = pd.arrays.IntervalArray.from_arrays(lefts, rights, closed=closed)
+    if cls is pd.IntervalIndex:
+        result = pd.IntervalIndex._simple_new(result)
+    return result
+
+
+@_profiled(size=_num_intervals)
+def _arrays_to_interval_x(lefts, rights, closed, cls, subtype=None, trusted=False):
+    if cls == "arrays":
+        return lefts, rights
+    lefts, rights = pd.Index(lefts), pd.Index(rights)
+    tz = getattr(subtype, "tz", None)
+    if tz is not None:
+        lefts = lefts.tz_localize("UTC").tz_convert(tz)
+        rights = rights.tz_localize("UTC").tz_convert(tz)
+    if trusted:
+        return _trusted_interval_x(lefts._values, rights._values, closed, cls)
+    return cls.from_arrays(lefts, rights, closed=closed)
+
+
+def _to_values(x):
+    # numpy array of scalars, with datetimes and timedeltas converted to numpy types
+    if not pd.api.types.is_list_like(x):
+        x = [x]
+    return pd.Index(x).values
@@ -0,0 +1,169 @@
+import pandas as pd
+import pytest
+
+import piso
+import piso.intervalarray as piso_intervalarray
+from piso import register_accessors
+
+register_accessors()
+
+
+def make_ii(closed):
+    return pd.IntervalIndex.from_tuples(
+        [(0, 4), (2, 5), (3, 6), (7, 8), (8, 9), (10, 12)],
+        closed=closed,
+    )
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "method, args, kwargs",
+    [
+        ("union", (), {}),
+        ("union", (), {"return_type": pd.arrays.IntervalArray}),
+        ("intersection", (), {"min_overlaps": 2}),
+        ("symmetric_difference", (), {}),
+        ("isdisjoint", (), {}),
+        ("coverage", (), {}),
+        ("coverage", ((1, 11),), {"how": "sum"}),
+        ("coverage", (pd.Interval(-1, 20),), {}),
+        ("complement", (), {}),
+        ("complement", ((-2, 15),), {}),
+        ("bridge", (1,), {}),
+    ],
+)
+def test_memoized_results(closed, method, args, kwargs):
+    ii = make_ii(closed)
+    expected = getattr(piso_intervalarray, method)(ii, *args, **kwargs)
+    for _ in range(2):
+        result = getattr(ii.piso, method)(*args, **kwargs)
+        if isinstance(expected, (pd.IntervalIndex, pd.arrays.IntervalArray)):
+            assert type(result) is type(expected)
+            pd._testing.assert_interval_array_equal(
+                pd.arrays.IntervalArray(result),
+                pd.arrays.IntervalArray(expected),
+                exact=False,
+            )
+        else:
+            assert result == expected
+    assert len(ii.piso._cache) > 0
+
+
+def test_unhashable_arguments_not_memoized():
+    ii = make_ii("right")
+    domain = pd.IntervalIndex.from_tuples([(0, 5), (5, 10)])
+    result = ii.piso.coverage(domain, bins=True)
+    expected = piso.coverage(ii, domain, bins=True)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_memoized_interval_array_is_copied():
+    ii = make_ii("right")
+    result1 = ii.piso.union(return_type=pd.arrays.IntervalArray)
+    result2 = ii.piso.union(return_type=pd.arrays.IntervalArray)
+    assert result1 is not result2
+
+
+def test_memoized_dict_is_copied():
+    ii = make_ii("right")
+    result1 = ii.piso.intersection(min_overlaps=(2, 3), return_type="arrays")
+    result1[2] = None
+    result2 = ii.piso.intersection(min_overlaps=(2, 3), return_type="arrays")
+    expected = piso.intersection(ii, min_overlaps=(2, 3), return_type="arrays")
+    assert result2.keys() == expected.keys()
+    for key, (lefts, rights) in expected.items():
+        assert (result2[key][0] == lefts).all() and (result2[key][1] == rights).all()
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [("coverage", ()), ("complement", ()), ("bridge", (1,))],
+)
+def test_memoized_results_with_degenerate_intervals(method, args):
+    ii = pd.IntervalIndex.from_tuples([(0, 1), (2, 2), (2, 3)])
+    with piso.option_context("validate", False):
+        expected = getattr(piso_intervalarray, method)(ii, *args)
+        result = getattr(ii.piso, method)(*args)
+    if method == "coverage":
+        assert result == expected
+    else:
+        pd._testing.assert_interval_array_equal(
+            pd.arrays.IntervalArray(result), pd.arrays.IntervalArray(expected)
+        )
+
+
+def test_memoized_coverage_with_degenerate_intervals():
+    ii = pd.IntervalIndex.from_tuples([(0, 1), (2, 2), (2, 3)])
+    assert ii.piso.coverage() == piso.coverage(ii)
+
+
+def test_memoized_results_respect_validate_option():
+    ii = pd.IntervalIndex.from_tuples([(0, 1), (2, 2), (2, 3)])
+    with piso.option_context("validate", False):
+        ii.piso.union()
+    with pytest.raises(piso._exceptions.DegenerateIntervalError):
+        ii.piso.union()
+
+
+def test_normalized_intervals_shared():
+    ii = make_ii("right")
+    ii.piso.union()
+    with piso.profile() as prof:
+        ii.piso.coverage()
+        ii.piso.coverage((1, 11), how="sum")
+        ii.piso.complement((-2, 15))
+        ii.piso.bridge(1)
+    stages = set(prof.to_frame()["stage"])
+    assert "_interval_x_to_stairs" not in stages
+    assert "_normalize" not in stages
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("union", ()),
+        ("coverage", ((1, 11),)),
+        ("complement", ((-2, 15),)),
+        ("bridge", (1,)),
+    ],
+)
+def test_normalized_matches_functions_datetime(method, args):
+    def convert(x):
+        return pd.Timestamp("2021-10-1", tz="UTC") + pd.Timedelta(days=x)
+
+    ii = make_ii("left")
+    ii = pd.IntervalIndex.from_arrays(
+        ii.left.map(convert), ii.right.map(convert), closed="left"
+    )
+    if method in ("coverage", "complement"):
+        args = (tuple(convert(x) for x in args[0]),)
+    elif method == "bridge":
+        args = (pd.Timedelta(days=args[0]),)
+    result = getattr(ii.piso, method)(*args)
+    expected = getattr(piso_intervalarray, method)(ii, *args)
+    if method == "coverage":
+        assert result == expected
+    else:
+        assert type(result) is type(expected)
+        pd._testing.assert_interval_array_equal(
+            pd.arrays.IntervalArray(result), pd.arrays.IntervalArray(expected)
+        )
+
+
+def test_clear_cache():
+    ii = make_ii("right")
+    ii.piso.union()
+    ii.piso.coverage()
+    assert len(ii.piso._cache) > 0
+    ii.piso.clear_cache()
+    assert len(ii.piso._cache) == 0
+
+
+def test_interval_array_not_memoized():
+    ia = make_ii("right").array
+    ia.piso.union()
+    assert ia.piso._cache is None
+    ia.piso.clear_cache()
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+
+pa = pytest.importorskip("pyarrow")
+piso_arrow = pytest.importorskip("piso.arrow")
+
+
+def make_ia1():
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)]
+    )
+
+
+def make_ia2():
+    return pd.arrays.IntervalArray.from_tuples([(2, 4), (6, 11), (15, 18), (24, 28)])
+
+
+def to_table(interval_array, date_type=None):
+    lefts = np.asarray(interval_array.left, dtype=np.int64)
+    rights = np.asarray(interval_array.right, dtype=np.int64)
+    if date_type is None:
+        arrow_type = pa.int64()
+    elif date_type == "timestamp":
+        lefts = np.datetime64("2021-10-01", "us") + lefts.astype("timedelta64[D]")
+        rights = np.datetime64("2021-10-01", "us") + rights.astype("timedelta64[D]")
+        arrow_type = pa.timestamp("us", tz="Australia/Sydney")
+    else:
+        lefts = lefts.astype("timedelta64[D]").astype("timedelta64[us]")
+        rights = rights.astype("timedelta64[D]").astype("timedelta64[us]")
+        arrow_type = pa.duration("us")
+    return pa.table(
+        {
+            "start": pa.array(lefts, type=arrow_type),
+            "end": pa.array(rights, type=arrow_type),
+        }
+    )
+
+
+def assert_table_equal(result, expected, date_type=None):
+    assert result.equals(to_table(expected, date_type))
+
+
+@pytest.mark.parametrize("date_type", [None, "timestamp", "timedelta"])
+@pytest.mark.parametrize(
+    "operation, kwargs",
+    [
+        ("union", {}),
+        ("intersection", {}),
+        ("intersection", {"min_overlaps": 1}),
+        ("difference", {}),
+        ("symmetric_difference", {}),
+    ],
+)
+def test_set_operations_match_piso(date_type, operation, kwargs):
+    expected = getattr(piso, operation)(make_ia1(), make_ia2(), **kwargs)
+    result = getattr(piso_arrow, operation)(
+        to_table(make_ia1(), date_type), to_table(make_ia2(), date_type), **kwargs
+    )
+    assert_table_equal(result, expected, date_type)
+
+
+def test_single_table_intersection():
+    expected = piso.intersection(make_ia1(), min_overlaps=2)
+    result = piso_arrow.intersection(to_table(make_ia1()), min_overlaps=2)
+    assert_table_equal(result, expected)
+
+
+def test_column_names_and_record_batch():
+    table = to_table(make_ia1()).rename_columns(["lo", "hi"]).to_batches()[0]
+    result = piso_arrow.union(table, start="lo", end="hi")
+    assert result.column_names == ["lo", "hi"]
+    expected = to_table(piso.union(make_ia1())).rename_columns(["lo", "hi"])
+    assert result.equals(expected)
+
+
+def test_chunked_columns():
+    table = pa.concat_tables([to_table(make_ia1()[:2]), to_table(make_ia1()[2:])])
+    assert table.column("start").num_chunks == 2
+    assert_table_equal(piso_arrow.union(table), piso.union(make_ia1()))
+
+
+def test_zero_copy():
+    table = to_table(make_ia1())
+    lefts, rights = piso_arrow._to_operand(table, "start", "end")
+    address = table.column("start").chunk(0).buffers()[1].address
+    assert lefts.__array_interface__["data"][0] == address
+
+
+@pytest.mark.parametrize(
+    "domain, piso_domain",
+    [
+        (None, None),
+        ((0, 30), (0, 30)),
+        (
+            pa.table({"start": [0, 15], "end": [10, 30]}),
+            pd.arrays.IntervalArray.from_tuples([(0, 10), (15, 30)]),
+        ),
+    ],
+)
+def test_complement_and_coverage(domain, piso_domain):
+    table = to_table(make_ia1())
+    expected = piso.complement(make_ia1(), piso_domain)
+    assert_table_equal(piso_arrow.complement(table, domain), expected)
+    for how in ("fraction", "sum"):
+        assert piso_arrow.coverage(table, domain, how=how) == pytest.approx(
+            piso.coverage(make_ia1(), piso_domain, how=how)
+        )
+
+
+def test_invalid_inputs():
+    table = to_table(make_ia1())
+    with pytest.raises(ValueError):
+        schema = pa.schema([("start", pa.float64()), ("end", pa.float64())])
+        piso_arrow.union(table, table.cast(schema))
+    with pytest.raises(ValueError):
+        piso_arrow.union(pa.table({"start": [1, None], "end": [2, 3]}))
+    with pytest.raises(ValueError):
+        piso_arrow.complement(table, domain=[0, 1])
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+def test_lookup(closed):
+    table = pa.table({"start": [4, 0, 6], "end": [5, 2, 9], "value": ["b", "a", "c"]})
+    x = [0, 1, 2, 3, 4, 5, 6, 9, 10]
+    index = pd.IntervalIndex.from_arrays([4, 0, 6], [5, 2, 9], closed=closed)
+    expected = pd.Series(["b", "a", "c"], index=index).reindex(x)
+    result = piso_arrow.lookup(table, pa.array(x), closed=closed)
+    assert result.column("value").to_pylist() == [
+        None if pd.isna(v) else v for v in expected.values
+    ]
+
+
+@pytest.mark.parametrize("ends, closed", [([2, 3], "right"), ([1, 3], "both")])
+def test_lookup_overlapping(ends, closed):
+    table = pa.table({"start": [0, 1], "end": ends})
+    with pytest.raises(ValueError):
+        piso_arrow.lookup(table, [1], closed=closed)
+
+
+def test_memory_mapped_feather(tmp_path):
+    feather = pytest.importorskip("pyarrow.feather")
+    path = str(tmp_path / "intervals.arrow")
+    feather.write_feather(to_table(make_ia1()), path, compression="uncompressed")
+    table = feather.read_table(path, memory_map=True)
+    assert_table_equal(piso_arrow.union(table), piso.union(make_ia1()))
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+
+import piso
+import piso.util
+
+
+def make_ia(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(0, 4), (2, 5), (7, 8), (10, 12)], closed=closed
+    )
+
+
+def test_get_set_reset_option():
+    assert piso.get_option("cache.size") == 0
+    piso.set_option("cache.size", 1000)
+    assert piso.get_option("cache.size") == 1000
+    piso.reset_option("cache.size")
+    assert piso.get_option("cache.size") == 0
+
+
+def test_option_context():
+    with piso.option_context("cache.size", 1000):
+        assert piso.get_option("cache.size") == 1000
+    assert piso.get_option("cache.size") == 0
+
+
+def test_unknown_option():
+    with pytest.raises(KeyError):
+        piso.get_option("not.an.option")
+    with pytest.raises(KeyError):
+        piso.set_option("not.an.option", 1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [-1, 1.5, "1", True],
+)
+def test_invalid_cache_size(value):
+    with pytest.raises(ValueError):
+        piso.set_option("cache.size", value)
+
+
+def test_cache_disabled():
+    piso.clear_cache()
+    piso.coverage(make_ia())
+    info = piso.cache_info()
+    assert info.entries == 0
+    assert info.hits == 0
+    assert info.misses == 0
+
+
+def test_cache_hits_and_misses():
+    piso.clear_cache()
+    with piso.option_context("cache.size", 2**20):
+        ia = make_ia()
+        stairs1 = piso.util._interval_x_to_stairs(ia)
+        stairs2 = piso.util._interval_x_to_stairs(make_ia())
+        stairs3 = piso.util._interval_x_to_stairs(make_ia("left"))
+        assert stairs1 is stairs2
+        assert stairs1 is not stairs3
+        info = piso.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.entries == 2
+    assert piso.cache_info().entries == 0
+    piso.clear_cache()
+
+
+def test_cache_eviction():
+    piso.clear_cache()
+    ia = make_ia()
+    entry_size = 3 * (ia.left.values.nbytes + ia.right.values.nbytes)
+    with piso.option_context("cache.size", entry_size * 2):
+        for shift in range(3):
+            piso.util._interval_x_to_stairs(
+                pd.arrays.IntervalArray.from_arrays(ia.left + shift, ia.right + shift)
+            )
+        info = piso.cache_info()
+        assert info.entries == 2
+        assert info.size <= info.max_size
+    piso.clear_cache()
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+def test_cached_results_unchanged(closed):
+    ia = make_ia(closed)
+    expected = piso.bridge(ia, 2), piso.coverage(ia), piso.complement(ia)
+    with piso.option_context("cache.size", 2**20):
+        for _ in range(2):
+            result = piso.bridge(ia, 2), piso.coverage(ia), piso.complement(ia)
+            pd._testing.assert_interval_array_equal(result[0], expected[0])
+            assert result[1] == expected[1]
+            pd._testing.assert_interval_array_equal(result[2], expected[2])
+    piso.clear_cache()
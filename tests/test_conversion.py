@@ -63,7 +63,7 @@ def test_conversion(interval_index, closed, date_type):
     ia = make_interval_array(interval_index, closed, date_type)
     stairs = piso.util._interval_x_to_stairs(ia)
     klass = pd.IntervalIndex if interval_index else pd.arrays.IntervalArray
-    ia2 = piso.util._boolean_stairs_to_interval_array(stairs, klass)
+    ia2 = piso.util._boolean_stairs_to_interval_array(stairs, klass, ia)
     print(ia)
     print(ia2)
     assert_interval_array_equal(
@@ -71,3 +71,13 @@ def test_conversion(interval_index, closed, date_type):
         ia2,
         interval_index=interval_index,
     )
+
+
+@pytest.mark.parametrize("klass", [pd.IntervalIndex, pd.arrays.IntervalArray])
+def test_trusted_interval_x_unpaired_endpoints(klass):
+    stairs = piso.util._interval_x_to_stairs(
+        pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 4)])
+    )
+    lefts, rights = piso.util._stairs_to_index_pair(stairs)
+    with pytest.raises(ValueError):
+        piso.util._trusted_interval_x(lefts._values, rights._values, "right", klass)
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+import piso.core
+
+
+def make_ia1(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)], closed=closed
+    )
+
+
+def make_ia2(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(2, 4), (6, 11), (15, 18), (24, 28)], closed=closed
+    )
+
+
+def make_ia3(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples([(4, 9), (16, 22)], closed=closed)
+
+
+def to_operand(interval_array):
+    return interval_array.left.values, interval_array.right.values
+
+
+def assert_operand_equal(result, expected):
+    lefts, rights = result
+    assert isinstance(lefts, np.ndarray)
+    assert isinstance(rights, np.ndarray)
+    np.testing.assert_array_equal(lefts, np.asarray(expected.left, dtype=float))
+    np.testing.assert_array_equal(rights, np.asarray(expected.right, dtype=float))
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize(
+    "operation, kwargs",
+    [
+        ("union", {}),
+        ("intersection", {}),
+        ("intersection", {"min_overlaps": 2}),
+        ("symmetric_difference", {}),
+        ("symmetric_difference", {"min_overlaps": 3}),
+        ("difference", {}),
+    ],
+)
+@pytest.mark.parametrize("num_arrays", [1, 2, 3])
+def test_set_operations_match_piso(closed, operation, kwargs, num_arrays):
+    arrays = [make_ia1(closed), make_ia2(closed), make_ia3(closed)][:num_arrays]
+    if operation == "difference" and num_arrays == 1:
+        pytest.skip("difference requires at least two operands")
+    expected = getattr(piso, operation)(*arrays, **kwargs)
+    result = getattr(piso.core, operation)(*map(to_operand, arrays), **kwargs)
+    assert_operand_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [None, (0, 30), (pd.Index([0, 15]).values, pd.Index([10, 30]).values)],
+)
+def test_complement_matches_piso(domain):
+    ia = make_ia1()
+    piso_domain = domain
+    if domain is not None and not np.isscalar(domain[0]):
+        piso_domain = pd.arrays.IntervalArray.from_arrays(*domain)
+    expected = piso.complement(ia, piso_domain)
+    result = piso.core.complement(to_operand(ia), domain)
+    assert_operand_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+@pytest.mark.parametrize("domain", [None, (0, 30), (3, 11)])
+def test_coverage_matches_piso(how, domain):
+    ia = make_ia1()
+    expected = piso.coverage(ia, domain, how=how)
+    result = piso.core.coverage(to_operand(ia), domain, how=how)
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+def test_coverage_bins_matches_piso(how):
+    ia = make_ia1()
+    bins = pd.IntervalIndex.from_breaks([0, 4, 10, 21, 30])
+    expected = piso.coverage(ia, bins, bins=True, how=how)
+    result = piso.core.coverage(to_operand(ia), to_operand(bins), bins=True, how=how)
+    np.testing.assert_allclose(result, expected.values)
+
+
+def test_coverage_datetime():
+    ia = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-01", "2021-01-03"]),
+        pd.to_datetime(["2021-01-02", "2021-01-05"]),
+    )
+    result = piso.core.coverage(to_operand(ia), how="sum")
+    assert result == np.timedelta64(3, "D")
+    assert piso.core.coverage(to_operand(ia)) == pytest.approx(0.75)
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize(
+    "result, how",
+    [
+        ("cartesian", "any"),
+        ("points", "any"),
+        ("points", "all"),
+        ("intervals", "any"),
+        ("intervals", "all"),
+    ],
+)
+def test_contains_matches_piso(closed, result, how):
+    ia = make_ia1(closed)
+    x = np.array([0, 1, 3, 5, 12, 13, 22])
+    expected = piso.contains(ia, x, include_index=False, result=result, how=how)
+    calc = piso.core.contains(to_operand(ia), x, closed=closed, result=result, how=how)
+    np.testing.assert_array_equal(calc, expected)
+
+
+@pytest.mark.parametrize("result", ["points", "intervals"])
+@pytest.mark.parametrize("how", ["any", "all"])
+def test_contains_sweep_matches_dense(result, how):
+    operand = to_operand(make_ia1())
+    x = np.array([0, 1, 3, 5, 12, 13, 22])
+    expected = piso.core.contains(operand, x, result=result, how=how)
+    with piso.option_context("max_dense_bytes", 0):
+        calc = piso.core.contains(operand, x, result=result, how=how)
+    np.testing.assert_array_equal(calc, expected)
+
+
+def test_split_matches_piso():
+    ia = make_ia1()
+    x = [4, 2, 11, 4, 12, 30]
+    expected = piso.split(ia, x)
+    result = piso.core.split(to_operand(ia), np.array(x))
+    assert_operand_equal(result, expected)
+
+
+def test_empty_operands():
+    empty = (np.array([], dtype=float), np.array([], dtype=float))
+    assert len(piso.core.union(empty)[0]) == 0
+    assert len(piso.core.intersection(empty, to_operand(make_ia1()))[0]) == 0
+    assert len(piso.core.split(empty, np.array([1.0]))[0]) == 0
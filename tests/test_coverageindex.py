@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+
+
+def make_ia(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)], closed=closed
+    )
+
+
+RANGES = [(0, 30), (2, 11), (4, 6), (7, 10), (12, 21), (-5, 0), (26, 40)]
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("how", ["sum", "fraction"])
+def test_scalar_queries_match_coverage(closed, how):
+    ia = make_ia(closed)
+    index = piso.CoverageIndex(ia)
+    method = index.covered_length if how == "sum" else index.fraction
+    for start, end in RANGES:
+        expected = piso.coverage(ia, (start, end), how=how)
+        result = method(start, end)
+        assert np.ndim(result) == 0
+        assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("how", ["sum", "fraction"])
+def test_vectorized_queries_match_coverage(how):
+    ia = make_ia()
+    index = piso.CoverageIndex(piso.IntervalSet.from_intervals(ia))
+    method = index.covered_length if how == "sum" else index.fraction
+    starts, ends = zip(*RANGES)
+    expected = [piso.coverage(ia, r, how=how) for r in RANGES]
+    np.testing.assert_allclose(method(list(starts), np.array(ends)), expected)
+
+
+def test_broadcasting():
+    index = piso.CoverageIndex(make_ia())
+    np.testing.assert_array_equal(index.covered_length(0, [5, 10, 30]), [4, 6, 14])
+
+
+def test_datetime_queries():
+    ia = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-01", "2021-01-03"]),
+        pd.to_datetime(["2021-01-02", "2021-01-05"]),
+    )
+    index = piso.CoverageIndex(ia)
+    start, end = pd.Timestamp("2021-01-01"), pd.Timestamp("2021-01-04")
+    assert index.covered_length(start, end) == pd.Timedelta(days=2)
+    assert index.fraction(start, end) == pytest.approx(2 / 3)
+
+
+def test_empty_and_zero_length_ranges():
+    index = piso.CoverageIndex(pd.arrays.IntervalArray.from_tuples([], closed="left"))
+    np.testing.assert_array_equal(index.covered_length([1, 2], [3, 4]), [0, 0])
+    assert np.isnan(piso.CoverageIndex(make_ia()).fraction(2, 2))
+
+
+def test_invalid_range():
+    with pytest.raises(ValueError):
+        piso.CoverageIndex(make_ia()).covered_length(5, 1)
+
+
+def test_opened_store(tmp_path):
+    piso.IntervalSet.from_intervals(make_ia()).save(tmp_path)
+    opened = piso.IntervalSet.open(tmp_path)
+    index = piso.CoverageIndex(opened)
+    assert index.interval_set is opened
+    assert index._prefix is opened._prefix_lengths
+    assert index.covered_length(0, 30) == 14
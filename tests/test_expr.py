@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+
+import piso
+import piso.expr
+from piso._exceptions import ClosedMismatchError
+
+
+def make_arrays(closed):
+    return (
+        pd.arrays.IntervalArray.from_tuples(
+            [(0, 4), (2, 5), (7, 8), (10, 12)], closed=closed
+        ),
+        pd.arrays.IntervalArray.from_tuples([(3, 9), (11, 15)], closed=closed),
+        pd.arrays.IntervalArray.from_tuples([(1, 2), (6, 11)], closed=closed),
+        pd.arrays.IntervalArray.from_tuples([(4, 7), (14, 16)], closed=closed),
+    )
+
+
+def assert_interval_array_equal(interval_array, expected):
+    pd._testing.assert_interval_array_equal(interval_array, expected, exact=False)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "make_expr, make_expected",
+    [
+        (
+            lambda A, B, C, D: (A & B) - (C | D),
+            lambda a, b, c, d: piso.difference(piso.intersection(a, b), c, d),
+        ),
+        (
+            lambda A, B, C, D: A | B | C,
+            lambda a, b, c, d: piso.union(a, b, c),
+        ),
+        (
+            lambda A, B, C, D: (A ^ B) & D,
+            lambda a, b, c, d: piso.intersection(piso.symmetric_difference(a, b), d),
+        ),
+        (
+            lambda A, B, C, D: (A - B) | (B - A),
+            lambda a, b, c, d: piso.symmetric_difference(a, b),
+        ),
+        (
+            lambda A, B, C, D: A - A,
+            lambda a, b, c, d: a[:0],
+        ),
+    ],
+)
+def test_evaluate(closed, make_expr, make_expected):
+    arrays = make_arrays(closed)
+    expr = make_expr(*piso.expr.operands(*arrays))
+    expected = make_expected(*arrays)
+    assert_interval_array_equal(expr.evaluate(), expected)
+    assert_interval_array_equal(piso.expr.evaluate(expr), expected)
+
+
+@pytest.mark.parametrize(
+    "return_type",
+    ["infer", pd.IntervalIndex, pd.arrays.IntervalArray, piso.IntervalSet],
+)
+def test_return_type(return_type):
+    a, b, _, _ = make_arrays("right")
+    A = piso.expr.operands(pd.IntervalIndex(a))
+    result = (A | b).evaluate(return_type=return_type)
+    expected_type = pd.IntervalIndex if return_type == "infer" else return_type
+    assert isinstance(result, expected_type)
+
+
+def test_datetime_operands():
+    a, b, _, _ = make_arrays("left")
+
+    def to_dates(arr):
+        return arr.from_arrays(
+            pd.Timestamp("2021") + pd.to_timedelta(arr.left, unit="D"),
+            pd.Timestamp("2021") + pd.to_timedelta(arr.right, unit="D"),
+            closed=arr.closed,
+        )
+
+    a, b = to_dates(a), to_dates(b)
+    A, B = piso.expr.operands(a, b)
+    assert_interval_array_equal((A - B).evaluate(), piso.difference(a, b))
+
+
+def test_closed_mismatch():
+    a, _, _, _ = make_arrays("right")
+    _, b, _, _ = make_arrays("left")
+    A, B = piso.expr.operands(a, b)
+    with pytest.raises(ClosedMismatchError):
+        (A | B).evaluate()
+
+
+def test_invalid_operand():
+    with pytest.raises(ValueError):
+        piso.expr.Operand([(0, 1)])
+
+
+def test_expr_is_abstract():
+    with pytest.raises(TypeError):
+        piso.expr.Expr()
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso.testing import generators
+
+GENERATORS = [
+    generators.poisson_intervals,
+    generators.tiling_intervals,
+    generators.nested_intervals,
+    generators.burst_intervals,
+]
+
+
+@pytest.mark.parametrize(
+    "generator",
+    GENERATORS,
+)
+@pytest.mark.parametrize(
+    "dtype, subtype",
+    [
+        ("float", "float64"),
+        ("int", "int64"),
+        ("datetime", "datetime64[ns]"),
+        ("timedelta", "timedelta64[ns]"),
+    ],
+)
+@pytest.mark.parametrize(
+    "return_type",
+    [pd.arrays.IntervalArray, pd.IntervalIndex],
+)
+def test_types(generator, dtype, subtype, return_type):
+    result = generator(100, dtype=dtype, closed="left", return_type=return_type)
+    assert isinstance(result, return_type)
+    assert result.dtype.subtype == subtype
+    assert result.closed == "left"
+    assert (result.left < result.right).all()
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        generators.poisson_intervals,
+        generators.tiling_intervals,
+        generators.burst_intervals,
+    ],
+)
+def test_size(generator):
+    assert len(generator(1000)) == 1000
+
+
+@pytest.mark.parametrize(
+    "generator",
+    GENERATORS,
+)
+def test_seeded(generator):
+    result1 = generator(100, sortedness=0.5, seed=7)
+    result2 = generator(100, sortedness=0.5, seed=7)
+    pd._testing.assert_interval_array_equal(result1, result2)
+
+
+@pytest.mark.parametrize(
+    "generator",
+    GENERATORS,
+)
+def test_sortedness(generator):
+    assert generator(100, seed=0).left.is_monotonic_increasing
+    assert not generator(100, sortedness=0, seed=0).left.is_monotonic_increasing
+
+
+def test_tiling_disjoint():
+    result = generators.tiling_intervals(1000, gap_probability=0.5, jitter=0.5, seed=0)
+    assert piso.isdisjoint(result)
+    assert len(piso.union(result)) > 1
+
+
+def test_nested_depth():
+    result = generators.nested_intervals(64, levels=3, branching=4)
+    assert len(result) == 64 + 16 + 4
+    assert piso.coverage(result) == 1
+    np.testing.assert_array_equal(
+        piso.contains(result, [0.5, 31.5, 63.5], result="cartesian").sum(axis=0), 3
+    )
+
+
+def test_poisson_overlap():
+    result = generators.poisson_intervals(
+        10000, rate=2, mean_duration=3, shape=3, seed=0
+    )
+    mean_depth = np.sum(result.length) / (result.right.max() - result.left.min())
+    assert 4 < mean_depth < 8
+
+
+def test_interval_frame():
+    result = generators.interval_frame(50, columns=["A", "B"], seed=0)
+    assert list(result.columns) == ["A", "B"]
+    assert len(result) == 50
+    assert not result.index.is_overlapping
+    pd.testing.assert_frame_equal(
+        result, generators.interval_frame(50, columns=["A", "B"], seed=0)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"dtype": "complex"},
+        {"closed": "up"},
+        {"return_type": list},
+        {"sortedness": 2},
+    ],
+)
+def test_invalid_args(kwargs):
+    with pytest.raises(ValueError):
+        generators.poisson_intervals(10, **kwargs)
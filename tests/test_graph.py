@@ -516,3 +516,32 @@ def test_adjacency_matrix_set_of_sets_edges_exception(closed, how):
             function=piso_graph.adjacency_matrix,
             edges="not_an_option",
         )
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_adjacency_matrix_dense_allocation_error(interval_index, closed, how):
+    interval_list = make_interval_list(interval_index=interval_index, closed=closed)
+    with piso.option_context("max_dense_bytes", 100):
+        with pytest.raises(piso.DenseAllocationError):
+            perform_op(
+                *interval_list,
+                how=how,
+                function=piso_graph.adjacency_matrix,
+            )
+        result = perform_op(
+            interval_list[0],
+            how=how,
+            function=piso_graph.adjacency_matrix,
+        )
+    assert result.shape == (len(interval_list[0]), len(interval_list[0]))
@@ -0,0 +1,276 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso._exceptions import ClosedMismatchError
+
+
+def make_ia(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)], closed=closed
+    )
+
+
+BATCHES = [
+    [(7, 8)],
+    [(-3, -1), (30, 31)],
+    [(8, 10), (13, 14), (15, 16)],
+    [(0, 40)],
+]
+
+
+def random_batches(seed, num_batches, size):
+    rng = np.random.default_rng(seed)
+    for _ in range(num_batches):
+        lefts = rng.integers(0, 1000, size)
+        yield pd.arrays.IntervalArray.from_arrays(
+            lefts, lefts + rng.integers(1, 20, size)
+        )
+
+
+def assert_matches_union(incremental, intervals):
+    expected = piso.union(pd.arrays.IntervalArray(np.concatenate(intervals)))
+    pd.testing.assert_index_equal(
+        incremental.to_index(), pd.IntervalIndex(expected), exact=False
+    )
+    assert incremental.total_length == np.sum(expected.length)
+    assert len(incremental) == len(expected)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_add(closed):
+    ia = make_ia(closed)
+    incremental = piso.IncrementalUnion(ia)
+    added = [ia]
+    for batch in BATCHES:
+        batch = pd.arrays.IntervalArray.from_tuples(batch, closed=closed)
+        incremental.add(batch)
+        added.append(batch)
+        assert_matches_union(incremental, added)
+    assert incremental.closed == closed
+
+
+def test_add_random():
+    incremental = piso.IncrementalUnion()
+    added = []
+    for batch in random_batches(42, 20, 25):
+        incremental.add(batch)
+        added.append(batch)
+        assert_matches_union(incremental, added)
+
+
+def test_add_interval_set_and_index():
+    incremental = piso.IncrementalUnion(piso.IntervalSet.from_intervals(make_ia()))
+    incremental.add(pd.IntervalIndex.from_tuples([(7, 10)]))
+    incremental.add(piso.IntervalSet([25, 0], [26, 1]))
+    assert incremental.to_array().to_tuples().tolist() == [(0, 13), (20, 26)]
+
+
+def test_add_empty():
+    incremental = piso.IncrementalUnion(make_ia())
+    before = incremental.interval_set
+    incremental.add(pd.arrays.IntervalArray([]))
+    assert incremental.interval_set is before
+
+
+def test_add_float_to_int():
+    incremental = piso.IncrementalUnion(make_ia())
+    incremental.add(pd.arrays.IntervalArray.from_tuples([(7.5, 8.5)]))
+    assert incremental.to_array().to_tuples().tolist()[1] == (7.5, 8.5)
+
+
+def test_views_unaffected_by_add():
+    incremental = piso.IncrementalUnion(make_ia())
+    index = incremental.to_index()
+    interval_set = incremental.interval_set
+    expected = index.copy()
+    incremental.add(pd.arrays.IntervalArray.from_tuples([(0, 40)]))
+    pd.testing.assert_index_equal(index, expected)
+    assert len(interval_set) == 3
+
+
+def test_closed_mismatch():
+    incremental = piso.IncrementalUnion(make_ia("right"))
+    with pytest.raises(ClosedMismatchError):
+        incremental.add(make_ia("left"))
+
+
+def test_empty_union_adopts_closed():
+    incremental = piso.IncrementalUnion()
+    incremental.add(make_ia("left"))
+    assert incremental.closed == "left"
+    assert incremental.total_length == 14
+
+
+@pytest.mark.parametrize(
+    "domain", [None, (0, 30), (2, 11), pd.Interval(12, 21), (26, 40)]
+)
+def test_coverage(domain):
+    incremental = piso.IncrementalUnion(make_ia())
+    added = [make_ia()]
+    for batch in BATCHES[:-1]:
+        batch = pd.arrays.IntervalArray.from_tuples(batch)
+        incremental.add(batch)
+        added.append(batch)
+        expected = piso.coverage(pd.arrays.IntervalArray(np.concatenate(added)), domain)
+        assert incremental.coverage(domain) == pytest.approx(expected)
+
+
+def test_datetime():
+    ia = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-01", "2021-01-03"]).tz_localize("Europe/Paris"),
+        pd.to_datetime(["2021-01-02", "2021-01-05"]).tz_localize("Europe/Paris"),
+    )
+    incremental = piso.IncrementalUnion(ia)
+    incremental.add(
+        pd.IntervalIndex.from_arrays(
+            pd.to_datetime(["2021-01-02"]).tz_localize("Europe/Paris"),
+            pd.to_datetime(["2021-01-03"]).tz_localize("Europe/Paris"),
+        )
+    )
+    result = incremental.to_index()
+    assert len(result) == 1
+    assert result[0].left == pd.Timestamp("2021-01-01", tz="Europe/Paris")
+    assert incremental.total_length == pd.Timedelta(days=4)
+    assert incremental.coverage(
+        (
+            pd.Timestamp("2021-01-01", tz="Europe/Paris"),
+            pd.Timestamp("2021-01-09", tz="Europe/Paris"),
+        )
+    ) == pytest.approx(0.5)
+
+
+def assert_matches(incremental, expected):
+    pd.testing.assert_index_equal(
+        incremental.to_index(), pd.IntervalIndex(expected), exact=False
+    )
+    assert incremental.total_length == np.sum(expected.length)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize(
+    "removed",
+    [
+        [(2, 3)],
+        [(0, 2), (6, 11)],
+        [(5, 6), (7, 10), (13, 20)],
+        [(0, 30)],
+        [(7, 10), (30, 31)],
+    ],
+)
+def test_remove(closed, removed):
+    ia = make_ia(closed)
+    incremental = piso.IncrementalUnion(ia)
+    removed = pd.arrays.IntervalArray.from_tuples(removed, closed=closed)
+    incremental.remove(removed)
+    assert_matches(incremental, piso.difference(ia, removed))
+
+
+def test_add_and_remove_random():
+    incremental = piso.IncrementalUnion()
+    expected = pd.arrays.IntervalArray([])
+    for i, batch in enumerate(random_batches(7, 30, 25)):
+        if i % 3 == 2:
+            incremental.remove(batch)
+            expected = piso.difference(expected, batch)
+        else:
+            incremental.add(batch)
+            expected = piso.union(expected, batch)
+        assert_matches(incremental, expected)
+
+
+def test_remove_no_overlap():
+    incremental = piso.IncrementalUnion(make_ia())
+    before = incremental.snapshot()
+    incremental.remove(pd.arrays.IntervalArray.from_tuples([(7, 10), (30, 31)]))
+    incremental.remove(pd.arrays.IntervalArray([]))
+    assert incremental.snapshot() is before
+    assert incremental.version == 0
+
+
+def test_remove_float_from_int():
+    incremental = piso.IncrementalUnion(make_ia())
+    incremental.remove(pd.arrays.IntervalArray.from_tuples([(2.5, 3.5)]))
+    assert incremental.to_array().to_tuples().tolist()[:2] == [(1, 2.5), (3.5, 7)]
+    assert incremental.total_length == 13
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize(
+    "domain", [(0, 30), (2, 11), (4, 6), (7, 10), pd.Interval(12, 21), (26, 40)]
+)
+def test_clip(closed, domain):
+    ia = make_ia(closed)
+    incremental = piso.IncrementalUnion(ia)
+    incremental.clip(domain)
+    if isinstance(domain, pd.Interval):
+        domain = (domain.left, domain.right)
+    expected = piso.intersection(
+        piso.union(ia),
+        pd.arrays.IntervalArray.from_tuples([domain], closed=closed),
+    )
+    assert_matches(incremental, expected)
+
+
+def test_clip_empty():
+    incremental = piso.IncrementalUnion()
+    incremental.clip((0, 1))
+    assert len(incremental) == 0
+
+
+@pytest.mark.parametrize("domain", [(5, 5), (10, 5), None])
+@pytest.mark.parametrize("empty", [True, False])
+def test_clip_invalid_domain(domain, empty):
+    incremental = piso.IncrementalUnion() if empty else piso.IncrementalUnion(make_ia())
+    with pytest.raises(ValueError):
+        incremental.clip(domain)
+    assert incremental.version == 0
+
+
+def test_snapshots_and_versions():
+    incremental = piso.IncrementalUnion(make_ia())
+    first = incremental.snapshot()
+    incremental.add(pd.arrays.IntervalArray.from_tuples([(7, 10)]))
+    second = incremental.snapshot()
+    incremental.remove(pd.arrays.IntervalArray.from_tuples([(0, 40)]))
+    incremental.clip((0, 1))  # no change to an empty union
+    assert incremental.version == 2
+    assert first.to_array().to_tuples().tolist() == [(1, 7), (10, 13), (20, 25)]
+    assert first.total_length == 14
+    assert second.to_array().to_tuples().tolist() == [(1, 13), (20, 25)]
+    assert second.total_length == 17
+    assert len(incremental.snapshot()) == 0
+
+
+def test_concurrent_readers():
+    incremental = piso.IncrementalUnion()
+    batches = list(random_batches(3, 50, 10))
+    errors = []
+
+    def read():
+        for _ in range(200):
+            snapshot = incremental.snapshot()
+            if len(snapshot) == 0:
+                continue
+            lengths = snapshot.rights - snapshot.lefts
+            if lengths.sum() != snapshot.total_length or not snapshot.is_disjoint:
+                errors.append(snapshot)
+
+    def write():
+        for i, batch in enumerate(batches):
+            if i % 2:
+                incremental.remove(batch)
+            else:
+                incremental.add(batch)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    threads += [threading.Thread(target=write) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert incremental.version <= len(batches) * 2
@@ -671,3 +671,119 @@ def test_issubset(tuples, squeeze, expected, closed):
     result = piso_interval.issubset(*intervals, squeeze=squeeze)
     equal_op = np.array_equal if isinstance(expected, np.ndarray) else operator.eq
     assert equal_op(result, expected)
+
+
+def make_all_pairs(closed):
+    pairs = make_all_overlapping_intervals(closed)
+    for pair in (make_adjacent_intervals(closed), make_disjoint_intervals(closed)):
+        pairs += [pair, pair[::-1]]
+    return pairs
+
+
+@pytest.mark.parametrize(
+    "operation",
+    ["union", "intersection", "difference", "symmetric_difference"],
+)
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("klass", [pd.arrays.IntervalArray, pd.IntervalIndex])
+def test_pairwise_matches_scalar(operation, closed, klass):
+    pairs = make_all_pairs(closed)
+    arr1 = klass([pair[0] for pair in pairs])
+    arr2 = klass([pair[1] for pair in pairs])
+    result, counts = getattr(piso_interval, f"pairwise_{operation}")(arr1, arr2)
+    assert isinstance(result, klass)
+    expected = [
+        getattr(piso_interval, operation)(*pair, squeeze=False) for pair in pairs
+    ]
+    np.testing.assert_array_equal(counts, [len(e) for e in expected])
+    pd._testing.assert_interval_array_equal(
+        pd.arrays.IntervalArray(result),
+        pd.arrays.IntervalArray(
+            [interval for e in expected for interval in e], closed=closed
+        ),
+        exact=False,
+    )
+
+
+def test_pairwise_datetime():
+    arr1 = pd.arrays.IntervalArray.from_arrays(
+        pd.to_datetime(["2021-01-01", "2021-01-03"]).tz_localize("UTC"),
+        pd.to_datetime(["2021-01-04", "2021-01-05"]).tz_localize("UTC"),
+    )
+    arr2 = pd.arrays.IntervalArray.from_arrays(
+        pd.to_datetime(["2021-01-02", "2021-01-06"]).tz_localize("UTC"),
+        pd.to_datetime(["2021-01-03", "2021-01-07"]).tz_localize("UTC"),
+    )
+    result, counts = piso_interval.pairwise_intersection(arr1, arr2)
+    np.testing.assert_array_equal(counts, [1, 0])
+    assert result[0] == pd.Interval(
+        pd.Timestamp("2021-01-02", tz="UTC"), pd.Timestamp("2021-01-03", tz="UTC")
+    )
+
+
+def test_pairwise_length_mismatch():
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 1), (1, 2)])
+    with pytest.raises(ValueError):
+        piso_interval.pairwise_union(arr, arr[:1])
+
+
+def test_pairwise_closed_mismatch():
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 1), (1, 2)])
+    with pytest.raises(ClosedMismatchError):
+        piso_interval.pairwise_union(arr, arr.set_closed("left"))
+
+
+@pytest.mark.parametrize(
+    "operation",
+    ["union", "intersection", "difference", "symmetric_difference"],
+)
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_return_type_tuples(operation, closed):
+    func = getattr(piso_interval, operation)
+    for pair in make_all_pairs(closed):
+        result = func(*pair, return_type="tuples")
+        assert isinstance(result, tuple)
+        expected = func(*pair, squeeze=False)
+        assert result == tuple(zip(expected.left, expected.right))
+
+
+def test_return_type_tuples_validates():
+    with pytest.raises(ClosedMismatchError):
+        piso_interval.union(
+            pd.Interval(0, 1), pd.Interval(0, 1, closed="left"), return_type="tuples"
+        )
+
+
+@pytest.mark.parametrize("which", ["issuperset", "issubset"])
+@pytest.mark.parametrize("klass", [pd.arrays.IntervalArray, pd.IntervalIndex])
+@pytest.mark.parametrize("date_type", [None, "timestamp_tz"])
+def test_is_sub_or_superset_interval_arrays(which, klass, date_type):
+    def convert(x):
+        if date_type is None:
+            return x
+        return pd.Timestamp("2021-10-1", tz="UTC") + pd.Timedelta(days=x)
+
+    tuples1 = [(0, 4), (1, 3), (2, 5), (1, 2)]
+    tuples2 = [(1, 2), (1, 3), (1, 4), (0, 5)]
+    intervals1 = [pd.Interval(convert(a), convert(b)) for a, b in tuples1]
+    intervals2 = [pd.Interval(convert(a), convert(b)) for a, b in tuples2]
+    func = getattr(piso_interval, which)
+
+    pairwise = func(klass(intervals1), klass(intervals2))
+    expected = [func(i1, i2) for i1, i2 in zip(intervals1, intervals2)]
+    np.testing.assert_array_equal(pairwise, expected)
+
+    many = func(intervals1[0], klass(intervals2))
+    np.testing.assert_array_equal(many, func(intervals1[0], *intervals2))
+
+    reverse = func(klass(intervals1), intervals2[0])
+    expected = [func(i1, intervals2[0]) for i1 in intervals1]
+    np.testing.assert_array_equal(reverse, expected)
+
+
+@pytest.mark.parametrize("which", ["issuperset", "issubset"])
+@pytest.mark.parametrize("length", [1, 2])
+def test_is_sub_or_superset_length_mismatch(which, length):
+    arr = pd.arrays.IntervalArray.from_tuples([(0, 3), (1, 2), (4, 5)])
+    with pytest.raises(ValueError):
+        getattr(piso_interval, which)(arr, arr[:length])
@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso._exceptions import (
+    ClosedMismatchError,
+    ClosedValueError,
+    DegenerateIntervalError,
+)
+
+
+def make_date(x, date_type):
+    ts = pd.Timestamp(f"2021-10-{x}")
+    if date_type == "timestamp_tz":
+        return ts.tz_localize("Australia/Sydney")
+    if date_type == "timedelta":
+        return ts - pd.Timestamp("2021-10-1")
+    return ts
+
+
+def map_to_dates(interval_array, date_type):
+    if date_type is None:
+        return interval_array
+    return interval_array.from_arrays(
+        [make_date(x, date_type) for x in interval_array.left],
+        [make_date(x, date_type) for x in interval_array.right],
+        closed=interval_array.closed,
+    )
+
+
+def make_ia1(closed, date_type=None):
+    ia = pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)],
+        closed=closed,
+    )
+    return map_to_dates(ia, date_type)
+
+
+def make_ia2(closed, date_type=None):
+    ia = pd.arrays.IntervalArray.from_tuples(
+        [(2, 4), (6, 11), (15, 18), (24, 28)],
+        closed=closed,
+    )
+    return map_to_dates(ia, date_type)
+
+
+def make_ia3(closed, date_type=None):
+    ia = pd.arrays.IntervalArray.from_tuples(
+        [(4, 9), (16, 22)],
+        closed=closed,
+    )
+    return map_to_dates(ia, date_type)
+
+
+def assert_interval_set_equal(interval_set, expected):
+    assert interval_set.is_sorted
+    assert interval_set.is_disjoint
+    pd._testing.assert_interval_array_equal(
+        interval_set.to_array(),
+        expected,
+        exact=False,
+    )
+
+
+def test_flags():
+    interval_set = piso.IntervalSet.from_intervals(make_ia1("right"))
+    assert interval_set.is_sorted
+    assert not interval_set.is_disjoint
+    assert interval_set.total_length == 14
+    assert interval_set.min == 1
+    assert interval_set.max == 25
+
+    interval_set = piso.IntervalSet([3, 0], [4, 1])
+    assert not interval_set.is_sorted
+    assert interval_set.is_disjoint
+    assert interval_set.min == 0
+    assert interval_set.max == 4
+
+
+def test_empty():
+    interval_set = piso.IntervalSet([], [])
+    assert len(interval_set) == 0
+    assert interval_set.total_length == 0
+    assert interval_set.min is None
+    assert interval_set.max is None
+    assert len(interval_set.complement()) == 0
+    assert not interval_set.contains([1, 2]).any()
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timestamp_tz", "timedelta", None],
+)
+def test_round_trip(interval_index, date_type):
+    ia = make_ia1("left", date_type)
+    if interval_index:
+        ia = pd.IntervalIndex(ia)
+        result = piso.IntervalSet.from_intervals(ia).to_index()
+        pd.testing.assert_index_equal(result, ia)
+    else:
+        result = piso.IntervalSet.from_intervals(ia).to_array()
+        pd._testing.assert_interval_array_equal(result, ia)
+
+
+def test_from_intervals_zero_copy():
+    ia = make_ia1("left")
+    interval_set = piso.IntervalSet.from_intervals(ia)
+    assert np.shares_memory(interval_set.lefts, ia.left.values)
+    assert np.shares_memory(interval_set.rights, ia.right.values)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timestamp_tz", "timedelta", None],
+)
+@pytest.mark.parametrize(
+    "method, function",
+    [
+        ("union", piso.union),
+        ("intersection", piso.intersection),
+        ("symmetric_difference", piso.symmetric_difference),
+        ("difference", piso.difference),
+    ],
+)
+def test_set_operations(closed, date_type, method, function):
+    arrays = [func(closed, date_type) for func in (make_ia1, make_ia2, make_ia3)]
+    unioned = [piso.union(arr) for arr in arrays]
+    interval_set = piso.IntervalSet.from_intervals(arrays[0])
+    result = getattr(interval_set, method)(*arrays[1:])
+    expected = function(*unioned)
+    assert_interval_set_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "op, function",
+    [
+        ("__or__", piso.union),
+        ("__and__", piso.intersection),
+        ("__xor__", piso.symmetric_difference),
+        ("__sub__", piso.difference),
+    ],
+)
+def test_operators(op, function):
+    ia1, ia2 = make_ia1("right"), make_ia2("right")
+    set1, set2 = (piso.IntervalSet.from_intervals(ia) for ia in (ia1, ia2))
+    result = getattr(set1, op)(set2)
+    expected = function(piso.union(ia1), piso.union(ia2))
+    assert_interval_set_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "domain",
+    [None, (0, 30), pd.Interval(3, 21)],
+)
+def test_complement(closed, domain):
+    ia = make_ia1(closed)
+    result = piso.IntervalSet.from_intervals(ia).complement(domain)
+    expected = piso.complement(ia, domain)
+    assert_interval_set_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+def test_contains(closed):
+    interval_set = piso.IntervalSet.from_intervals(make_ia1(closed))
+    x = [0, 1, 2, 7, 10, 12, 13, 25, 26]
+    result = interval_set.contains(x)
+    expected = piso.contains(make_ia1(closed), x, result="points").values
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_predicates():
+    set1 = piso.IntervalSet.from_intervals(make_ia1("right"))
+    set2 = piso.IntervalSet.from_intervals(make_ia2("right"))
+    assert not set1.isdisjoint(set2)
+    assert set1.isdisjoint(set1.complement())
+    assert (set1 | set2).issuperset(set2)
+    assert not set2.issuperset(set1)
+    assert (set1 & set2).issubset(set1)
+    assert set1.equals(set1.normalize().to_array())
+    assert not set1.equals(set2)
+
+
+def test_closed_mismatch():
+    set1 = piso.IntervalSet.from_intervals(make_ia1("right"))
+    with pytest.raises(ClosedMismatchError):
+        set1.union(make_ia2("left"))
+
+
+def test_invalid_closed():
+    with pytest.raises(ClosedValueError):
+        piso.IntervalSet([0], [1], closed="both")
+
+
+@pytest.mark.parametrize(
+    "lefts, rights",
+    [([3, 0], [1, 2]), ([0.0, np.nan], [1.0, 2.0]), ([5, 3], [5, 1])],
+)
+def test_invalid_endpoints(lefts, rights):
+    with pytest.raises(ValueError, match="less than") as excinfo:
+        piso.IntervalSet(lefts, rights)
+    assert not isinstance(excinfo.value, DegenerateIntervalError)
+
+
+def test_zero_length_intervals():
+    with pytest.raises(DegenerateIntervalError):
+        piso.IntervalSet([0, 5], [1, 5])
+
+
+def test_from_intervals_zero_length():
+    with pytest.raises(DegenerateIntervalError):
+        piso.IntervalSet.from_intervals(
+            pd.arrays.IntervalArray.from_tuples([(0, 1), (5, 5)])
+        )
+
+
+@pytest.mark.parametrize("date_type", [None, "timestamp", "timestamp_tz", "timedelta"])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_and_open(tmp_path, date_type, closed, mmap):
+    interval_set = piso.IntervalSet.from_intervals(make_ia1(closed, date_type))
+    interval_set.save(tmp_path / "store")
+    opened = piso.IntervalSet.open(tmp_path / "store", mmap=mmap)
+    assert isinstance(opened.lefts.base, np.memmap) == mmap
+    assert opened.closed == closed
+    assert opened.total_length == interval_set.total_length
+    assert opened.equals(interval_set)
+    assert_interval_set_equal(opened, piso.union(make_ia1(closed, date_type)))
+
+
+def test_save_and_open_empty(tmp_path):
+    interval_set = piso.IntervalSet([], [], closed="left")
+    interval_set.save(tmp_path)
+    opened = piso.IntervalSet.open(tmp_path)
+    assert len(opened) == 0
+    assert opened.closed == "left"
+    assert opened.total_length == 0
+
+
+def test_open_unsupported_version(tmp_path):
+    piso.IntervalSet.from_intervals(make_ia1("right")).save(tmp_path)
+    (tmp_path / "metadata.json").write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        piso.IntervalSet.open(tmp_path)
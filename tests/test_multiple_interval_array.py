@@ -20,6 +20,7 @@ def get_accessor_method(self, function):
         piso_intervalarray.isdisjoint: self.piso.isdisjoint,
         piso_intervalarray.issuperset: self.piso.issuperset,
         piso_intervalarray.issubset: self.piso.issubset,
+        piso_intervalarray.depth: self.piso.depth,
     }[function]
 
 
@@ -32,6 +33,7 @@ def get_package_method(function):
         piso_intervalarray.isdisjoint: piso.isdisjoint,
         piso_intervalarray.issuperset: piso.issuperset,
         piso_intervalarray.issubset: piso.issubset,
+        piso_intervalarray.depth: piso.depth,
     }[function]
 
 
@@ -484,6 +486,36 @@ def test_difference_empty_array(closed, interval_index, return_type, how):
     )
 
 
+@pytest.mark.parametrize(
+    "function",
+    [
+        piso_intervalarray.intersection,
+        piso_intervalarray.difference,
+        piso_intervalarray.symmetric_difference,
+    ],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_empty_result_arrays_dtype(function, how):
+    interval_array = pd.arrays.IntervalArray.from_tuples(
+        [(pd.Timestamp("2017-01-01T12"), pd.Timestamp("2018-01-01T12"))]
+    )
+    other = (
+        interval_array
+        if function is not piso_intervalarray.intersection
+        else pd.arrays.IntervalArray.from_tuples(
+            [(pd.Timestamp("2019-01-01"), pd.Timestamp("2020-01-01"))]
+        )
+    )
+    lefts, rights = perform_op(
+        interval_array, other, return_type="arrays", how=how, function=function
+    )
+    assert len(lefts) == 0 and len(rights) == 0
+    assert lefts.dtype == rights.dtype == interval_array.left.dtype
+
+
 def map_to_dates(interval_array, date_type):
     def make_date(x):
         ts = pd.Timestamp(f"2021-10-{x}")
@@ -615,3 +647,72 @@ def test_issubset(interval_index, ia_makers, squeeze, expected, closed, how):
     )
     equal_op = np.array_equal if isinstance(expected, np.ndarray) else operator.eq
     assert equal_op(result, expected)
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_depth(interval_index, closed, how):
+    ias = [
+        make_ia(interval_index, closed) for make_ia in (make_ia1, make_ia2, make_ia3)
+    ]
+    breakpoints, values = perform_op(
+        *ias,
+        how=how,
+        function=piso_intervalarray.depth,
+    )
+    np.testing.assert_array_equal(breakpoints, [0, 3, 4, 6, 7, 8, 9, 10, 11, 12])
+    np.testing.assert_array_equal(values, [2, 3, 2, 0, 1, 2, 1, 2, 1])
+
+
+def test_depth_weights_invalid():
+    with pytest.raises(ValueError):
+        piso.depth(make_ia1(False, "left"), make_ia2(False, "left"), weights=[1] * 6)
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "return_type",
+    ["infer", pd.IntervalIndex, pd.arrays.IntervalArray],
+)
+@pytest.mark.parametrize(
+    "how",
+    ["supplied", "accessor", "package"],
+)
+def test_intersection_thresholds(interval_index, closed, return_type, how):
+    ias = [
+        make_ia(interval_index, closed) for make_ia in (make_ia1, make_ia2, make_ia3)
+    ]
+    thresholds = [1, 2, "all"]
+    result = perform_op(
+        *ias,
+        how=how,
+        function=piso_intervalarray.intersection,
+        min_overlaps=thresholds,
+        return_type=return_type,
+    )
+    assert list(result) == thresholds
+    for min_overlaps in thresholds:
+        expected = piso.intersection(
+            *ias, min_overlaps=min_overlaps, return_type=return_type
+        )
+        assert type(result[min_overlaps]) is type(expected)
+        pd.testing.assert_index_equal(
+            pd.IntervalIndex(result[min_overlaps]), pd.IntervalIndex(expected)
+        )
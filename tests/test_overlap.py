@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso._exceptions import ClosedMismatchError
+
+
+def make_random_arrays(seed, n, m, closed="right"):
+    rng = np.random.default_rng(seed)
+    lefts1 = rng.integers(0, 50, n)
+    lefts2 = rng.integers(0, 50, m)
+    return (
+        pd.arrays.IntervalArray.from_arrays(
+            lefts1, lefts1 + rng.integers(1, 10, n), closed=closed
+        ),
+        pd.arrays.IntervalArray.from_arrays(
+            lefts2, lefts2 + rng.integers(1, 10, m), closed=closed
+        ),
+    )
+
+
+def dense_overlaps(interval_array1, interval_array2):
+    return np.minimum.outer(
+        interval_array1.right.values, interval_array2.right.values
+    ) - np.maximum.outer(interval_array1.left.values, interval_array2.left.values)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("seed", range(5))
+def test_overlap_length_and_iou(closed, seed):
+    arr1, arr2 = make_random_arrays(seed, 40, 40, closed)
+    expected = np.maximum(np.diagonal(dense_overlaps(arr1, arr2)), 0)
+    np.testing.assert_array_equal(piso.overlap_length(arr1, arr2), expected)
+    union_lengths = arr1.length + arr2.length - expected
+    np.testing.assert_allclose(piso.iou(arr1, arr2), expected / union_lengths)
+
+
+def test_overlap_length_datetime():
+    arr1 = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-01", "2021-01-03"]),
+        pd.to_datetime(["2021-01-04", "2021-01-05"]),
+    )
+    arr2 = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-02", "2021-01-06"]),
+        pd.to_datetime(["2021-01-05", "2021-01-07"]),
+    )
+    result = piso.overlap_length(arr1, arr2)
+    np.testing.assert_array_equal(
+        result, pd.to_timedelta(["2D", "0D"]).values.astype(result.dtype)
+    )
+    np.testing.assert_allclose(piso.iou(arr1, arr2), [0.5, 0])
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("n, m", [(0, 0), (0, 5), (5, 0), (30, 30), (10, 50)])
+@pytest.mark.parametrize("seed", range(5))
+def test_overlap_pairs_matches_dense(closed, n, m, seed):
+    arr1, arr2 = make_random_arrays(seed, n, m, closed)
+    overlaps = dense_overlaps(arr1, arr2).reshape(n, m)
+    expected_i, expected_j = np.nonzero(overlaps > 0)
+    i, j, lengths = piso.overlap_pairs(arr1, arr2)
+    np.testing.assert_array_equal(i, expected_i)
+    np.testing.assert_array_equal(j, expected_j)
+    np.testing.assert_array_equal(lengths, overlaps[expected_i, expected_j])
+
+
+def test_length_mismatch():
+    arr1, arr2 = make_random_arrays(0, 3, 4)
+    with pytest.raises(ValueError):
+        piso.overlap_length(arr1, arr2)
+
+
+def test_closed_mismatch():
+    arr1, arr2 = make_random_arrays(0, 3, 3)
+    with pytest.raises(ClosedMismatchError):
+        piso.iou(arr1, arr2.set_closed("left"))
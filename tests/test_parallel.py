@@ -0,0 +1,114 @@
+import pandas as pd
+import pytest
+
+import piso
+import piso.parallel
+
+
+def make_frame(closed):
+    return pd.DataFrame(
+        {"asset": ["A", "A", "B", "B", "C"], "site": [1, 1, 1, 2, 2]},
+        index=pd.IntervalIndex.from_tuples(
+            [(0, 4), (3, 6), (1, 2), (5, 7), (8, 9)], closed=closed
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right"],
+)
+@pytest.mark.parametrize(
+    "n_threads",
+    [1, 4],
+)
+@pytest.mark.parametrize(
+    "batch_size",
+    [1, 3, 10000],
+)
+def test_map_groups_union(closed, n_threads, batch_size):
+    df = make_frame(closed)
+    result = piso.parallel.map_groups(
+        df, piso.union, by="asset", n_threads=n_threads, batch_size=batch_size
+    )
+    expected = pd.DataFrame(
+        {"asset": ["A", "B", "B", "C"]},
+        index=pd.IntervalIndex.from_tuples(
+            [(0, 6), (1, 2), (5, 7), (8, 9)], closed=closed
+        ),
+    )
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize(
+    "n_threads",
+    [1, 4],
+)
+def test_map_groups_union_multiple_keys(n_threads):
+    df = make_frame("right")
+    result = piso.parallel.map_groups(
+        df, piso.union, by=["asset", "site"], n_threads=n_threads, batch_size=1
+    )
+    expected = pd.DataFrame(
+        {"asset": ["A", "B", "B", "C"], "site": [1, 1, 2, 2]},
+        index=pd.IntervalIndex.from_tuples([(0, 6), (1, 2), (5, 7), (8, 9)]),
+    )
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize(
+    "n_threads",
+    [1, 4],
+)
+def test_map_groups_coverage(n_threads):
+    df = make_frame("right")
+    result = piso.parallel.map_groups(
+        df,
+        piso.coverage,
+        by="asset",
+        n_threads=n_threads,
+        batch_size=1,
+        domain=(0, 10),
+    )
+    expected = pd.Series([0.6, 0.3, 0.1], index=pd.Index(["A", "B", "C"], name="asset"))
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_map_groups_coverage_bins():
+    df = make_frame("right")
+    domain = pd.IntervalIndex.from_tuples([(0, 5), (5, 10)])
+    result = piso.parallel.map_groups(
+        df,
+        piso.coverage,
+        by="asset",
+        n_threads=2,
+        batch_size=1,
+        domain=domain,
+        bins=True,
+    )
+    expected = pd.Series(
+        [1.0, 0.2, 0.2, 0.4, 0.0, 0.2],
+        index=pd.MultiIndex.from_product(
+            [["A", "B", "C"], domain], names=["asset", None]
+        ),
+    )
+    pd.testing.assert_series_equal(result, expected, check_index_type=False)
+
+
+def test_map_groups_column():
+    df = make_frame("left").rename_axis("intervals").reset_index()
+    result = piso.parallel.map_groups(df, piso.union, by="asset", column="intervals")
+    expected = piso.parallel.map_groups(make_frame("left"), piso.union, by="asset")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_map_groups_invalid_index():
+    df = make_frame("left").reset_index(drop=True)
+    with pytest.raises(ValueError):
+        piso.parallel.map_groups(df, piso.union, by="asset")
+
+
+def test_map_groups_invalid_column():
+    df = make_frame("left")
+    with pytest.raises(ValueError):
+        piso.parallel.map_groups(df, piso.union, by="asset", column="site")
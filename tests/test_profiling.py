@@ -0,0 +1,113 @@
+import logging
+import threading
+
+import pandas as pd
+import pytest
+
+import piso
+
+
+def make_ia(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)],
+        closed=closed,
+    )
+
+
+def test_profile_union():
+    ia = make_ia()
+    with piso.profile() as prof:
+        piso.union(ia)
+    df = prof.to_frame()
+    assert list(df.columns) == [
+        "stage",
+        "depth",
+        "seconds",
+        "size",
+        "allocated_bytes",
+    ]
+    assert list(df["stage"]) == [
+        "_validate_intervals",
+        "_interval_x_to_stairs",
+        "_make_stairs",
+        "_boolean_stairs_to_interval_array",
+    ]
+    assert list(df["depth"]) == [0, 1, 0, 0]
+    # the union has 6 step points
+    assert list(df["size"]) == [5, 5, 5, 6]
+    assert (df["seconds"] >= 0).all()
+    assert df["allocated_bytes"].isna().all()
+
+
+def test_profile_memory():
+    ia = make_ia()
+    with piso.profile(memory=True) as prof:
+        piso.union(ia)
+    df = prof.to_frame()
+    assert (df["allocated_bytes"] > 0).all()
+    # nested stages allocate no more than their enclosing stage
+    outer = df.loc[df["stage"] == "_make_stairs", "allocated_bytes"].iloc[0]
+    inner = df.loc[df["stage"] == "_interval_x_to_stairs", "allocated_bytes"].iloc[0]
+    assert inner <= outer
+
+
+def test_profile_sweep_stages():
+    ia = make_ia()
+    with piso.profile() as prof:
+        piso.IntervalSet.from_intervals(ia).intersection(ia).to_array()
+    summary = prof.summary()
+    assert summary.loc["_normalize", "calls"] == 2
+    assert summary.loc["_normalize", "size"] == 10
+    assert "_count_operands" in summary.index
+    assert summary.loc["_arrays_to_interval_x", "size"] == 3
+    assert "_mask_to_intervals" in summary.index
+
+
+def test_profile_inactive():
+    with piso.profile() as prof:
+        pass
+    piso.union(make_ia())
+    assert prof.records == []
+    assert len(prof.summary()) == 0
+
+
+def test_profile_callback():
+    records = []
+    with piso.profile(callback=records.append) as prof:
+        piso.complement(make_ia())
+    assert records == prof.records
+    assert all(isinstance(record, piso.ProfileRecord) for record in records)
+
+
+def test_profile_threads():
+    with piso.profile() as prof:
+        thread = threading.Thread(target=piso.union, args=(make_ia(),))
+        thread.start()
+        thread.join()
+    assert list(prof.to_frame()["depth"]) == [0, 1, 0, 0]
+
+
+def test_profile_option_callback():
+    records = []
+    with piso.option_context("profile.callback", records.append):
+        with piso.option_context("profile", True):
+            piso.union(make_ia())
+        piso.union(make_ia())
+    assert len(records) == 4
+
+
+def test_profile_option_logging(caplog):
+    with caplog.at_level(logging.DEBUG, logger="piso.profile"):
+        with piso.option_context("profile", True):
+            piso.union(make_ia())
+    assert len(caplog.records) == 4
+    assert "_validate_intervals" in caplog.records[0].getMessage()
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [("profile", 1), ("profile.callback", "print")],
+)
+def test_profile_option_invalid(key, value):
+    with pytest.raises(ValueError):
+        piso.set_option(key, value)
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import piso
+from piso._exceptions import ClosedMismatchError
+
+
+def make_ia(closed="right"):
+    return pd.arrays.IntervalArray.from_tuples(
+        [(1, 5), (3, 7), (10, 12), (12, 13), (20, 25)], closed=closed
+    )
+
+
+def random_ia(seed, size):
+    rng = np.random.default_rng(seed)
+    lefts = np.sort(rng.integers(0, 1000, size))
+    return pd.arrays.IntervalArray.from_arrays(lefts, lefts + rng.integers(1, 50, size))
+
+
+def stream(ia, window, step, start, end, chunk_size, how="fraction"):
+    rolling = piso.RollingCoverage(window, step, start, how=how)
+    results = [
+        rolling.update(ia[i : i + chunk_size]) for i in range(0, len(ia), chunk_size)
+    ]
+    results.append(rolling.flush(end))
+    return pd.concat(results)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+@pytest.mark.parametrize(
+    "window, step, domain", [(4, 2, (0, 30)), (3, 1, (2, 11)), (5, 7, (-5, 40))]
+)
+def test_rolling_coverage_matches_coverage(closed, how, window, step, domain):
+    ia = make_ia(closed)
+    result = piso.rolling_coverage(ia, window, step, domain, how=how)
+    assert result.index.closed == closed
+    assert result.index[0].left == domain[0]
+    assert result.index[-1].right <= domain[1] < result.index[-1].right + step
+    for interval, value in result.items():
+        expected = piso.coverage(ia, (interval.left, interval.right), how=how)
+        assert value == pytest.approx(expected)
+
+
+def test_rolling_coverage_default_domain():
+    result = piso.rolling_coverage(make_ia(), 6, 6)
+    assert result.index.to_tuples().tolist() == [(1, 7), (7, 13), (13, 19), (19, 25)]
+    np.testing.assert_allclose(result.values, [1, 0.5, 0, 5 / 6])
+
+
+def test_rolling_coverage_domain_shorter_than_window():
+    result = piso.rolling_coverage(make_ia(), 10, 1, (0, 5))
+    assert len(result) == 0
+
+
+@pytest.mark.parametrize("window, step", [(0, 1), (1, 0), (-1, 1)])
+def test_rolling_coverage_invalid(window, step):
+    with pytest.raises(ValueError):
+        piso.rolling_coverage(make_ia(), window, step)
+
+
+def test_rolling_coverage_datetime():
+    ia = pd.IntervalIndex.from_arrays(
+        pd.to_datetime(["2021-01-01 00:00", "2021-01-01 12:00"]).tz_localize("UTC"),
+        pd.to_datetime(["2021-01-01 06:00", "2021-01-02 00:00"]).tz_localize("UTC"),
+    )
+    result = piso.rolling_coverage(
+        ia, pd.Timedelta(hours=12), pd.Timedelta(hours=6), how="fraction"
+    )
+    assert str(result.index.dtype.subtype).startswith("datetime64")
+    assert result.index[0].left == pd.Timestamp("2021-01-01", tz="UTC")
+    np.testing.assert_allclose(result.values, [0.5, 0.5, 1])
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+@pytest.mark.parametrize("window, step", [(20, 5), (50, 50), (10, 30), (3, 1)])
+def test_streaming_matches_rolling_coverage(closed, how, chunk_size, window, step):
+    ia = random_ia(42, 200).set_closed(closed)
+    result = stream(ia, window, step, -10, 1100, chunk_size, how=how)
+    expected = piso.rolling_coverage(ia, window, step, (-10, 1100), how=how)
+    pd.testing.assert_index_equal(result.index, expected.index)
+    np.testing.assert_allclose(result.values, expected.values)
+
+
+def test_streaming_emits_final_windows():
+    rolling = piso.RollingCoverage(4, 2, 0)
+    result = rolling.update(make_ia()[:2])
+    assert result.index.to_tuples().tolist() == []
+    result = rolling.update(make_ia()[2:])
+    assert result.index.to_tuples().tolist() == [
+        (0, 4),
+        (2, 6),
+        (4, 8),
+        (6, 10),
+        (8, 12),
+        (10, 14),
+        (12, 16),
+        (14, 18),
+        (16, 20),
+    ]
+    result = rolling.flush()
+    assert result.index.to_tuples().tolist() == [(18, 22), (20, 24)]
+    assert len(rolling.update(make_ia()[:0])) == 0
+
+
+def test_streaming_datetime():
+    ia = pd.IntervalIndex.from_arrays(
+        pd.date_range("2021-01-01", periods=10, freq="4h", tz="Europe/Paris"),
+        pd.date_range("2021-01-01 01:00", periods=10, freq="4h", tz="Europe/Paris"),
+    )
+    window, step = pd.Timedelta(hours=8), pd.Timedelta(hours=2)
+    rolling = piso.RollingCoverage(window, step, ia[0].left)
+    result = pd.concat(
+        [rolling.update(ia[:5]), rolling.update(ia[5:]), rolling.flush()]
+    )
+    expected = piso.rolling_coverage(ia, window, step)
+    pd.testing.assert_series_equal(result, expected)
+    assert str(result.index[0].left.tz) == "Europe/Paris"
+
+
+def test_streaming_unsorted():
+    rolling = piso.RollingCoverage(4, 2, 0)
+    rolling.update(make_ia()[2:])
+    with pytest.raises(ValueError):
+        rolling.update(make_ia()[:2])
+    with pytest.raises(ValueError):
+        rolling.update(make_ia()[::-1])
+
+
+def test_streaming_closed_mismatch():
+    rolling = piso.RollingCoverage(4, 2, 0)
+    rolling.update(make_ia("left")[:2])
+    with pytest.raises(ClosedMismatchError):
+        rolling.update(make_ia("right")[2:])
+
+
+def test_streaming_discards_intervals():
+    ia = random_ia(0, 5000)
+    rolling = piso.RollingCoverage(20, 10, 0)
+    for i in range(0, len(ia), 100):
+        rolling.update(ia[i : i + 100])
+    assert len(rolling._lefts) < 100
@@ -4,6 +4,7 @@ import pytest
 
 import piso
 import piso.intervalarray as piso_intervalarray
+import piso.util
 from piso import register_accessors
 
 register_accessors()
@@ -22,6 +23,7 @@ def get_accessor_method(self, function):
         piso_intervalarray.contains: self.piso.contains,
         piso_intervalarray.split: self.piso.split,
         piso_intervalarray.bridge: self.piso.bridge,
+        piso_intervalarray.depth: self.piso.depth,
     }[function]
 
 
@@ -38,6 +40,7 @@ def get_package_method(function):
         piso_intervalarray.contains: piso.contains,
         piso_intervalarray.split: piso.split,
         piso_intervalarray.bridge: piso.bridge,
+        piso_intervalarray.depth: piso.depth,
     }[function]
 
 
@@ -907,19 +910,29 @@ def test_contains(interval_index, x, closed, expected, method, include_index):
 )
 @pytest.mark.parametrize("result_type", ["points", "intervals"])
 @pytest.mark.parametrize("how", ["any", "all"])
+@pytest.mark.parametrize("max_dense_bytes", [None, 0])
 def test_contains_non_cartesian(
-    interval_index, x, closed, expected, method, include_index, result_type, how
+    interval_index,
+    x,
+    closed,
+    expected,
+    method,
+    include_index,
+    result_type,
+    how,
+    max_dense_bytes,
 ):
     ia = make_ia2(interval_index, closed)
-    result = perform_op(
-        ia,
-        x,
-        include_index,
-        method=method,
-        function=piso_intervalarray.contains,
-        result=result_type,
-        how=how,
-    )
+    with piso.option_context("max_dense_bytes", max_dense_bytes):
+        result = perform_op(
+            ia,
+            x,
+            include_index,
+            method=method,
+            function=piso_intervalarray.contains,
+            result=result_type,
+            how=how,
+        )
     axis = 0 if result_type == "points" else 1
     logical_func = np.all if how == "all" else np.any
     expected_result = logical_func(np.array(expected), axis=axis)
@@ -982,6 +995,35 @@ def test_split(interval_index, x, expected_tuples, closed, method, date_type):
     )
 
 
+@pytest.mark.parametrize(
+    "closed",
+    ["left", "right", "both", "neither"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+@pytest.mark.parametrize(
+    "x",
+    [[0], [4], [3.5], [0, 3, 4, 7], [4, 3, 4]],
+)
+def test_split_sweep(closed, date_type, x):
+    ia = map_to_dates(make_ia4(False, closed), date_type)
+    x = map_to_dates(x, date_type)
+    expected = piso_intervalarray.split(ia, x)
+    with piso.option_context("max_dense_bytes", 0):
+        result = piso_intervalarray.split(ia, x)
+    pd._testing.assert_interval_array_equal(result, expected)
+
+
+def test_contains_dense_allocation_error():
+    ia = make_ia2(False, "right")
+    with piso.option_context("max_dense_bytes", 20):
+        with pytest.raises(piso.DenseAllocationError, match="shape \\(3, 3\\)"):
+            piso_intervalarray.contains(ia, [1, 2, 3])
+        assert piso_intervalarray.contains(ia, [1, 2]).shape == (3, 2)
+
+
 @pytest.mark.parametrize(
     "interval_index",
     [True, False],
@@ -1026,3 +1068,312 @@ def test_bridge(interval_index, threshold, expected_tuples, closed, method, date
         expected,
         interval_index,
     )
+
+
+@pytest.mark.parametrize(
+    "interval_index",
+    [True, False],
+)
+@pytest.mark.parametrize(
+    "function",
+    [
+        piso_intervalarray.union,
+        piso_intervalarray.intersection,
+        piso_intervalarray.symmetric_difference,
+        piso_intervalarray.issuperset,
+        piso_intervalarray.issubset,
+        piso_intervalarray.complement,
+        piso_intervalarray.bridge,
+    ],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+def test_degenerate_intervals(interval_index, function, method, date_type):
+    ia = make_ia_from_tuples(interval_index, [(0, 4), (5, 5), (6, 8)], "right")
+    ia = map_to_dates(ia, date_type)
+    if function in (piso.issuperset, piso.issubset):
+        args = (ia, ia)
+    elif function is piso_intervalarray.bridge:
+        args = (ia, ia.length[0])
+    else:
+        args = (ia,)
+    with pytest.raises(ValueError, match="Zero lengths intervals"):
+        perform_op(*args, method=method, function=function)
+    perform_op(*args, method=method, function=function, validate=False)
+    with piso.option_context("validate", False):
+        perform_op(*args, method=method, function=function)
+        with pytest.raises(ValueError, match="Zero lengths intervals"):
+            perform_op(*args, method=method, function=function, validate=True)
+
+
+def test_validation_remembered_for_index():
+    ii = make_ia_from_tuples(True, [(0, 4), (5, 6)], "right")
+    piso.union(ii)
+    assert id(ii) in piso.util._validated_indexes
+    ia = make_ia_from_tuples(False, [(0, 4), (5, 6)], "right")
+    piso.union(ia)
+    assert id(ia) not in piso.util._validated_indexes
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        piso_intervalarray.union,
+        piso_intervalarray.intersection,
+        piso_intervalarray.symmetric_difference,
+    ],
+)
+@pytest.mark.parametrize(
+    "method",
+    ["supplied", "accessor", "package"],
+)
+@pytest.mark.parametrize(
+    "date_type",
+    ["timestamp", "timedelta", None],
+)
+def test_return_type_arrays(function, method, date_type):
+    ia = map_to_dates(make_ia1(True, "right"), date_type)
+    kwargs = {} if function is piso.union else {"min_overlaps": 2}
+    expected = perform_op(ia, method=method, function=function, **kwargs)
+    lefts, rights = perform_op(
+        ia,
+        method=method,
+        function=function,
+        squeeze=True,
+        return_type="arrays",
+        **kwargs,
+    )
+    assert isinstance(lefts, np.ndarray)
+    assert isinstance(rights, np.ndarray)
+    np.testing.assert_array_equal(lefts, expected.left.values)
+    np.testing.assert_array_equal(rights, expected.right.values)
+
+
+def test_return_type_arrays_timezone():
+    ia = pd.arrays.IntervalArray.from_arrays(
+        pd.DatetimeIndex(["2021-10-01", "2021-10-03"], tz="Australia/Sydney"),
+        pd.DatetimeIndex(["2021-10-02", "2021-10-05"], tz="Australia/Sydney"),
+    )
+    lefts, rights = piso.union(ia, return_type="arrays")
+    np.testing.assert_array_equal(
+        lefts, np.array(["2021-09-30T14", "2021-10-02T14"], dtype="datetime64[ns]")
+    )
+    result = piso.union(ia)
+    assert result.dtype == ia.dtype
+    pd._testing.assert_interval_array_equal(result, ia)
+
+
+WEIGHTS = [1.5, 2, 1, 0.5, 3, 1]
+
+
+@pytest.mark.parametrize("interval_index", [True, False])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+@pytest.mark.parametrize(
+    "weights, expected_values",
+    [
+        (None, [1, 2, 3, 2, 1, 0, 1, 1, 0, 1]),
+        (WEIGHTS, [1.5, 3.5, 4.5, 3, 1, 0, 0.5, 3, 0, 1]),
+    ],
+)
+def test_depth(interval_index, closed, method, weights, expected_values):
+    ia = make_ia1(interval_index, closed)
+    breakpoints, values = perform_op(
+        ia, method=method, function=piso_intervalarray.depth, weights=weights
+    )
+    np.testing.assert_array_equal(breakpoints, [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12])
+    np.testing.assert_array_equal(values, expected_values)
+
+
+@pytest.mark.parametrize("interval_index", [True, False])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+@pytest.mark.parametrize(
+    "min_overlaps, expected_tuples",
+    [
+        (3, [(2, 5), (8, 9)]),
+        (4, [(3, 4)]),
+        ("all", []),
+    ],
+)
+def test_intersection_weighted(
+    interval_index, closed, method, min_overlaps, expected_tuples
+):
+    ia = make_ia1(interval_index, closed)
+    result = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.intersection,
+        min_overlaps=min_overlaps,
+        weights=WEIGHTS,
+    )
+    expected = pd.IntervalIndex.from_tuples(expected_tuples, closed=closed)
+    assert_interval_array_equal(result, expected, interval_index)
+
+
+@pytest.mark.parametrize("interval_index", [True, False])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+@pytest.mark.parametrize(
+    "domain, expected_sum",
+    [(None, 20.5), ((0, 4), 11), (pd.Interval(-4, 4), 11)],
+)
+@pytest.mark.parametrize("how", ["fraction", "sum"])
+def test_coverage_weighted(interval_index, closed, method, domain, expected_sum, how):
+    ia = make_ia1(interval_index, closed)
+    result = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.coverage,
+        domain=domain,
+        how=how,
+        weights=WEIGHTS,
+    )
+    length = {None: 12, (0, 4): 4}.get(domain, 8)
+    expected = expected_sum if how == "sum" else expected_sum / length
+    assert result == pytest.approx(expected)
+
+
+def test_coverage_weighted_bins():
+    ia = make_ia1(False, "right")
+    domain = pd.IntervalIndex.from_tuples([(0, 4), (7, 12)])
+    result = piso.coverage(ia, domain, bins=True, how="sum", weights=WEIGHTS)
+    np.testing.assert_allclose(result.values, [11, 5.5])
+
+
+def test_weights_invalid():
+    ia = make_ia1(False, "right")
+    with pytest.raises(ValueError):
+        piso.intersection(ia, weights=WEIGHTS[:-1])
+    with pytest.raises(ValueError):
+        piso.intersection(ia, ia, weights=WEIGHTS)
+    with pytest.raises(ValueError):
+        piso.intersection(ia, min_overlaps=0, weights=[1, -1, 1, 1, 1, 1])
+    with pytest.raises(ValueError):
+        piso.depth(ia, weights=["a"] * len(ia))
+
+
+@pytest.mark.parametrize(
+    "weights, expected",
+    [
+        (np.array([1, 2, 3], dtype=np.uint32), [(2, 5), (7, 8)]),
+        (np.array([1, 2, 3], dtype=np.uint64), [(2, 5), (7, 8)]),
+        (np.array([True, True, False]), [(2, 4)]),
+        (np.array([2, 1, 3], dtype=np.int8), [(0, 4), (7, 8)]),
+    ],
+)
+def test_intersection_weights_dtypes(weights, expected):
+    ia = pd.arrays.IntervalArray.from_tuples([(0, 4), (2, 5), (7, 8)])
+    result = piso.intersection(ia, min_overlaps=2, weights=weights)
+    assert result.to_tuples().tolist() == expected
+    thresholds = piso.intersection(ia, min_overlaps=[2], weights=weights)
+    assert thresholds[2].to_tuples().tolist() == expected
+    _, values = piso.depth(ia, weights=weights)
+    assert (values >= 0).all()
+
+
+@pytest.mark.parametrize("interval_index", [True, False])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+@pytest.mark.parametrize(
+    "domain, compress, expected_breakpoints, expected_values",
+    [
+        (
+            None,
+            True,
+            [0, 2, 3, 4, 5, 6, 7, 9, 10, 12],
+            [1, 2, 3, 2, 1, 0, 1, 0, 1],
+        ),
+        ((3.5, 7.5), False, [3.5, 4, 5, 6, 7, 7.5], [3, 2, 1, 0, 1]),
+        (pd.Interval(-2, 1), False, [-2, 0, 1], [0, 1]),
+        ((7, 14), True, [7, 9, 10, 12, 14], [1, 0, 1, 0]),
+        ((13, 14), False, [13, 14], [0]),
+    ],
+)
+def test_depth_domain_compress(
+    interval_index,
+    closed,
+    method,
+    domain,
+    compress,
+    expected_breakpoints,
+    expected_values,
+):
+    ia = make_ia1(interval_index, closed)
+    breakpoints, values = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.depth,
+        domain=domain,
+        compress=compress,
+    )
+    np.testing.assert_array_equal(breakpoints, expected_breakpoints)
+    np.testing.assert_array_equal(values, expected_values)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+def test_depth_series(closed, method):
+    ia = make_ia1(False, closed)
+    result = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.depth,
+        compress=True,
+        return_type=pd.Series,
+    )
+    expected = pd.Series(
+        [1, 2, 3, 2, 1, 0, 1, 0, 1],
+        index=pd.IntervalIndex.from_breaks(
+            [0, 2, 3, 4, 5, 6, 7, 9, 10, 12], closed=closed
+        ),
+    )
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_depth_series_timezone():
+    ia = pd.IntervalIndex.from_breaks(
+        pd.date_range("2021", periods=3, freq="D", tz="Australia/Sydney")
+    )
+    result = piso.depth(ia, return_type=pd.Series)
+    assert result.index.equals(ia)
+    assert list(result) == [1, 1]
+
+
+def test_depth_domain_invalid():
+    with pytest.raises(ValueError):
+        piso.depth(make_ia1(False, "left"), domain=(4, 3))
+
+
+@pytest.mark.parametrize("interval_index", [True, False])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("method", ["supplied", "accessor", "package"])
+@pytest.mark.parametrize("weights", [None, WEIGHTS])
+def test_intersection_thresholds(interval_index, closed, method, weights):
+    ia = make_ia1(interval_index, closed)
+    thresholds = [1, 2, 3, 4, "all"]
+    result = perform_op(
+        ia,
+        method=method,
+        function=piso_intervalarray.intersection,
+        min_overlaps=thresholds,
+        weights=weights,
+    )
+    assert list(result) == thresholds
+    for min_overlaps in thresholds:
+        expected = piso.intersection(ia, min_overlaps=min_overlaps, weights=weights)
+        assert_interval_array_equal(result[min_overlaps], expected, interval_index)
+
+
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_intersection_thresholds_squeeze(closed):
+    ia = make_ia1(True, closed)
+    result = piso.intersection(ia, min_overlaps=[2, 3], squeeze=True)
+    assert result[2] == pd.Interval(2, 5, closed=closed)
+    assert result[3] == pd.Interval(3, 4, closed=closed)